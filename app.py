@@ -88,16 +88,8 @@ def main() -> None:
                     config.logging,
                     'max_files',
                     5))
-        # Setup event loop and signal handlers
-        loop = asyncio.get_event_loop()
-        setup_signal_handlers(loop, business_logic_manager)
-        # Run bootstrap
-        print("Starting Watch Tower...")
-        loop.run_until_complete(bootstrap())
-        print("Bootstrap completed successfully")
-        # Start event loop
-        print("Starting event loop...")
-        loop.run_until_complete(_run_main_application_loop())
+        # Run bootstrap and the application on a single event loop
+        asyncio.run(_run_application())
     except KeyboardInterrupt:
         print("\nReceived keyboard interrupt, shutting down...")
     except Exception as e:
@@ -105,30 +97,28 @@ def main() -> None:
         sys.exit(1)
 
 
+async def _run_application() -> None:
+    """Bootstrap the application and run it until the management server exits."""
+    setup_signal_handlers(asyncio.get_running_loop(), business_logic_manager)
+    print("Starting Watch Tower...")
+    await bootstrap()
+    print("Bootstrap completed successfully")
+    print("Starting event loop...")
+    await _run_main_application_loop()
+
+
 async def _run_main_application_loop() -> None:
     """Run the main application loop with management server and business logic management."""
+    management_server_task = asyncio.create_task(start_management_server())
     try:
-        # Start the management server
-        management_server_task = asyncio.create_task(start_management_server())
         print(
             f"""Management API server started on http://{config.management.host}:
             {config.management.port}""")
 
-        # Start the business logic loop
+        # Start the business logic loop; later starts and stops arrive through
+        # the management API, so there is nothing to poll for here
         await business_logic_manager.start()
-        while True:
-            if business_logic_manager.running:
-                await asyncio.sleep(1)
-            else:
-                # Idle loop: periodically check if the business logic loop should be
-                # restarted
-                await asyncio.sleep(2)
-                state = business_logic_manager.get_status()
-                if state.get("running", False) and not business_logic_manager.running:
-                    print(
-                        """[DEBUG] Detected running=True in state file,
-                        restarting business logic loop...""")
-                    await business_logic_manager.start()
+        await management_server_task
     except KeyboardInterrupt:
         print("Received keyboard interrupt, shutting down...")
     finally:
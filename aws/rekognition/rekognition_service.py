@@ -5,11 +5,14 @@ This module provides functionality for interacting with AWS Rekognition service,
 including face indexing, face search in videos, and collection management.
 """
 import asyncio
-from typing import Dict, Any, Tuple, List
-from urllib.parse import urlparse
+import functools
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple, List
 
 import boto3
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
 
 from aws.exceptions import AWSClientInitializationError, RekognitionError, RekognitionResourceNotFoundException
 from aws.s3.s3_service import S3_SERVICE
@@ -19,13 +22,75 @@ from utils.aws_client_factory import AWSClientFactory
 
 LOGGER = get_logger(__name__)
 
+# orjson decodes notification payloads several times faster when it is installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Constants
 JOB_STATUS_SUCCEEDED = 'SUCCEEDED'
 JOB_STATUS_FAILED = 'FAILED'
 
+# Longest wait between two GetFaceSearch status checks while polling
+MAX_POLLING_INTERVAL = 60
+
+# SQS long-poll duration for job completion notifications (the SQS maximum)
+SQS_WAIT_TIME_SECONDS = 20
+# How long a job waits for its notification before falling back to status polling
+NOTIFICATION_WAIT_TIMEOUT = 6 * SQS_WAIT_TIME_SECONDS
+
+# Concurrent IndexFaces calls per index_faces invocation
+INDEX_FACES_MAX_WORKERS = 8
+
+_INDEX_FACES_EXECUTOR = ThreadPoolExecutor(
+    max_workers=INDEX_FACES_MAX_WORKERS, thread_name_prefix='rekognition-index')
+
 # Module-level tracking of running face search jobs to prevent duplicates
 RUNNING_FACE_SEARCH_JOBS = set()
 
+# s3:// URLs plus virtual-hosted, path-style, dualstack and accelerated HTTP(S) endpoints
+_S3_URL_RE = re.compile(
+    r'^(?:'
+    r's3://(?P<s3_bucket>[^/]+)/(?P<s3_key>[^?#]+)'
+    r'|https?://(?P<host_bucket>[^/]+?)\.s3(?:[.-][^/]*)?\.amazonaws\.com(?::\d+)?/(?P<host_key>[^?#]+)'
+    r'|https?://s3(?:[.-][^/]*)?\.amazonaws\.com(?::\d+)?/(?P<path_bucket>[^/]+)/(?P<path_key>[^?#]+)'
+    r')(?:[?#].*)?$'
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_s3_url(url: str) -> Tuple[str, str]:
+    """Split an s3:// or HTTP(S) S3 URL into bucket and object key."""
+    match = _S3_URL_RE.match(url)
+    if match is None:
+        raise ValueError(f"Invalid S3 URL format: {url}")
+    groups = match.groupdict()
+    if groups['s3_bucket'] is not None:
+        return groups['s3_bucket'], groups['s3_key']
+    if groups['host_bucket'] is not None:
+        return groups['host_bucket'], groups['host_key']
+    return groups['path_bucket'], groups['path_key']
+
+
+def parse_s3_location(location: str) -> Tuple[str, str]:
+    """
+    Resolve a video location to an S3 bucket and object key.
+
+    Args:
+        location (str): An s3:// URL, an HTTP(S) S3 URL, or a bare object key
+            in the event recordings bucket.
+
+    Returns:
+        Tuple[str, str]: The bucket name and object key.
+
+    Raises:
+        ValueError: If the location is a URL that is not a valid S3 URL.
+    """
+    if location.startswith(('s3://', 'http://', 'https://')):
+        return _parse_s3_url(location)
+    return config.event_recordings_bucket, location
+
 
 class RekognitionService:  # pylint: disable=too-many-instance-attributes
     """
@@ -41,6 +106,13 @@ class RekognitionService:  # pylint: disable=too-many-instance-attributes
         """Initialize the Rekognition service with AWS credentials."""
         self._validate_environment_variables()
         self.client = RekognitionService._initialize_rekognition_client()
+        # Completion notifications are read from SQS when a queue subscribed to
+        # the SNS topic is configured; otherwise job status is polled
+        self.sqs_queue_url = config.rekognition_sqs_queue_url
+        self.sqs_client = AWSClientFactory.create_sqs_client() if self.sqs_queue_url else None
+        # Job ID -> future resolved by the dispatcher when its notification arrives
+        self._notification_waiters: Dict[str, 'asyncio.Future[None]'] = {}
+        self._notification_dispatcher: Optional['asyncio.Task[None]'] = None
 
     def _validate_environment_variables(self) -> None:
         """
@@ -84,7 +156,7 @@ class RekognitionService:  # pylint: disable=too-many-instance-attributes
         except Exception as e:
             LOGGER.error("Failed to initialize Rekognition client: %s", e)
             raise AWSClientInitializationError(
-                f"Error initializing Rekognition client: {e}")
+                f"Error initializing Rekognition client: {e}") from e
 
     def check_collection_exists(self, collection_id: str) -> None:
         """
@@ -99,24 +171,27 @@ class RekognitionService:  # pylint: disable=too-many-instance-attributes
         """
         try:
             self.client.describe_collection(CollectionId=collection_id)
-            LOGGER.info("Collection %d exists", collection_id)
+            LOGGER.info("Collection %s exists", collection_id)
         except ClientError as e:
             if e.response['Error']['Code'] == 'ResourceNotFoundException':
                 raise RekognitionResourceNotFoundException(
-                    f"Collection {collection_id} not found")
+                    f"Collection {collection_id} not found") from e
             raise RekognitionError(
-                f"Collection {collection_id} not found: {e}")
+                f"Collection {collection_id} not found: {e}") from e
 
-    def index_faces(self, person_id: str) -> str:
+    def index_faces(self, person_id: str) -> List[str]:
         """
         Index faces of one or more images for a specific person.
 
+        The images are indexed concurrently, bounded by INDEX_FACES_MAX_WORKERS.
+
         Args:
             person_id (str): The ID of the person to index faces for.
                 This id needs to match the file name prefix of the images in the S3 bucket.
 
         Returns:
-            str: The job ID of the face indexing job.
+            List[str]: The job IDs of the face indexing calls, in the order of
+                the matching files.
 
         Raises:
             ValueError: If no matching files are found or if face indexing fails.
@@ -131,26 +206,30 @@ class RekognitionService:  # pylint: disable=too-many-instance-attributes
 
         self.check_collection_exists(self.collection_id)
 
-        try:
-            returned_job_ids = []
-            for file_path in matching_s3_files:
-                response = self.client.index_faces(
-                    CollectionId=self.collection_id,
-                    ExternalImageId=person_id,
-                    Image={
-                        'S3Object': {
-                            'Bucket': self.bucket_name,
-                            'Name': file_path
-                        }
+        # Resolve the per-call constants once rather than on every file
+        index_faces = self.client.index_faces
+        collection_id = self.collection_id
+        bucket_name = self.bucket_name
+
+        def _index_file(file_path: str) -> str:
+            response = index_faces(
+                CollectionId=collection_id,
+                ExternalImageId=person_id,
+                Image={
+                    'S3Object': {
+                        'Bucket': bucket_name,
+                        'Name': file_path
                     }
-                )
-                returned_job_ids.append(response['JobId'])
-                LOGGER.info("Indexed faces for %s from %s", person_id, file_path)
+                }
+            )
+            LOGGER.info("Indexed faces for %s from %s", person_id, file_path)
+            return response['JobId']
+
+        try:
+            return list(_INDEX_FACES_EXECUTOR.map(_index_file, matching_s3_files))
         except ClientError as e:
             LOGGER.error("Error indexing faces: %s", e)
-            raise RekognitionError(f"Error indexing faces: {e}")
-
-        return response['JobId']
+            raise RekognitionError(f"Error indexing faces: {e}") from e
 
     async def start_face_search(
             self, source_video_path: str) -> Tuple[List[Dict[str, Any]], bool]:
@@ -175,59 +254,28 @@ class RekognitionService:  # pylint: disable=too-many-instance-attributes
             ClientError: If there's an AWS service error.
             ValueError: If the S3 URL format is invalid.
         """
-        # Check if a job is already running for this video
+        # Skip videos that already have a running job. The check and the add
+        # run without an intervening await, so no other coroutine can slip in
+        # between them.
         if source_video_path in RUNNING_FACE_SEARCH_JOBS:
             LOGGER.warning(
                 "Face search job already running for video: %s", source_video_path)
             return [], True  # Return empty list and flag indicating job was skipped
 
+        RUNNING_FACE_SEARCH_JOBS.add(source_video_path)
+        try:
+            face_search_results = await self._run_face_search(source_video_path)
+
+            # Return results and flag indicating job was executed
+            return face_search_results, False
+        finally:
+            # Always remove from running jobs set
+            RUNNING_FACE_SEARCH_JOBS.discard(source_video_path)
+
+    async def _run_face_search(self, source_video_path: str) -> List[Dict[str, Any]]:
+        """Start a face search job on a video and wait for its results."""
         try:
-            # Add to running jobs set
-            RUNNING_FACE_SEARCH_JOBS.add(source_video_path)
-
-            # Parse the S3 URL to extract bucket and object key
-            if source_video_path.startswith('s3://'):
-                # Extract bucket and key from s3:// URL
-                path_without_protocol = source_video_path[5:]  # Remove 's3://'
-                parts = path_without_protocol.split('/', 1)
-                if len(parts) >= 2:
-                    bucket_name = parts[0]
-                    object_key = parts[1]
-                else:
-                    raise ValueError(
-                        f"Invalid S3 URL format: {source_video_path}")
-            elif source_video_path.startswith('http'):
-                # Extract bucket and key from S3 URL
-                parsed_url = urlparse(source_video_path)
-                hostname = parsed_url.hostname or ''
-
-                # Check if it's virtual-hosted-style URL (bucket in hostname)
-                # Patterns: bucket.s3.region.amazonaws.com or bucket.s3.amazonaws.com
-                if '.s3.' in hostname or hostname.endswith('.s3.amazonaws.com'):
-                    # Virtual-hosted-style: https://bucket.s3.region.amazonaws.com/key
-                    # Extract bucket from hostname (everything before .s3.)
-                    if '.s3.' in hostname:
-                        bucket_name = hostname.split('.s3.')[0]
-                    else:
-                        bucket_name = hostname.replace('.s3.amazonaws.com', '')
-                    # Object key is the entire path (without leading slash)
-                    object_key = parsed_url.path.lstrip('/')
-                    if not object_key:
-                        raise ValueError(
-                            f"Invalid S3 URL format: missing object key in {source_video_path}")
-                else:
-                    # Path-style: https://s3.region.amazonaws.com/bucket/key
-                    path_parts = parsed_url.path.lstrip('/').split('/', 1)
-                    if len(path_parts) >= 2:
-                        bucket_name = path_parts[0]
-                        object_key = path_parts[1]
-                    else:
-                        raise ValueError(
-                            f"Invalid S3 URL format: {source_video_path}")
-            else:
-                # Assume it's just an object key, use the video recordings bucket
-                bucket_name = config.event_recordings_bucket
-                object_key = source_video_path
+            bucket_name, object_key = parse_s3_location(source_video_path)
 
             LOGGER.info(
                 "Starting face search for bucket: %s, object: %s", bucket_name, object_key)
@@ -248,16 +296,10 @@ class RekognitionService:  # pylint: disable=too-many-instance-attributes
             LOGGER.info(
                 "Started face search job %s for video %s", response['JobId'], source_video_path
             )
-            face_search_results = await self.get_face_search_results(response['JobId'])
-
-            # Return results and flag indicating job was executed
-            return face_search_results, False
+            return await self.get_face_search_results(response['JobId'])
         except ClientError as e:
             LOGGER.error("Error starting face search: %s", e)
-            raise RekognitionError(f"Error starting face search: {e}")
-        finally:
-            # Always remove from running jobs set
-            RUNNING_FACE_SEARCH_JOBS.discard(source_video_path)
+            raise RekognitionError(f"Error starting face search: {e}") from e
 
     async def get_face_search_results(self, job_id: str) -> List[Dict[str, Any]]:
         """
@@ -277,50 +319,191 @@ class RekognitionService:  # pylint: disable=too-many-instance-attributes
             ClientError: If there's an AWS service error.
             TimeoutError: If the job takes too long to complete.
         """
-        polling_interval: int = config.video.polling_interval
-        while True:
-            try:
-                result = self.client.get_face_search(JobId=job_id)
-                LOGGER.info("Job %s status: %s", job_id, result['JobStatus'])
-
-                if result['JobStatus'] in [JOB_STATUS_SUCCEEDED, JOB_STATUS_FAILED]:
-                    break
-
-                LOGGER.info("Waiting for job %s to complete...", job_id)
-                await asyncio.sleep(polling_interval)
-
-            except ClientError as e:
-                raise RekognitionError(
-                    f"Error getting face search results for job {job_id}: {e}")
-
-        matches: List[Dict[str, Any]] = []
-        if result['JobStatus'] == JOB_STATUS_SUCCEEDED:
-            LOGGER.info("Face search job %s succeeded", job_id)
-
-            for person in result.get('Persons', []):
-                timestamp = person.get('Timestamp', 0)
-                if 'FaceMatches' in person:
-                    for match in person['FaceMatches']:
-                        face = match['Face']
-                        external_image_id = face.get(
-                            'ExternalImageId', 'Unknown')
-                        face_id = face.get('FaceId', 'Unknown')
-                        # Convert percentage to decimal
-                        confidence = match.get('Similarity', 0.0) / 100.0
-
-                        matches.append({
-                            'external_image_id': external_image_id,
-                            'face_id': face_id,
-                            'confidence': confidence,
-                            'timestamp': timestamp
-                        })
-        else:
+        result = await self._wait_for_face_search(job_id)
+
+        if result['JobStatus'] != JOB_STATUS_SUCCEEDED:
             LOGGER.error("Full failure response: %s", result)
             raise RekognitionError(
                 f"Face search job {job_id} failed with status: {result['JobStatus']}")
 
+        LOGGER.info("Face search job %s succeeded", job_id)
+
+        # Results are paginated; follow NextToken until every page is read
+        matches = _face_matches(result)
+        next_token = result.get('NextToken')
+        while next_token:
+            page = await self._get_face_search(job_id, next_token)
+            matches.extend(_face_matches(page))
+            next_token = page.get('NextToken')
+
         return matches
 
+    async def _wait_for_face_search(self, job_id: str) -> Dict[str, Any]:
+        """
+        Wait for a face search job to finish.
+
+        When an SQS queue is configured the completion notification is awaited
+        with long polling before the job status is read. Otherwise, or if the
+        job is still running after the notification, the status is polled with
+        an interval that doubles up to MAX_POLLING_INTERVAL.
+
+        Args:
+            job_id (str): The ID of the face search job.
+
+        Returns:
+            Dict[str, Any]: The GetFaceSearch response for the finished job.
+
+        Raises:
+            RekognitionError: If there's an AWS service error.
+        """
+        if self.sqs_client is not None:
+            await self._wait_for_completion_notification(job_id)
+
+        polling_interval = config.video.polling_interval
+        while True:
+            result = await self._get_face_search(job_id)
+            LOGGER.info("Job %s status: %s", job_id, result['JobStatus'])
+
+            if result['JobStatus'] in [JOB_STATUS_SUCCEEDED, JOB_STATUS_FAILED]:
+                return result
+
+            LOGGER.info("Waiting for job %s to complete...", job_id)
+            await asyncio.sleep(polling_interval)
+            polling_interval = min(polling_interval * 2, MAX_POLLING_INTERVAL)
+
+    async def _get_face_search(
+            self, job_id: str, next_token: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Call GetFaceSearch on the default executor so the event loop is not blocked.
+
+        Args:
+            job_id (str): The ID of the face search job.
+            next_token (Optional[str]): The pagination token of the results page to read.
+
+        Returns:
+            Dict[str, Any]: The GetFaceSearch response.
+
+        Raises:
+            RekognitionError: If there's an AWS service error.
+        """
+        kwargs = {'JobId': job_id}
+        if next_token:
+            kwargs['NextToken'] = next_token
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                None, functools.partial(self.client.get_face_search, **kwargs))
+        except ClientError as e:
+            raise RekognitionError(
+                f"Error getting face search results for job {job_id}: {e}") from e
+
+    async def _wait_for_completion_notification(self, job_id: str) -> None:
+        """
+        Wait up to NOTIFICATION_WAIT_TIMEOUT seconds for the completion notification of a job.
+
+        A single dispatcher task reads the SQS queue for every waiting job. SQS
+        errors and timeouts end the wait so the caller falls back to polling.
+
+        Args:
+            job_id (str): The ID of the face search job.
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self._notification_waiters[job_id] = waiter
+        if self._notification_dispatcher is None or self._notification_dispatcher.done():
+            self._notification_dispatcher = asyncio.ensure_future(self._dispatch_notifications())
+        try:
+            await asyncio.wait_for(waiter, NOTIFICATION_WAIT_TIMEOUT)
+            LOGGER.info("Received completion notification for job %s", job_id)
+        except asyncio.TimeoutError:
+            LOGGER.warning(
+                "No completion notification for job %s after %d seconds, polling instead",
+                job_id, NOTIFICATION_WAIT_TIMEOUT)
+        except (ClientError, BotoCoreError) as e:
+            LOGGER.warning(
+                "Error reading notifications for job %s, polling instead: %s", job_id, e)
+        finally:
+            self._notification_waiters.pop(job_id, None)
+
+    async def _dispatch_notifications(self) -> None:
+        """
+        Long-poll the SQS queue while any job is waiting, resolving waiters as notifications arrive.
+
+        Notifications for jobs this process waits on are deleted once their
+        waiter is resolved. Any other message is left untouched so it becomes
+        visible again for its own consumer, or moves to the dead-letter queue.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            while self._notification_waiters:
+                response = await loop.run_in_executor(None, functools.partial(
+                    self.sqs_client.receive_message,
+                    QueueUrl=self.sqs_queue_url,
+                    WaitTimeSeconds=SQS_WAIT_TIME_SECONDS,
+                    MaxNumberOfMessages=10))
+                for message in response.get('Messages', []):
+                    waiter = self._notification_waiters.pop(
+                        _get_notification_job_id(message), None)
+                    if waiter is None:
+                        continue
+                    if not waiter.done():
+                        waiter.set_result(None)
+                    try:
+                        await loop.run_in_executor(None, functools.partial(
+                            self.sqs_client.delete_message,
+                            QueueUrl=self.sqs_queue_url,
+                            ReceiptHandle=message['ReceiptHandle']))
+                    except (ClientError, BotoCoreError) as e:
+                        # The job is already resolved; the message is redelivered and ignored
+                        LOGGER.warning("Error deleting notification message: %s", e)
+        except (ClientError, BotoCoreError) as e:
+            for waiter in self._notification_waiters.values():
+                if not waiter.done():
+                    waiter.set_exception(e)
+
+
+def _face_matches(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Flatten the persons in a GetFaceSearch response into face match details.
+
+    Args:
+        response (Dict[str, Any]): A GetFaceSearch response page.
+
+    Returns:
+        List[Dict[str, Any]]: One entry per face match, with the similarity
+            converted from a percentage to a decimal confidence.
+    """
+    return [
+        {
+            'external_image_id': face.get('ExternalImageId', 'Unknown'),
+            'face_id': face.get('FaceId', 'Unknown'),
+            'confidence': match.get('Similarity', 0.0) / 100.0,
+            'timestamp': person.get('Timestamp', 0)
+        }
+        for person in response.get('Persons', ())
+        for match in person.get('FaceMatches', ())
+        for face in (match['Face'],)
+    ]
+
+
+def _get_notification_job_id(message: Dict[str, Any]) -> Optional[str]:
+    """
+    Extract the job ID from a Rekognition completion notification delivered through SNS.
+
+    Args:
+        message (Dict[str, Any]): The SQS message.
+
+    Returns:
+        Optional[str]: The job ID, or None if the message is not a job notification.
+    """
+    try:
+        body = _json_loads(message['Body'])
+        # SNS wraps the notification in an envelope unless raw delivery is enabled
+        if 'Message' in body:
+            body = _json_loads(body['Message'])
+        return body.get('JobId')
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+
 
 # Create a singleton instance
 REKOGNITION_SERVICE = RekognitionService()
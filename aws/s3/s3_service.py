@@ -4,11 +4,15 @@ AWS S3 Service
 This module provides functionality for interacting with AWS S3 service,
 including file uploads, downloads, bucket operations, and object listing.
 """
+import asyncio
+import functools
 import os
-from typing import List
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import boto3
 import botocore
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
 from aws.exceptions import AWSCredentialsError, AWSClientInitializationError, S3Error, S3ResourceNotFoundException
@@ -20,6 +24,45 @@ from utils.metric_helpers import inc_counter_metric
 
 LOGGER = get_logger(__name__)
 
+# Bound on concurrent transfers, matching the client connection pool size
+MAX_CONCURRENT_TRANSFERS = config.aws_client.max_pool_connections
+
+# Multipart settings for streamed uploads; only one part is buffered per thread
+STREAM_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    use_threads=True
+)
+
+# Error codes S3 returns for a missing bucket (HEAD requests carry no error body)
+BUCKET_NOT_FOUND_ERROR_CODES = ('404', 'NoSuchBucket')
+
+# Sidecar file suffix recording the ETag of a downloaded object
+ETAG_SUFFIX = '.etag'
+
+
+def _local_copy_matches(local_path: str, head: Dict[str, Any]) -> bool:
+    """Check whether a local file holds the object described by a HeadObject response."""
+    try:
+        if os.path.getsize(local_path) != head.get('ContentLength'):
+            return False
+        with open(local_path + ETAG_SUFFIX, encoding='utf-8') as etag_file:
+            return etag_file.read() == head.get('ETag')
+    except OSError:
+        return False
+
+
+def _write_etag(local_path: str, etag: Optional[str]) -> None:
+    """Record the ETag of a downloaded object next to the local file."""
+    if not etag:
+        return
+    try:
+        with open(local_path + ETAG_SUFFIX, 'w', encoding='utf-8') as etag_file:
+            etag_file.write(etag)
+    except OSError as e:
+        # Only costs a re-download next time
+        LOGGER.warning("Could not record ETag for %s: %s", local_path, e)
+
 
 class S3Service:
     """
@@ -114,27 +157,42 @@ class S3Service:
             S3ResourceNotFoundException: If the bucket doesn't exist.
             ClientError: If there's an AWS service error.
         """
-        self.check_bucket_exists(bucket_name)
+        file_paths = list(self.iter_files_with_prefix(bucket_name, prefix))
+        LOGGER.info(
+            "Found %d files with prefix %s in bucket %s", len(file_paths), prefix, bucket_name)
+        return file_paths
+
+    def iter_files_with_prefix(self, bucket_name: str, prefix: str) -> Iterator[str]:
+        """
+        Iterate over the files in the S3 bucket that match the prefix.
 
+        Listing is paginated, so prefixes with more than 1000 objects are not
+        truncated, and pages are only requested as the caller iterates.
+
+        Args:
+            bucket_name (str): The name of the S3 bucket to search in.
+            prefix (str): The prefix of the files to search for.
+
+        Yields:
+            str: The S3 URL of each file that matches the prefix.
+
+        Raises:
+            S3ResourceNotFoundException: If the bucket doesn't exist.
+            ClientError: If there's an AWS service error.
+        """
         try:
-            response = self.client.list_objects_v2(
+            # The Prefix filter is applied server-side
+            pages = self.client.get_paginator('list_objects_v2').paginate(
                 Bucket=bucket_name,
                 Prefix=prefix
             )
-
-            file_paths = [
-                f"s3://{bucket_name}/{obj['Key']}"
-                for obj in response.get('Contents', [])
-                if obj['Key'].startswith(prefix)
-            ]
-
-            LOGGER.info(
-                "Found %d files with prefix %s in bucket %s", len(file_paths), prefix, bucket_name)
-            return file_paths
+            for page in pages:
+                for obj in page.get('Contents', ()):
+                    yield f"s3://{bucket_name}/{obj['Key']}"
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
-            if error_code == '404':
+            if error_code in BUCKET_NOT_FOUND_ERROR_CODES:
                 LOGGER.error("Bucket %s not found", bucket_name)
                 raise S3ResourceNotFoundException(
                     f"Bucket {bucket_name} not found")
@@ -146,19 +204,29 @@ class S3Service:
         """
         Download a file from S3 to a local path.
 
+        The download is skipped when the local file already matches the
+        object's size and the ETag recorded by a previous download.
+
         Args:
             bucket_name (str): The name of the S3 bucket.
             object_key (str): The key (path) of the object in S3.
             local_path (str): The local path where the file should be saved.
 
         Raises:
-            S3ResourceNotFoundException: If the bucket or object doesn't exist.
-            S3Error: If there's an AWS service error.
+            S3Error: If the bucket or object doesn't exist, or there's an AWS service error.
             OSError: If there's a filesystem error.
         """
         success = False
+        skipped = False
         try:
-            self.check_bucket_exists(bucket_name)
+            # Skip the transfer when the local copy is already current
+            head = self.client.head_object(Bucket=bucket_name, Key=object_key)
+            if _local_copy_matches(local_path, head):
+                skipped = True
+                LOGGER.info(
+                    "Local copy %s of s3://%s/%s is current, skipping download",
+                    local_path, bucket_name, object_key)
+                return
 
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(local_path), exist_ok=True)
@@ -168,13 +236,14 @@ class S3Service:
             success = True
             LOGGER.info(
                 "Successfully downloaded s3://%s/%s to %s", bucket_name, object_key, local_path)
+            _write_etag(local_path, head.get('ETag'))
 
         except OSError as e:
             LOGGER.error(
                 "Filesystem error downloading file from s3://%s/%s to %s: %s",
                 bucket_name, object_key, local_path, e)
             raise
-        except (S3ResourceNotFoundException, ClientError) as e:
+        except ClientError as e:
             LOGGER.warning(
                 "Bucket %s does not exist or error downloading file from s3://%s/%s: %s",
                 bucket_name, bucket_name, object_key, e)
@@ -182,7 +251,9 @@ class S3Service:
                 f"Bucket {bucket_name} does not exist or error downloading file "
                 f"from s3://{bucket_name}/{object_key}: {e}") from e
         finally:
-            if success:
+            if skipped:
+                inc_counter_metric(MetricDataPointName.AWS_S3_DOWNLOAD_FILE_SKIPPED_COUNT)
+            elif success:
                 inc_counter_metric(MetricDataPointName.AWS_S3_DOWNLOAD_FILE_SUCCESS_COUNT)
             else:
                 inc_counter_metric(MetricDataPointName.AWS_S3_DOWNLOAD_FILE_ERROR_COUNT)
@@ -197,8 +268,7 @@ class S3Service:
             object_key (str): The key (path) for the object in S3.
 
         Raises:
-            S3ResourceNotFoundException: If the bucket doesn't exist.
-            S3Error: If there's an AWS service error.
+            S3Error: If the bucket doesn't exist, or there's an AWS service error.
             FileNotFoundError: If the local file does not exist.
             OSError: If there's a filesystem error.
         """
@@ -207,7 +277,6 @@ class S3Service:
             if not os.path.isfile(local_path):
                 raise FileNotFoundError(f"Local file {local_path} does not exist.")
 
-            self.check_bucket_exists(bucket_name)
             self.client.upload_file(local_path, bucket_name, object_key)
             success = True
             LOGGER.info(
@@ -216,7 +285,7 @@ class S3Service:
         except FileNotFoundError as e:
             LOGGER.warning("Local file %s does not exist.", local_path)
             raise
-        except (S3ResourceNotFoundException, ClientError) as e:
+        except (ClientError, S3UploadFailedError) as e:
             LOGGER.warning(
                 "Bucket %s does not exist or error uploading file %s to s3://%s/%s: %s",
                 bucket_name, local_path, bucket_name, object_key, e)
@@ -229,5 +298,97 @@ class S3Service:
             else:
                 inc_counter_metric(MetricDataPointName.AWS_S3_UPLOAD_FILE_ERROR_COUNT)
 
+    def upload_stream(self, fileobj: BinaryIO, bucket_name: str, object_key: str) -> None:
+        """
+        Upload a readable binary stream to S3.
+
+        The stream is read once, in multipart chunks, so nothing is staged on
+        local disk.
+
+        Args:
+            fileobj (BinaryIO): The stream to upload, e.g. an HTTP response body.
+            bucket_name (str): The name of the S3 bucket.
+            object_key (str): The key (path) for the object in S3.
+
+        Raises:
+            S3Error: If there's an AWS service error.
+        """
+        success = False
+        try:
+            self.client.upload_fileobj(
+                fileobj, bucket_name, object_key, Config=STREAM_TRANSFER_CONFIG)
+            success = True
+            LOGGER.info("Successfully streamed upload to s3://%s/%s", bucket_name, object_key)
+
+        except (ClientError, S3UploadFailedError) as e:
+            LOGGER.warning(
+                "Bucket %s does not exist or error streaming upload to s3://%s/%s: %s",
+                bucket_name, bucket_name, object_key, e)
+            raise S3Error(
+                f"Bucket {bucket_name} does not exist or error streaming upload "
+                f"to s3://{bucket_name}/{object_key}: {e}") from e
+        finally:
+            if success:
+                inc_counter_metric(MetricDataPointName.AWS_S3_UPLOAD_FILE_SUCCESS_COUNT)
+            else:
+                inc_counter_metric(MetricDataPointName.AWS_S3_UPLOAD_FILE_ERROR_COUNT)
+
+    async def adownload_file(self, bucket_name: str, object_key: str, local_path: str) -> None:
+        """
+        Download a file from S3 without blocking the event loop.
+
+        The transfer runs on the default executor; see download_file for
+        arguments and exceptions.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, functools.partial(self.download_file, bucket_name, object_key, local_path))
+
+    async def aupload_file(self, local_path: str, bucket_name: str, object_key: str) -> None:
+        """
+        Upload a file to S3 without blocking the event loop.
+
+        The transfer runs on the default executor; see upload_file for
+        arguments and exceptions.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, functools.partial(self.upload_file, local_path, bucket_name, object_key))
+
+    async def aupload_stream(self, fileobj: BinaryIO, bucket_name: str, object_key: str) -> None:
+        """
+        Upload a binary stream to S3 without blocking the event loop.
+
+        The transfer runs on the default executor; see upload_stream for
+        arguments and exceptions.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, functools.partial(self.upload_stream, fileobj, bucket_name, object_key))
+
+    async def download_many(self, transfers: Iterable[Tuple[str, str, str]]) -> None:
+        """
+        Download several files from S3 concurrently.
+
+        Args:
+            transfers (Iterable[Tuple[str, str, str]]): (bucket_name, object_key,
+                local_path) tuples to download.
+
+        Raises:
+            S3Error: If any download fails. The remaining downloads still run
+                to completion before the first error is raised.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRANSFERS)
+
+        async def _download(bucket_name: str, object_key: str, local_path: str) -> None:
+            async with semaphore:
+                await self.adownload_file(bucket_name, object_key, local_path)
+
+        results = await asyncio.gather(
+            *(_download(*transfer) for transfer in transfers), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
 # Create a singleton instance
 S3_SERVICE = S3Service()
@@ -5,6 +5,10 @@ This module provides functionality for retrieving secrets from AWS Secrets Manag
 specifically for database credentials and other sensitive configuration data.
 """
 import json
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
@@ -12,14 +16,120 @@ from botocore.exceptions import ClientError, NoCredentialsError
 from aws.exceptions import AWSCredentialsError, SecretsManagerError
 from watch_tower.config import config
 from utils.logging_config import get_logger
+from utils.aws_client_factory import AWSClientFactory
 
 LOGGER = get_logger(__name__)
 
+# orjson decodes secret payloads several times faster when it is installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Secret name -> (monotonic fetch time, secret data)
+_SECRET_CACHE: Dict[str, Tuple[float, dict]] = {}
+_SECRET_CACHE_LOCK = threading.Lock()
+
+# BatchGetSecretValue accepts at most 20 secret IDs per request
+BATCH_GET_SECRET_LIMIT = 20
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> boto3.client:
+    """
+    Get the Secrets Manager client, creating it on first use.
+
+    Returns:
+        boto3.client: Secrets Manager client shared by all lookups
+    """
+    return AWSClientFactory.create_secrets_manager_client()
+
 
 def get_db_secret(secret_name: str) -> dict:
     """
     Retrieve credentials from AWS Secrets Manager.
 
+    Secrets are cached for config.secrets_cache_ttl seconds; use
+    invalidate_db_secret() to force the next lookup to go to AWS.
+
+    Args:
+        secret_name (str): The name of the secret to retrieve.
+
+    Returns:
+        dict: Secret data
+
+    Raises:
+        AWSCredentialsError: If AWS credentials are missing or invalid
+        SecretsManagerError: If there are issues retrieving the secret from AWS Secrets Manager
+    """
+    with _SECRET_CACHE_LOCK:
+        cached = _SECRET_CACHE.get(secret_name)
+    if cached is not None and time.monotonic() - cached[0] < config.secrets_cache_ttl:
+        return dict(cached[1])
+
+    secret = _fetch_secret(secret_name)
+    with _SECRET_CACHE_LOCK:
+        _SECRET_CACHE[secret_name] = (time.monotonic(), secret)
+    return dict(secret)
+
+
+def get_db_secrets(secret_names: Iterable[str]) -> Dict[str, dict]:
+    """
+    Retrieve several secrets from AWS Secrets Manager in as few round-trips as possible.
+
+    Secrets still in the cache are served from it; the rest are fetched with
+    BatchGetSecretValue and cached like get_db_secret() results. If the
+    caller's IAM policy does not allow the batch API, each secret is fetched
+    with GetSecretValue instead.
+
+    Args:
+        secret_names (Iterable[str]): The names of the secrets to retrieve.
+
+    Returns:
+        Dict[str, dict]: Secret data keyed by secret name
+
+    Raises:
+        AWSCredentialsError: If AWS credentials are missing or invalid
+        SecretsManagerError: If there are issues retrieving any of the secrets
+    """
+    secrets: Dict[str, dict] = {}
+    missing: List[str] = []
+    now = time.monotonic()
+    with _SECRET_CACHE_LOCK:
+        for secret_name in dict.fromkeys(secret_names):
+            cached = _SECRET_CACHE.get(secret_name)
+            if cached is not None and now - cached[0] < config.secrets_cache_ttl:
+                secrets[secret_name] = dict(cached[1])
+            else:
+                missing.append(secret_name)
+
+    for start in range(0, len(missing), BATCH_GET_SECRET_LIMIT):
+        fetched = _fetch_secrets(missing[start:start + BATCH_GET_SECRET_LIMIT])
+        with _SECRET_CACHE_LOCK:
+            for secret_name, secret in fetched.items():
+                _SECRET_CACHE[secret_name] = (time.monotonic(), secret)
+        secrets.update((name, dict(secret)) for name, secret in fetched.items())
+    return secrets
+
+
+def invalidate_db_secret(secret_name: Optional[str] = None) -> None:
+    """
+    Drop cached secrets so the next lookup fetches them from AWS.
+
+    Args:
+        secret_name (Optional[str]): The secret to drop. Drops all secrets if None.
+    """
+    with _SECRET_CACHE_LOCK:
+        if secret_name is None:
+            _SECRET_CACHE.clear()
+        else:
+            _SECRET_CACHE.pop(secret_name, None)
+
+
+def _fetch_secret(secret_name: str) -> dict:
+    """
+    Fetch and parse a secret from AWS Secrets Manager.
+
     Args:
         secret_name (str): The name of the secret to retrieve.
 
@@ -33,18 +143,9 @@ def get_db_secret(secret_name: str) -> dict:
     config.validate_aws_only()
 
     try:
-        # Create AWS session and client
-        session = boto3.Session()
-        client = session.client(
-            service_name='secretsmanager',
-            region_name=config.aws_region,
-            aws_access_key_id=config.aws_access_key_id,
-            aws_secret_access_key=config.aws_secret_access_key
-        )
-
         # Get secret value
-        response = client.get_secret_value(SecretId=secret_name)
-        return json.loads(response['SecretString'])
+        response = _get_client().get_secret_value(SecretId=secret_name)
+        return _json_loads(response['SecretString'])
     except NoCredentialsError as e:
         LOGGER.error("No AWS credentials found while creating Secrets Manager client: %s", e)
         raise AWSCredentialsError(
@@ -59,3 +160,63 @@ def get_db_secret(secret_name: str) -> dict:
         raise SecretsManagerError(
             f"Failed to parse secret JSON: {str(e)}"
         ) from e
+
+
+def _fetch_secrets(secret_names: List[str]) -> Dict[str, dict]:
+    """
+    Fetch and parse up to BATCH_GET_SECRET_LIMIT secrets in one request.
+
+    Args:
+        secret_names (List[str]): The names of the secrets to retrieve.
+
+    Returns:
+        Dict[str, dict]: Secret data keyed by secret name
+
+    Raises:
+        AWSCredentialsError: If AWS credentials are missing or invalid
+        SecretsManagerError: If there are issues retrieving any of the secrets
+    """
+    config.validate_aws_only()
+
+    try:
+        response = _get_client().batch_get_secret_value(SecretIdList=secret_names)
+    except NoCredentialsError as e:
+        LOGGER.error("No AWS credentials found while creating Secrets Manager client: %s", e)
+        raise AWSCredentialsError(
+            f"No AWS credentials found while creating Secrets Manager client: {e}")
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') != 'AccessDeniedException':
+            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+            error_message = e.response.get('Error', {}).get('Message', str(e))
+            raise SecretsManagerError(
+                f"AWS Secrets Manager Error: {error_code} Message: {error_message}"
+            ) from e
+        LOGGER.warning(
+            "BatchGetSecretValue not permitted, fetching %d secrets individually", len(secret_names))
+        return {secret_name: _fetch_secret(secret_name) for secret_name in secret_names}
+
+    errors = response.get('Errors')
+    if errors:
+        error = errors[0]
+        raise SecretsManagerError(
+            f"AWS Secrets Manager Error: {error.get('ErrorCode', 'Unknown')} "
+            f"Message: {error.get('Message', '')} Secret: {error.get('SecretId')}"
+        )
+
+    # Results come back keyed by the secret's name, which may differ from the
+    # requested ID when an ARN was given
+    by_name = {secret['Name']: secret for secret in response.get('SecretValues', [])}
+    by_arn = {secret['ARN']: secret for secret in by_name.values() if 'ARN' in secret}
+    secrets = {}
+    try:
+        for secret_name in secret_names:
+            secret = by_name.get(secret_name) or by_arn.get(secret_name)
+            if secret is None:
+                raise SecretsManagerError(
+                    f"AWS Secrets Manager Error: secret {secret_name} missing from batch response")
+            secrets[secret_name] = _json_loads(secret['SecretString'])
+    except json.JSONDecodeError as e:
+        raise SecretsManagerError(
+            f"Failed to parse secret JSON: {str(e)}"
+        ) from e
+    return secrets
@@ -4,6 +4,7 @@ Camera Base Module
 This module provides the base abstract class for all camera implementations,
 defining the interface that camera classes must implement.
 """
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from typing import Dict, Any, List
@@ -25,7 +26,18 @@ class CameraBase(ABC):
             motion_poll_interval: How often to poll for motion events in seconds
         """
         self.motion_poll_interval = motion_poll_interval
-        self.last_motion_video_retrieval: datetime = datetime.now(timezone.utc)
+        # Stored as epoch seconds; the datetime is only built when read
+        self.last_motion_video_retrieval_epoch: float = time.time()
+
+    @property
+    def last_motion_video_retrieval(self) -> datetime:
+        """Get the time of the last motion video retrieval (UTC)."""
+        return datetime.fromtimestamp(self.last_motion_video_retrieval_epoch, tz=timezone.utc)
+
+    @last_motion_video_retrieval.setter
+    def last_motion_video_retrieval(self, value: datetime) -> None:
+        """Set the time of the last motion video retrieval."""
+        self.last_motion_video_retrieval_epoch = value.timestamp()
 
     @property
     @abstractmethod
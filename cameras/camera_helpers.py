@@ -7,7 +7,9 @@ from typing import Any, Optional
 
 from ring_doorbell import Ring, RingDoorBell
 
+from connection_managers.ring_connection_manager import get_device_index
 from utils.logging_config import get_logger
+from watch_tower.config import config
 
 LOGGER = get_logger(__name__)
 
@@ -17,6 +19,9 @@ def find_device(
         device_name: str) -> Optional[Any]:
     """Find a Ring device by name.
 
+    Ring data is refreshed at most once per motion poll interval; lookups in
+    between are served from the device index.
+
     Args:
         connection_manager: The Ring connection manager
         device_name: Name of the device to find
@@ -24,27 +29,19 @@ def find_device(
     Returns:
         The device object if found, None otherwise
     """
-    # Access protected member to check and update Ring data
-    if connection_manager._ring is None:  # pylint: disable=protected-access
+    # Access protected member to check Ring data
+    ring = connection_manager._ring  # pylint: disable=protected-access
+    if ring is None:
         return None
 
-    connection_manager._ring.update_data()  # pylint: disable=protected-access
-    for device in connection_manager._ring.video_devices():  # pylint: disable=protected-access
-        if device.name == device_name:
-            return device
-    return None
+    return get_device_index(ring, config.ring.motion_poll_interval).by_name.get(device_name)
 
 
 async def get_video_device_object(ring: Ring,
                                   device_name: str) -> Optional[RingDoorBell]:
     """Get video device object from Ring."""
     try:
-        ring.update_data()
-        devices = ring.video_devices()
-        for device in devices:
-            if device.name == device_name:
-                return device
-        return None
+        return get_device_index(ring, config.ring.motion_poll_interval).by_name.get(device_name)
     except Exception as e:
         LOGGER.error("Failed to get video devices: %s", e)
         raise
@@ -66,15 +63,13 @@ def get_camera_name(self: Any, camera_id: str) -> Optional[str]:
         if self._ring is None:
             return None
 
-        self._ring.update_data()
-        cameras = self._ring.video_devices()
-        for camera in cameras:
-            if str(camera.id) == str(camera_id):
-                LOGGER.info("Found camera name: %s", camera.name)
-                return str(camera.name)  # Explicitly convert to str
-        LOGGER.warning("No camera found with ID %d", camera_id)
+        camera = get_device_index(
+            self._ring, config.ring.motion_poll_interval).by_id.get(str(camera_id))
+        if camera is not None:
+            LOGGER.info("Found camera name: %s", camera.name)
+            return str(camera.name)  # Explicitly convert to str
+        LOGGER.warning("No camera found with ID %s", camera_id)
         return None
     except Exception as e:
-        LOGGER.error("Error retrieving camera name: %s", e)
-        LOGGER.exception("Full traceback:")
+        LOGGER.exception("Error retrieving camera name: %s", e)
         return None
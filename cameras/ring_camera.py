@@ -4,14 +4,22 @@ Ring Camera Module
 This module provides the Ring camera implementation, handling motion event
 retrieval, video download, and S3 upload for Ring doorbell devices.
 """
+import asyncio
+import functools
 import os
+import shutil
+import subprocess
 import tempfile
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 from ring_doorbell import RingDoorBell
-from ring_doorbell import RingError
 
 from aws.s3.s3_service import S3_SERVICE
 from cameras.camera_base import CameraBase
@@ -21,9 +29,9 @@ from data_models.motion_event import MotionEvent
 from db.connection import get_database_connection
 from db.repositories.motion_event_repository import MotionEventRepository
 from utils.logging_config import get_logger
-from utils.video_converter import VIDEO_CONVERTER
+from utils.video_converter import FAST_PROBE_BYTES, VIDEO_CONVERTER, probe_codec_fast
 from watch_tower.config import config
-from watch_tower.exceptions import DatabaseEventNotFoundError, DatabaseMultipleEventsFoundError
+from watch_tower.exceptions import VideoConversionError
 from watch_tower.registry.connection_manager_registry import (
     REGISTRY as connection_manager_registry
 )
@@ -37,6 +45,30 @@ except ImportError:
 
 LOGGER = get_logger(__name__)
 
+# Parsed once rather than per event
+LA_TZ = ZoneInfo("America/Los_Angeles")
+
+# Keep-alive session for recording downloads, so each event does not pay for
+# a fresh TCP + TLS handshake with the Ring CDN
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=16))
+
+# (connect, read) timeout for recording downloads
+HTTP_TIMEOUT = (5, 60)
+
+# Copy buffer for downloading recordings to disk
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+
+# Repositories are stateless, so one instance serves every upload
+MOTION_EVENT_REPOSITORY = MotionEventRepository()
+
+# Ring history page size, and the most pages read back per poll
+HISTORY_PAGE_SIZE = 5
+MAX_HISTORY_PAGES = 10
+
+# Recording URLs kept per camera; upload retries reuse them within a poll interval
+RECORDING_URL_CACHE_SIZE = 64
+
 
 class RingCamera(CameraBase):
     """Ring camera implementation."""
@@ -51,6 +83,9 @@ class RingCamera(CameraBase):
             ValueError: If the device cannot be found
         """
         self.device_object = device_object
+        # Ring event ID -> (monotonic fetch time, recording URL), least recent first
+        self._recording_urls: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._recording_urls_lock = threading.Lock()
         # Initialize the base class with current time and poll interval from config
         super().__init__(config.ring.motion_poll_interval)
 
@@ -80,25 +115,43 @@ class RingCamera(CameraBase):
         connection_manager = cast(
             RingConnectionManager, connection_manager_registry.get_connection_manager(PluginType.RING))
 
-        # Get more events to ensure we don't miss any within our time window
-        connection_manager._ring.update_data()
-        events = self.device_object.history(limit=5)
+        # Ring calls are blocking, so run them off the event loop to let
+        # several cameras poll concurrently
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, connection_manager.update_data_cached, self.motion_poll_interval)
         LOGGER.debug(
             "Looking for new %s events between %s and %s", self.device_object.name, from_time, to_time)
-        LOGGER.debug("Events: %r", events)
-        LOGGER.debug("Retrieved %d events from Ring history", len(events))
 
+        # History is returned newest first, so page back with older_than until
+        # the window is covered instead of relying on a fixed number of events
+        from_ts = from_time.timestamp()
+        to_ts = to_time.timestamp()
         matching_events = []
-        for event in events:
-            # Convert event timestamp to timezone-aware datetime if it isn't already
-            event_time = event.get("created_at")
-            if event_time is not None:
-                event_time = event_time.astimezone(
-                    ZoneInfo("America/Los_Angeles"))
-
-                if from_time <= event_time <= to_time:
-                    motion_event = MotionEvent.from_ring_event(event)
-                    matching_events.append(motion_event)
+        older_than = None
+        for _ in range(MAX_HISTORY_PAGES):
+            history_kwargs: Dict[str, Any] = {"limit": HISTORY_PAGE_SIZE}
+            if older_than is not None:
+                history_kwargs["older_than"] = older_than
+            events = await loop.run_in_executor(
+                None, functools.partial(self.device_object.history, **history_kwargs))
+            LOGGER.debug("Retrieved %d events from Ring history", len(events))
+
+            window_covered = False
+            for event in events:
+                event_time = event.get("created_at")
+                if event_time is None:
+                    continue
+                event_ts = event_time.timestamp()
+                if event_ts < from_ts:
+                    window_covered = True
+                    break
+                if event_ts <= to_ts:
+                    matching_events.append(MotionEvent.from_ring_event(event))
+
+            if window_covered or len(events) < HISTORY_PAGE_SIZE:
+                break
+            older_than = events[-1]["id"]
 
         LOGGER.debug("Found %d matching events", len(matching_events))
         return matching_events
@@ -118,40 +171,34 @@ class RingCamera(CameraBase):
             raise ValueError(
                 f"No event ID found in metadata for event {event.event_id}")
 
+        loop = asyncio.get_running_loop()
+        bucket_name = config.event_recordings_bucket
+        temp_file_path = None
+        h264_file_path = None
+        h264_is_temp = False
         try:
-            bucket_name = config.event_recordings_bucket
-            temp_file_path = None
-            h264_file_path = None
-            h264_is_temp = False
-
-            video_url = self.device_object.recording_url(event_id)
+            video_url = await loop.run_in_executor(
+                None, self._recording_url, event_id)
             if video_url is None:
                 LOGGER.warning("No video URL found for Ring event %s", event_id)
                 raise ValueError(
                     f"No video URL found for Ring event {event_id}")
             object_key = f'ring_{event_id}.mp4'
-            temp_file = tempfile.NamedTemporaryFile(
-                delete=False, suffix='.mp4')
-            temp_file_path = temp_file.name
 
-            # Download the video to the temp file
-            with requests.get(video_url, stream=True) as response:
-                response.raise_for_status()
-                for chunk in response.iter_content(chunk_size=8192):
-                    temp_file.write(chunk)
-            temp_file.close()  # Close so S3 can read it
-
-            # If file is not already H.264, convert it to H.264 for Rekognition
-            if not VIDEO_CONVERTER.get_video_info(
-                    temp_file_path).get('codec') == 'h264':
-                h264_file_path, h264_is_temp = VIDEO_CONVERTER.convert_for_rekognition(
-                    temp_file_path)
+            # H.264 recordings (the common case) are streamed straight to S3
+            if await loop.run_in_executor(None, self._probe_codec, video_url) == 'h264':
+                with await loop.run_in_executor(
+                        None, functools.partial(
+                            _HTTP_SESSION.get, video_url, stream=True, timeout=HTTP_TIMEOUT)) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    await S3_SERVICE.aupload_stream(response.raw, bucket_name, object_key)
             else:
-                h264_file_path = temp_file_path
-                h264_is_temp = False
+                temp_file_path, h264_file_path, h264_is_temp = await loop.run_in_executor(
+                    None, self._download_and_convert, video_url)
 
-            # Upload to S3
-            S3_SERVICE.upload_file(h264_file_path, bucket_name, object_key)
+                # Upload to S3
+                await S3_SERVICE.aupload_file(h264_file_path, bucket_name, object_key)
         finally:
             # Always clean up the temp files
             if temp_file_path and os.path.exists(temp_file_path):
@@ -160,35 +207,122 @@ class RingCamera(CameraBase):
                 os.remove(h264_file_path)
 
         # Update the event in the database with the video URL
+        await loop.run_in_executor(
+            None, self._record_upload, event_id, f's3://{bucket_name}/{object_key}')
+
+    def _recording_url(self, event_id: str) -> Optional[str]:
+        """Get the recording URL of a Ring event, reusing recent lookups.
+
+        URLs are cached for one motion poll interval, so a retried upload does
+        not make another cloud round-trip.
+
+        Args:
+            event_id: The Ring event ID
+
+        Returns:
+            The recording URL, or None if Ring has no recording for the event
+        """
+        with self._recording_urls_lock:
+            cached = self._recording_urls.get(event_id)
+            if cached is not None and time.monotonic() - cached[0] < self.motion_poll_interval:
+                self._recording_urls.move_to_end(event_id)
+                return cached[1]
+
+        video_url = self.device_object.recording_url(event_id)
+        if video_url is None:
+            return None
+
+        with self._recording_urls_lock:
+            self._recording_urls[event_id] = (time.monotonic(), video_url)
+            self._recording_urls.move_to_end(event_id)
+            while len(self._recording_urls) > RECORDING_URL_CACHE_SIZE:
+                self._recording_urls.popitem(last=False)
+        return video_url
+
+    @staticmethod
+    def _download_and_convert(video_url: str) -> Tuple[str, str, bool]:
+        """Download a recording to a temp file and convert it to H.264.
+
+        Args:
+            video_url: The recording URL
+
+        Returns:
+            Tuple of (downloaded file path, H.264 file path, whether the H.264
+            file is a separate temp file)
+        """
+        temp_file = tempfile.NamedTemporaryFile(
+            delete=False, suffix='.mp4')
+        try:
+            # Download the video to the temp file
+            with _HTTP_SESSION.get(video_url, stream=True, timeout=HTTP_TIMEOUT) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, temp_file, length=DOWNLOAD_BUFFER_SIZE)
+        finally:
+            temp_file.close()  # Close so ffmpeg can read it
+
+        try:
+            # Convert to H.264 for Rekognition
+            h264_file_path, h264_is_temp = VIDEO_CONVERTER.convert_for_rekognition(
+                temp_file.name)
+        except Exception:
+            os.remove(temp_file.name)
+            raise
+        return temp_file.name, h264_file_path, h264_is_temp
+
+    @staticmethod
+    def _record_upload(event_id: str, s3_url: str) -> None:
+        """Store the S3 URL of an uploaded recording on its motion event.
+
+        Args:
+            event_id: The Ring event ID
+            s3_url: The S3 URL of the uploaded recording
+        """
+        # The engine and session factory are cached by get_database_connection
         _, session_factory = get_database_connection()
-        motion_event_repository = MotionEventRepository()
 
         with session_factory() as session:
             # Find the event by Ring event ID in metadata
-            events = session.query(motion_event_repository.model).filter(
-                motion_event_repository.model.event_metadata.op(
-                    '->>')('event_id') == str(event_id)
-            ).all()
-
-            if not events:
-                LOGGER.error(
-                    "No database event found for Ring event ID %s", event_id)
-                raise DatabaseEventNotFoundError(
-                    f"No database event found for Ring event ID {event_id}")
-            if len(events) != 1:
-                LOGGER.error(
-                    "Multiple database events found for Ring event ID %s", event_id)
-                raise DatabaseMultipleEventsFoundError(
-                    f"Multiple database events found for Ring event ID {event_id}: {events}")
-
-            # Update the first matching event
-            motion_event_repository.update_s3_url(
+            db_event = MOTION_EVENT_REPOSITORY.get_by_ring_event_id(session, event_id)
+
+            # Update the matching event
+            MOTION_EVENT_REPOSITORY.update_s3_url(
                 session,
-                events[0].id,
-                f's3://{bucket_name}/{object_key}',
-                datetime.now(ZoneInfo("America/Los_Angeles"))
+                db_event.id,
+                s3_url,
+                datetime.now(LA_TZ)
             )
 
+    @staticmethod
+    def _probe_codec(video_url: str) -> Optional[str]:
+        """Get the video codec of a recording without downloading it.
+
+        Args:
+            video_url: The recording URL
+
+        Returns:
+            The codec name, or None if the recording could not be probed
+        """
+        # Most recordings are faststart MP4s whose codec is in the first bytes
+        try:
+            with _HTTP_SESSION.get(
+                    video_url, headers={'Range': f'bytes=0-{FAST_PROBE_BYTES - 1}'},
+                    stream=True, timeout=HTTP_TIMEOUT) as response:
+                response.raise_for_status()
+                codec = probe_codec_fast(response.raw)
+            if codec is not None:
+                return codec
+        except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+            # Reading response.raw raises urllib3 errors that requests does not translate
+            LOGGER.debug("Range probe of %s failed, falling back to ffprobe: %s", video_url, e)
+
+        # Any probe failure falls back to downloading and converting locally
+        try:
+            return VIDEO_CONVERTER.get_video_info(video_url).get('codec')
+        except (RuntimeError, OSError, subprocess.SubprocessError, VideoConversionError) as e:
+            LOGGER.warning("Could not probe codec of %s, converting locally: %s", video_url, e)
+            return None
+
     async def is_healthy(self) -> bool:
         """Check if the camera is healthy and functioning properly.
 
@@ -199,13 +333,12 @@ class RingCamera(CameraBase):
             connection_manager = cast(
                 RingConnectionManager,
                 connection_manager_registry.get_connection_manager(PluginType.RING))
-            # Access protected member to update Ring data
-            connection_manager._ring.update_data()  # pylint: disable=protected-access
+            await asyncio.get_running_loop().run_in_executor(
+                None, connection_manager.update_data_cached, self.motion_poll_interval)
             device_properties = await self.get_properties()
             return device_properties.get("connection_status") == "online"
         except Exception as e:
-            LOGGER.error("Error checking camera health: %s", e)
-            LOGGER.exception("Full traceback:")
+            LOGGER.exception("Error checking camera health: %s", e)
             return False
 
     async def get_properties(self) -> Dict[str, Any]:
@@ -218,8 +351,8 @@ class RingCamera(CameraBase):
             connection_manager = cast(
                 RingConnectionManager,
                 connection_manager_registry.get_connection_manager(PluginType.RING))
-            # Access protected member to update Ring data
-            connection_manager._ring.update_data()  # pylint: disable=protected-access
+            await asyncio.get_running_loop().run_in_executor(
+                None, connection_manager.update_data_cached, self.motion_poll_interval)
 
             # Access all properties in a single try block
             name = self.device_object.name
@@ -240,6 +373,5 @@ class RingCamera(CameraBase):
                 "firmware": firmware
             }
         except Exception as e:
-            LOGGER.error("Error getting camera properties: %s", e)
-            LOGGER.exception("Full traceback:")
+            LOGGER.exception("Error getting camera properties: %s", e)
             return {}
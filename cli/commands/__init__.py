@@ -5,12 +5,24 @@ This package contains individual CLI command modules that implement specific
 functionality for the Watch Tower CLI.
 """
 
-from .status import status_command
-from .business_logic import business_logic_group
-from .visitor_log import visitor_log_group
+import importlib
+from typing import Any
+
+# Loaded on first access so importing one command does not import the others
+_EXPORTS = {
+    "status_command": ".status",
+    "business_logic_group": ".business_logic",
+    "visitor_log_group": ".visitor_log",
+}
 
 __all__ = [
     "status_command",
     "business_logic_group",
     "visitor_log_group",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
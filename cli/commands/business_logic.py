@@ -11,7 +11,7 @@ import sys
 
 import click
 
-from cli.services import WatchTowerService
+from cli.services import WATCH_TOWER_SERVICE as SERVICE
 from cli.utils import handle_cli_error
 from watch_tower.exceptions import DependencyError, ManagementAPIError
 
@@ -21,9 +21,6 @@ LOGGER = logging.getLogger(__name__)
 DEFAULT_HOST = "localhost"
 DEFAULT_PORT = 8080
 
-# Initialize service
-SERVICE = WatchTowerService()
-
 
 @click.group()
 def business_logic_group():
@@ -38,14 +35,16 @@ def business_logic_group():
 @click.pass_context
 def start(ctx: click.Context, host: str, port: int) -> None:
     """Start the business logic loop via HTTP API."""
+    verbose = ctx.obj.get('verbose')
     try:
-        if ctx.obj.get('verbose'):
+        if verbose:
             LOGGER.debug(
                 "Starting business logic loop via API at http://%s:%d/start...", host, port)
 
-        result = asyncio.run(SERVICE.start_business_logic_api(host, port))
+        result = asyncio.run(
+            SERVICE.run_with_session(SERVICE.start_business_logic_api, host, port))
 
-        if ctx.obj.get('verbose'):
+        if verbose:
             LOGGER.debug("Start API response: %s", result)
 
         click.echo("✅ Business logic loop started successfully")
@@ -55,7 +54,7 @@ def start(ctx: click.Context, host: str, port: int) -> None:
         sys.exit(1)
     except ManagementAPIError as e:
         click.echo(f"❌ Failed to start business logic loop: {e}")
-        if ctx.obj.get('verbose') and e.original_error:
+        if verbose and e.original_error:
             LOGGER.debug("Original error: %s", e.original_error)
         sys.exit(1)
     except Exception as e:
@@ -70,14 +69,16 @@ def start(ctx: click.Context, host: str, port: int) -> None:
 @click.pass_context
 def stop(ctx: click.Context, host: str, port: int) -> None:
     """Stop the business logic loop via HTTP API."""
+    verbose = ctx.obj.get('verbose')
     try:
-        if ctx.obj.get('verbose'):
+        if verbose:
             LOGGER.debug(
                 "Stopping business logic loop via API at http://%s:%d/stop...", host, port)
 
-        result = asyncio.run(SERVICE.stop_business_logic_api(host, port))
+        result = asyncio.run(
+            SERVICE.run_with_session(SERVICE.stop_business_logic_api, host, port))
 
-        if ctx.obj.get('verbose'):
+        if verbose:
             LOGGER.debug("Stop API response: %s", result)
 
         click.echo("✅ Business logic loop stopped successfully")
@@ -87,7 +88,7 @@ def stop(ctx: click.Context, host: str, port: int) -> None:
         sys.exit(1)
     except ManagementAPIError as e:
         click.echo(f"❌ Failed to stop business logic loop: {e}")
-        if ctx.obj.get('verbose') and e.original_error:
+        if verbose and e.original_error:
             LOGGER.debug("Original error: %s", e.original_error)
         sys.exit(1)
     except Exception as e:
@@ -5,25 +5,64 @@ This module contains the status command implementation for displaying
 comprehensive system status information.
 """
 
-import json
+import asyncio
 import logging
+from collections import Counter
 from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
 
 import click
 
-from cli.services import WatchTowerService
+from cli.services import WATCH_TOWER_SERVICE as SERVICE
 from cli.utils import (
     validate_aws_config,
     validate_database_config,
     validate_ring_config,
     validate_app_config,
+    dumps_indented,
     handle_cli_error,
 )
 
 LOGGER = logging.getLogger(__name__)
 
-# Initialize service
-SERVICE = WatchTowerService()
+
+def _validate_config() -> List[Dict[str, Any]]:
+    """Run every configuration validator, reporting a failing section as an error result."""
+    sections = (
+        ('AWS', validate_aws_config),
+        ('Database', validate_database_config),
+        ('Ring', validate_ring_config),
+        ('App', validate_app_config),
+    )
+    config_results: List[Dict[str, Any]] = []
+    for section, validator in sections:
+        try:
+            config_results.extend(validator())
+        except Exception as e:
+            config_results.append({
+                'status': '❌',
+                'field': f'{section} Configuration',
+                'value': 'Error',
+                'message': str(e)
+            })
+    return config_results
+
+
+async def _collect_status() -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Get the business logic status and configuration validation results.
+
+    The validators run on a worker thread while the management API health
+    check is in flight, so the command waits for the slower of the two
+    rather than both.
+
+    Returns:
+        Tuple of (business logic status, configuration validation results)
+    """
+    loop = asyncio.get_running_loop()
+    async with SERVICE:
+        business_logic_status, config_results = await asyncio.gather(
+            SERVICE.aget_status(), loop.run_in_executor(None, _validate_config))
+    return business_logic_status, config_results
 
 
 @click.command()
@@ -33,98 +72,18 @@ SERVICE = WatchTowerService()
 @click.pass_context
 def status_command(ctx: click.Context, format: str, detailed: bool) -> None:
     """Show comprehensive system status."""
+    verbose = ctx.obj.get('verbose')
     try:
-        if ctx.obj.get('verbose'):
+        if verbose:
             LOGGER.debug("Getting comprehensive system status...")
 
-        # Get business logic status
-        business_logic_status = SERVICE.get_status()
-
-        # Validate configuration
-        config_results = []
-        config_passed = 0
-        config_failed = 0
-        config_warnings = 0
-
-        try:
-            # AWS Configuration
-            aws_results = validate_aws_config()
-            config_results.extend(aws_results)
-            for result in aws_results:
-                if result['status'] == '✅':
-                    config_passed += 1
-                elif result['status'] == '❌':
-                    config_failed += 1
-                elif result['status'] == '⚠️':
-                    config_warnings += 1
-        except Exception as e:
-            config_results.append({
-                'status': '❌',
-                'field': 'AWS Configuration',
-                'value': 'Error',
-                'message': str(e)
-            })
-            config_failed += 1
-
-        try:
-            # Database Configuration
-            db_results = validate_database_config()
-            config_results.extend(db_results)
-            for result in db_results:
-                if result['status'] == '✅':
-                    config_passed += 1
-                elif result['status'] == '❌':
-                    config_failed += 1
-                elif result['status'] == '⚠️':
-                    config_warnings += 1
-        except Exception as e:
-            config_results.append({
-                'status': '❌',
-                'field': 'Database Configuration',
-                'value': 'Error',
-                'message': str(e)
-            })
-            config_failed += 1
-
-        try:
-            # Ring Configuration
-            ring_results = validate_ring_config()
-            config_results.extend(ring_results)
-            for result in ring_results:
-                if result['status'] == '✅':
-                    config_passed += 1
-                elif result['status'] == '❌':
-                    config_failed += 1
-                elif result['status'] == '⚠️':
-                    config_warnings += 1
-        except Exception as e:
-            config_results.append({
-                'status': '❌',
-                'field': 'Ring Configuration',
-                'value': 'Error',
-                'message': str(e)
-            })
-            config_failed += 1
+        business_logic_status, config_results = asyncio.run(_collect_status())
 
-        try:
-            # App Configuration
-            app_results = validate_app_config()
-            config_results.extend(app_results)
-            for result in app_results:
-                if result['status'] == '✅':
-                    config_passed += 1
-                elif result['status'] == '❌':
-                    config_failed += 1
-                elif result['status'] == '⚠️':
-                    config_warnings += 1
-        except Exception as e:
-            config_results.append({
-                'status': '❌',
-                'field': 'App Configuration',
-                'value': 'Error',
-                'message': str(e)
-            })
-            config_failed += 1
+        # Tally configuration results
+        status_counts = Counter(result['status'] for result in config_results)
+        config_passed = status_counts['✅']
+        config_failed = status_counts['❌']
+        config_warnings = status_counts['⚠️']
 
         # Determine overall status
         if config_failed > 0:
@@ -147,35 +106,38 @@ def status_command(ctx: click.Context, format: str, detailed: bool) -> None:
             }
         }
 
-        if ctx.obj.get('verbose'):
+        if verbose:
             LOGGER.debug("System status: %s", status_info)
 
         if format == 'json':
-            click.echo(json.dumps(status_info, indent=2))
+            click.echo(dumps_indented(status_info))
         else:
-            click.echo("🏰 Watch Tower System Status")
-            click.echo("=" * 40)
-            click.echo(f"Overall Status: {overall_status}")
-            click.echo(f"Timestamp: {status_info['timestamp']}")
-
-            click.echo("\n🔄 Business Logic Loop:")
+            # Build the report first so it reaches stdout in a single write
+            lines = [
+                "🏰 Watch Tower System Status",
+                "=" * 40,
+                f"Overall Status: {overall_status}",
+                f"Timestamp: {status_info['timestamp']}",
+            ]
+
+            lines.append("\n🔄 Business Logic Loop:")
             bl_status = business_logic_status
-            click.echo(
+            lines.append(
                 f"  Status: {'🟢 Running' if bl_status.get('running') else '🔴 Stopped'}")
-            click.echo(
+            lines.append(
                 f"  Start Time: {bl_status.get('start_time', 'Unknown')}")
-            click.echo(f"  Uptime: {bl_status.get('uptime', 'Unknown')}")
+            lines.append(f"  Uptime: {bl_status.get('uptime', 'Unknown')}")
 
             if 'error' in bl_status:
-                click.echo(f"  Error: {bl_status['error']}")
+                lines.append(f"  Error: {bl_status['error']}")
 
-            click.echo(f"\n⚙️  Configuration:")
-            click.echo(f"  ✅ Passed: {config_passed}")
-            click.echo(f"  ❌ Failed: {config_failed}")
-            click.echo(f"  ⚠️  Warnings: {config_warnings}")
+            lines.append(f"\n⚙️  Configuration:")
+            lines.append(f"  ✅ Passed: {config_passed}")
+            lines.append(f"  ❌ Failed: {config_failed}")
+            lines.append(f"  ⚠️  Warnings: {config_warnings}")
 
             if detailed and config_results:
-                click.echo("\n📋 Configuration Details:")
+                lines.append("\n📋 Configuration Details:")
                 for result in config_results:
                     status_icon = result['status']
                     field = result['field']
@@ -183,21 +145,23 @@ def status_command(ctx: click.Context, format: str, detailed: bool) -> None:
                     message = result.get('message', '')
                     display_value = str(
                         value) if value is not None else 'Not set'
-                    click.echo(f"  {status_icon} {field}: {display_value}")
+                    lines.append(f"  {status_icon} {field}: {display_value}")
                     if message:
-                        click.echo(f"     💡 {message}")
+                        lines.append(f"     💡 {message}")
 
             # Summary
             if config_failed > 0:
-                click.echo(
+                lines.append(
                     f"\n❌ System has {config_failed} configuration errors")
-                click.echo(
+                lines.append(
                     "💡 Check your environment variables and configuration")
             elif config_warnings > 0:
-                click.echo(
+                lines.append(
                     f"\n⚠️  System has {config_warnings} configuration warnings")
             else:
-                click.echo("\n✅ All systems operational")
+                lines.append("\n✅ All systems operational")
+
+            click.echo("\n".join(lines))
 
     except Exception as e:
         handle_cli_error(e, f"Failed to get system status: {e}", ctx)
@@ -5,17 +5,29 @@ This module contains the visitor log management commands for viewing
 and managing visitor log entries.
 """
 
-import json
 import logging
+import textwrap
+from typing import Any, Iterable, List
 
 import click
 
-from cli.utils import format_confidence_score, format_timestamp, create_json_entry, handle_cli_error
+from cli.utils import (
+    format_confidence_score,
+    format_timestamp,
+    create_json_entry,
+    dumps_indented,
+    handle_cli_error,
+)
 
 LOGGER = logging.getLogger(__name__)
 
 # Constants
 DEFAULT_VISITOR_LOG_LIMIT = 10
+TABLE_TITLE_RULE = "=" * 100
+TABLE_HEADER = f"{'#':<3} {'Name':<20} {'Camera':<20} {'Time':<25} {'Confidence':<12}"
+TABLE_RULE = "-" * 85
+# Table rows are written to stdout in batches of this many lines
+TABLE_FLUSH_ROWS = 256
 
 
 @click.group()
@@ -37,57 +49,86 @@ def recent(ctx: click.Context, limit: int, format: str, show_more: bool) -> None
     from db.repositories.visitor_log_repository import VisitorLogRepository  # pylint: disable=import-outside-toplevel
     from db.connection import get_database_connection  # pylint: disable=import-outside-toplevel
 
+    verbose = ctx.obj.get('verbose')
     try:
-        if ctx.obj.get('verbose'):
+        if verbose:
             LOGGER.debug("Fetching recent visitor log entries (limit: %d)", limit)
 
         # Get database connection and repository
         _, session_factory = get_database_connection()
         visitor_log_repo = VisitorLogRepository()
 
-        # Create a session and fetch recent entries
+        # Stream entries straight to the output while the session is open
         with session_factory() as db_session:
-            entries = visitor_log_repo.get_recent_entries(
-                db_session, limit=limit)
-
-        if ctx.obj.get('verbose'):
-            LOGGER.debug("Retrieved %d visitor log entries", len(entries))
-
-        if format == 'json':
-            # Convert entries to JSON-serializable format
-            json_entries = [create_json_entry(entry) for entry in entries]
-            click.echo(json.dumps(json_entries, indent=2))
-        else:
-            if not entries:
-                click.echo("📋 No visitor log entries found")
-                return
-
-            click.echo("📋 Recent Visitor Log Entries")
-            click.echo("=" * 100)
-
-            # Print table header
-            click.echo(
-                f"{'#':<3} {'Name':<20} {'Camera':<20} {'Time':<25} {'Confidence':<12}")
-            click.echo("-" * 85)
-
-            # Print table rows
-            for i, entry in enumerate(entries, 1):
-                name = entry.persons_name or 'Unknown'
-                camera = entry.camera_name or 'Unknown'
-                time_str = format_timestamp(entry.visited_at)
-                confidence = format_confidence_score(entry.confidence_score)
-                click.echo(
-                    f"{i:<3} {name:<20} {camera:<20} {time_str:<25} {confidence:<12}")
-
-            click.echo("-" * 85)
-
-            click.echo(
-                f"Showing {len(entries)} of {limit} most recent entries")
-
-            if not show_more and len(entries) == limit:
-                click.echo("\n💡 Use --show-more to display additional entries")
-                click.echo(
-                    "   Use --limit to change the number of entries displayed")
+            entries = visitor_log_repo.iter_recent_entries(db_session, limit=limit)
+            if format == 'json':
+                count = _echo_json_entries(entries)
+            else:
+                count = _echo_entry_table(entries, limit, show_more)
+
+        if verbose:
+            LOGGER.debug("Retrieved %d visitor log entries", count)
 
     except Exception as e:
         handle_cli_error(e, f"Failed to fetch visitor log entries: {e}", ctx)
+
+
+def _echo_json_entries(entries: Iterable[Any]) -> int:
+    """Write entries as an indented JSON array, one entry at a time.
+
+    Returns:
+        The number of entries written.
+    """
+    count = 0
+    for entry in entries:
+        click.echo('[\n' if count == 0 else ',\n', nl=False)
+        click.echo(textwrap.indent(dumps_indented(create_json_entry(entry)), '  '), nl=False)
+        count += 1
+    click.echo('\n]' if count else '[]')
+    return count
+
+
+def _echo_entry_table(entries: Iterable[Any], limit: int, show_more: bool) -> int:
+    """Write entries as a table, flushing rows in batches.
+
+    Returns:
+        The number of entries written.
+    """
+    count = 0
+    lines: List[str] = []
+    for count, entry in enumerate(entries, 1):
+        if count == 1:
+            lines.extend((
+                "📋 Recent Visitor Log Entries",
+                TABLE_TITLE_RULE,
+                TABLE_HEADER,
+                TABLE_RULE,
+            ))
+
+        name = entry.persons_name or 'Unknown'
+        camera = entry.camera_name or 'Unknown'
+        time_str = format_timestamp(entry.visited_at)
+        confidence = format_confidence_score(entry.confidence_score)
+        lines.append(
+            f"{count:<3} {name:<20} {camera:<20} {time_str:<25} {confidence:<12}")
+        if len(lines) >= TABLE_FLUSH_ROWS:
+            click.echo("\n".join(lines))
+            lines.clear()
+
+    if lines:
+        click.echo("\n".join(lines))
+
+    if not count:
+        click.echo("📋 No visitor log entries found")
+        return count
+
+    click.echo(TABLE_RULE)
+
+    click.echo(
+        f"Showing {count} of {limit} most recent entries")
+
+    if not show_more and count == limit:
+        click.echo("\n💡 Use --show-more to display additional entries")
+        click.echo(
+            "   Use --limit to change the number of entries displayed")
+    return count
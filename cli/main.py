@@ -5,16 +5,46 @@ This module serves as the main entry point for the Watch Tower CLI,
 bringing together all command groups and providing the main CLI interface.
 """
 
+import importlib
 import logging
+from typing import List, Optional
 
 import click
 
-from cli.commands import status_command, business_logic_group, visitor_log_group
-
 LOGGER = logging.getLogger(__name__)
 
+# Command name -> (module, attribute). Command modules pull in aiohttp, the
+# app config and the database layer, so they are only imported when invoked.
+LAZY_COMMANDS = {
+    'status': ('cli.commands.status', 'status_command'),
+    'business-logic': ('cli.commands.business_logic', 'business_logic_group'),
+    'visitor-log': ('cli.commands.visitor_log', 'visitor_log_group'),
+}
+
+# Every CLI command is a short asyncio.run() of HTTP calls; use uvloop's
+# faster event loop for them when it is installed
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+
+class LazyGroup(click.Group):
+    """Click group that imports its subcommands on first use."""
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(LAZY_COMMANDS))
 
-@click.group()
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in LAZY_COMMANDS and cmd_name not in self.commands:
+            module_name, attribute = LAZY_COMMANDS[cmd_name]
+            module = importlib.import_module(module_name)
+            self.add_command(getattr(module, attribute), name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=LazyGroup)
 @click.version_option(version="3.0.0")
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
 @click.pass_context
@@ -34,11 +64,5 @@ def cli(ctx: click.Context, verbose: bool) -> None:
         LOGGER.debug("Verbose mode enabled")
 
 
-# Add command groups to the main CLI
-cli.add_command(status_command, name='status')
-cli.add_command(business_logic_group, name='business-logic')
-cli.add_command(visitor_log_group, name='visitor-log')
-
-
 if __name__ == '__main__':
     cli()
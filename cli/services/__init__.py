@@ -5,6 +5,6 @@ This package contains service classes that handle business logic and external
 API interactions for the CLI commands.
 """
 
-from .watch_tower_service import WatchTowerService
+from .watch_tower_service import WATCH_TOWER_SERVICE, WatchTowerService
 
-__all__ = ["WatchTowerService"]
+__all__ = ["WATCH_TOWER_SERVICE", "WatchTowerService"]
@@ -6,10 +6,9 @@ operations and external API interactions for the CLI.
 """
 
 import asyncio
-import json
+import functools
 import logging
-from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
 
 from watch_tower.config import config
 from utils.errors import (
@@ -26,72 +25,144 @@ DEFAULT_HOST = "localhost"
 DEFAULT_PORT = 8080
 DEFAULT_TIMEOUT = 10
 HEALTH_CHECK_TIMEOUT = 5
+# Connect bounds fail fast when the management API is not running
+CONNECT_TIMEOUT = 2
+HEALTH_CHECK_CONNECT_TIMEOUT = 1
+# Connection pool for the management API; one command makes only a few calls
+MAX_CONNECTIONS = 4
+KEEPALIVE_TIMEOUT = 30
+DNS_CACHE_TTL = 300
+
+T = TypeVar('T')
 
 
 class WatchTowerService:
     """Service layer for Watch Tower CLI operations."""
 
     def __init__(self):
-        self.state_file = config.cli.state_file_path
+        # Created on first use; aiohttp sessions are tied to the running event loop
+        self._session: Optional[Any] = None
+        # aiohttp.ClientTimeout instances, built alongside the session
+        self._request_timeout: Optional[Any] = None
+        self._health_timeout: Optional[Any] = None
+
+    @functools.cached_property
+    def state_file(self) -> str:
+        """Path of the business logic state file, read from config on first use."""
+        return config.cli.state_file_path
+
+    async def __aenter__(self) -> 'WatchTowerService':
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def _get_session(self) -> Any:
+        """Get the shared aiohttp session, creating it on first use.
+
+        Raises:
+            DependencyError: If aiohttp is not installed.
+        """
+        if self._session is None or self._session.closed:
+            try:
+                import aiohttp  # pylint: disable=import-outside-toplevel
+            except ImportError:
+                raise DependencyError("aiohttp", "pip install aiohttp")
+            self._request_timeout = aiohttp.ClientTimeout(
+                total=DEFAULT_TIMEOUT, connect=CONNECT_TIMEOUT,
+                sock_connect=CONNECT_TIMEOUT, sock_read=DEFAULT_TIMEOUT)
+            self._health_timeout = aiohttp.ClientTimeout(
+                total=HEALTH_CHECK_TIMEOUT, connect=HEALTH_CHECK_CONNECT_TIMEOUT,
+                sock_connect=HEALTH_CHECK_CONNECT_TIMEOUT, sock_read=HEALTH_CHECK_TIMEOUT)
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=MAX_CONNECTIONS, keepalive_timeout=KEEPALIVE_TIMEOUT,
+                    ttl_dns_cache=DNS_CACHE_TTL))
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared aiohttp session, if one was opened."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def run_with_session(self, api_call: Callable[..., Awaitable[T]], *args: Any) -> T:
+        """Run an API call and close the HTTP session once it finishes.
+
+        Use this as the body of asyncio.run() so the session never outlives
+        the event loop it was created on.
+        """
+        async with self:
+            return await api_call(*args)
 
     def get_status(self) -> Dict[str, Any]:
         """Get the current status of the business logic loop."""
         try:
-            health_data = asyncio.run(self.check_management_api())
-
-            # Try new field name first, fall back to old for backward compatibility
-            if 'business_logic' in health_data:
-                business_logic = health_data['business_logic']
-                return {
-                    "running": business_logic.get(
-                        'running',
-                        False),
-                    "start_time": business_logic.get('start_time'),
-                    "uptime": business_logic.get('uptime'),
-                    "business_logic_completed": not business_logic.get(
-                        'running',
-                        False),
-                    "business_logic_cancelled": False}
-            elif 'event_loop' in health_data:
-                event_loop = health_data['event_loop']
-                return {
-                    "running": event_loop.get('running', False),
-                    "start_time": event_loop.get('start_time'),
-                    "uptime": event_loop.get('uptime'),
-                    "business_logic_completed": not event_loop.get('running', False),
-                    "business_logic_cancelled": False
-                }
-            return create_error_status_response(
-                "No business logic status found in health data")
-
-        except DependencyError as e:
-            LOGGER.error("Dependency error: %s", e)
-            return create_error_status_response(str(e))
-        except ManagementAPIError as e:
-            LOGGER.error("Management API error: %s", e)
-            return create_error_status_response(str(e))
+            health_data = asyncio.run(self.run_with_session(self.check_management_api))
+            return self._status_from_health_data(health_data)
         except Exception as e:
-            LOGGER.error("Failed to get business logic loop status: %s", e)
-            return create_error_status_response(str(e))
+            return self._status_from_error(e)
+
+    async def aget_status(self) -> Dict[str, Any]:
+        """Get the current status of the business logic loop from a running event loop."""
+        try:
+            health_data = await self.check_management_api()
+            return self._status_from_health_data(health_data)
+        except Exception as e:
+            return self._status_from_error(e)
+
+    @staticmethod
+    def _status_from_health_data(health_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the business logic status from a management API health response."""
+        # Try new field name first, fall back to old for backward compatibility
+        if 'business_logic' in health_data:
+            business_logic = health_data['business_logic']
+            return {
+                "running": business_logic.get(
+                    'running',
+                    False),
+                "start_time": business_logic.get('start_time'),
+                "uptime": business_logic.get('uptime'),
+                "business_logic_completed": not business_logic.get(
+                    'running',
+                    False),
+                "business_logic_cancelled": False}
+        elif 'event_loop' in health_data:
+            event_loop = health_data['event_loop']
+            return {
+                "running": event_loop.get('running', False),
+                "start_time": event_loop.get('start_time'),
+                "uptime": event_loop.get('uptime'),
+                "business_logic_completed": not event_loop.get('running', False),
+                "business_logic_cancelled": False
+            }
+        return create_error_status_response(
+            "No business logic status found in health data")
+
+    @staticmethod
+    def _status_from_error(error: Exception) -> Dict[str, Any]:
+        """Log a failed status lookup and build the matching error status."""
+        if isinstance(error, DependencyError):
+            LOGGER.error("Dependency error: %s", error)
+        elif isinstance(error, ManagementAPIError):
+            LOGGER.error("Management API error: %s", error)
+        else:
+            LOGGER.error("Failed to get business logic loop status: %s", error)
+        return create_error_status_response(str(error))
 
     async def start_business_logic_api(
             self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> Dict[str, Any]:
         """Start the business logic loop via HTTP API."""
-        try:
-            import aiohttp  # pylint: disable=import-outside-toplevel
-        except ImportError:
-            raise DependencyError("aiohttp", "pip install aiohttp")
-
+        session = await self._get_session()
         url = f"http://{host}:{port}/start"
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, timeout=DEFAULT_TIMEOUT) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    raise ManagementAPIError(
-                        f"Start API returned status {response.status}",
-                        status_code=response.status
-                    )
+            async with session.post(url, timeout=self._request_timeout) as response:
+                if response.status == 200:
+                    return await response.json()
+                raise ManagementAPIError(
+                    f"Start API returned status {response.status}",
+                    status_code=response.status
+                )
         except ManagementAPIError:
             raise
         except Exception as e:
@@ -101,61 +172,35 @@ class WatchTowerService:
     async def stop_business_logic_api(
             self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> Dict[str, Any]:
         """Stop the business logic loop via HTTP API."""
-        try:
-            import aiohttp  # pylint: disable=import-outside-toplevel
-        except ImportError:
-            raise DependencyError("aiohttp", "pip install aiohttp")
-
+        session = await self._get_session()
         url = f"http://{host}:{port}/stop"
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, timeout=DEFAULT_TIMEOUT) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    raise ManagementAPIError(
-                        f"Stop API returned status {response.status}",
-                        status_code=response.status
-                    )
+            async with session.post(url, timeout=self._request_timeout) as response:
+                if response.status == 200:
+                    return await response.json()
+                raise ManagementAPIError(
+                    f"Stop API returned status {response.status}",
+                    status_code=response.status
+                )
         except ManagementAPIError:
             raise
         except Exception as e:
             raise ManagementAPIError(
                 f"Failed to connect to stop API: {e}", original_error=e)
 
-    def start_business_logic(self) -> None:
-        """Start the business logic loop by updating the state file."""
-        state = {
-            "running": True,
-            "start_time": datetime.now(timezone.utc).isoformat(),
-            "business_logic_completed": False,
-            "business_logic_cancelled": False,
-            "last_updated": datetime.now(timezone.utc).isoformat()
-        }
-
-        with open(self.state_file, "w") as file_handle:
-            json.dump(state, file_handle)
-
-        LOGGER.info(
-            "Business logic loop start requested - main process will pick this up")
-
     async def check_management_api(
             self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> Dict[str, Any]:
         """Check the management API endpoint."""
-        try:
-            import aiohttp  # pylint: disable=import-outside-toplevel
-        except ImportError:
-            raise DependencyError("aiohttp", "pip install aiohttp")
-
+        session = await self._get_session()
         url = f"http://{host}:{port}/health"
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=HEALTH_CHECK_TIMEOUT) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    raise ManagementAPIError(
-                        f"Management API returned status {response.status}",
-                        status_code=response.status
-                    )
+            async with session.get(url, timeout=self._health_timeout) as response:
+                if response.status == 200:
+                    return await response.json()
+                raise ManagementAPIError(
+                    f"Management API returned status {response.status}",
+                    status_code=response.status
+                )
         except ManagementAPIError:
             raise
         except Exception as e:
@@ -166,3 +211,7 @@ class WatchTowerService:
     def validate_config() -> None:
         """Validate the current configuration."""
         config.validate()
+
+
+# Shared by every CLI command
+WATCH_TOWER_SERVICE = WatchTowerService()
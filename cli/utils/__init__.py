@@ -9,6 +9,7 @@ from .formatters import (
     format_confidence_score,
     format_timestamp,
     create_json_entry,
+    dumps_indented,
 )
 from .validators import (
     validate_aws_config,
@@ -27,6 +28,7 @@ __all__ = [
     "format_confidence_score",
     "format_timestamp",
     "create_json_entry",
+    "dumps_indented",
     # Validators
     "validate_aws_config",
     "validate_database_config",
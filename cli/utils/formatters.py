@@ -4,15 +4,34 @@ CLI Formatting Utilities
 This module contains utility functions for formatting data for CLI output,
 including timestamps, confidence scores, and JSON entries.
 """
-from datetime import datetime
+import json
+from datetime import datetime, tzinfo
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
-import pytz
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    # Fallback for Python < 3.9
+    import pytz
+    ZoneInfo = pytz.timezone
+
+# orjson encodes several times faster when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Constants
 DEFAULT_TIMEZONE = "America/Los_Angeles"
 
 
+@lru_cache(maxsize=8)
+def _get_tz(timezone_name: str) -> tzinfo:
+    """Get a timezone by name, built once per name."""
+    return ZoneInfo(timezone_name)
+
+
 def format_confidence_score(score: Optional[float]) -> str:
     """Format confidence score as percentage string."""
     if score is None:
@@ -26,9 +45,7 @@ def format_timestamp(
     """Format timestamp for display."""
     if timestamp is None:
         return 'Unknown'
-    local_tz = pytz.timezone(timezone_name)
-    local_time = timestamp.astimezone(local_tz)
-    return local_time.isoformat(sep=' ')
+    return timestamp.astimezone(_get_tz(timezone_name)).isoformat(sep=' ')
 
 
 def create_json_entry(entry: Any) -> Dict[str, Any]:
@@ -42,3 +59,10 @@ def create_json_entry(entry: Any) -> Dict[str, Any]:
             1) if entry.confidence_score else None,
         'visited_at': entry.visited_at.isoformat() if entry.visited_at else None,
         'created_at': entry.created_at.isoformat() if entry.created_at else None}
+
+
+def dumps_indented(data: Any) -> str:
+    """Encode data as JSON indented by two spaces, for CLI output."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2)
@@ -5,72 +5,59 @@ This module contains functions for validating various configuration sections
 and returning structured validation results.
 """
 
-from typing import Any, Dict, List
+import functools
+from typing import Any, Dict, List, Tuple
 
 from cli.utils.errors import create_validation_result
 from watch_tower.config import config
 
+# Result builders for each status icon
+_ok = functools.partial(create_validation_result, '✅')
+_err = functools.partial(create_validation_result, '❌')
+_info = functools.partial(create_validation_result, 'ℹ️')
 
-def validate_aws_config() -> List[Dict[str, Any]]:
-    """Validate AWS configuration and return detailed results."""
 
-    results = []
+# (config attribute, environment variable, mask value in results)
+RequiredSetting = Tuple[str, str, bool]
 
-    # AWS Region
-    if config.aws_region:
-        results.append(create_validation_result(
-            '✅', 'aws_region', config.aws_region))
-    else:
-        results.append(create_validation_result(
-            '❌', 'aws_region', None, "Set AWS_REGION environment variable"))
-
-    # AWS Access Key ID
-    if config.aws_access_key_id:
-        results.append(create_validation_result(
-            '✅', 'aws_access_key_id', '***'))
-    else:
-        results.append(
-            create_validation_result(
-                '❌',
-                'aws_access_key_id',
-                None,
-                "Set AWS_ACCESS_KEY_ID environment variable"))
-
-    # AWS Secret Access Key
-    if config.aws_secret_access_key:
-        results.append(create_validation_result(
-            '✅', 'aws_secret_access_key', '***'))
-    else:
-        results.append(create_validation_result(
-            '❌', 'aws_secret_access_key',
-            None, "Set AWS_SECRET_ACCESS_KEY environment variable"))
+AWS_SETTINGS: Tuple[RequiredSetting, ...] = (
+    ('aws_region', 'AWS_REGION', False),
+    ('aws_access_key_id', 'AWS_ACCESS_KEY_ID', True),
+    ('aws_secret_access_key', 'AWS_SECRET_ACCESS_KEY', True),
+)
 
-    return results
+DATABASE_SETTINGS: Tuple[RequiredSetting, ...] = (
+    ('db_secret_name', 'DB_SECRET_NAME', False),
+    ('encryption_key_secret_name', 'ENCRYPTION_KEY_SECRET_NAME', False),
+)
 
+APP_SETTINGS: Tuple[RequiredSetting, ...] = (
+    ('event_recordings_bucket', 'EVENT_RECORDINGS_BUCKET', False),
+    ('rekognition_collection_id', 'REKOGNITION_COLLECTION_ID', False),
+    ('rekognition_s3_known_faces_bucket', 'REKOGNITION_S3_KNOWN_FACES_BUCKET', False),
+    ('sns_rekognition_video_analysis_topic_arn',
+     'SNS_REKOGNITION_VIDEO_ANALYSIS_TOPIC_ARN', False),
+    ('rekognition_video_service_role_arn', 'REKOGNITION_VIDEO_SERVICE_ROLE_ARN', False),
+)
 
-def validate_database_config() -> List[Dict[str, Any]]:
-    """Validate database configuration and return detailed results."""
 
-    results = []
+def _check_required(setting: RequiredSetting) -> Dict[str, Any]:
+    """Check that a required setting is present in config."""
+    field, env_var, masked = setting
+    value = getattr(config, field)
+    if value:
+        return _ok(field, '***' if masked else value)
+    return _err(field, None, f"Set {env_var} environment variable")
 
-    # Database Secret Name
-    if config.db_secret_name:
-        results.append(create_validation_result(
-            '✅', 'db_secret_name', config.db_secret_name))
-    else:
-        results.append(create_validation_result(
-            '❌', 'db_secret_name', None, "Set DB_SECRET_NAME environment variable"))
-
-    # Encryption Key Secret Name
-    if config.encryption_key_secret_name:
-        results.append(create_validation_result(
-            '✅', 'encryption_key_secret_name', config.encryption_key_secret_name))
-    else:
-        results.append(create_validation_result(
-            '❌', 'encryption_key_secret_name',
-            None, "Set ENCRYPTION_KEY_SECRET_NAME environment variable"))
 
-    return results
+def validate_aws_config() -> List[Dict[str, Any]]:
+    """Validate AWS configuration and return detailed results."""
+    return [_check_required(setting) for setting in AWS_SETTINGS]
+
+
+def validate_database_config() -> List[Dict[str, Any]]:
+    """Validate database configuration and return detailed results."""
+    return [_check_required(setting) for setting in DATABASE_SETTINGS]
 
 
 def validate_ring_config() -> List[Dict[str, Any]]:
@@ -78,8 +65,8 @@ def validate_ring_config() -> List[Dict[str, Any]]:
     results = []
 
     # Ring credentials are stored in database, which is the correct approach
-    results.append(create_validation_result(
-        '✅', 'ring_credentials', 'database_stored',
+    results.append(_ok(
+        'ring_credentials', 'database_stored',
         "Ring authentication is handled via the vendors database table"))
 
     return results
@@ -87,77 +74,12 @@ def validate_ring_config() -> List[Dict[str, Any]]:
 
 def validate_app_config() -> List[Dict[str, Any]]:
     """Validate application configuration and return detailed results."""
-
-    results = []
-
-    # S3 Event Recordings Bucket
-    if config.event_recordings_bucket:
-        results.append(create_validation_result(
-            '✅', 'event_recordings_bucket', config.event_recordings_bucket))
-    else:
-        results.append(create_validation_result(
-            '❌', 'event_recordings_bucket',
-            None, "Set EVENT_RECORDINGS_BUCKET environment variable"))
-
-    # Rekognition Collection ID
-    if config.rekognition_collection_id:
-        results.append(create_validation_result(
-            '✅', 'rekognition_collection_id', config.rekognition_collection_id))
-    else:
-        results.append(create_validation_result(
-            '❌', 'rekognition_collection_id',
-            None, "Set REKOGNITION_COLLECTION_ID environment variable"))
-
-    # Rekognition Known Faces Bucket
-    if config.rekognition_s3_known_faces_bucket:
-        results.append(
-            create_validation_result(
-                '✅',
-                'rekognition_s3_known_faces_bucket',
-                config.rekognition_s3_known_faces_bucket))
-    else:
-        results.append(
-            create_validation_result(
-                '❌',
-                'rekognition_s3_known_faces_bucket',
-                None,
-                "Set REKOGNITION_S3_KNOWN_FACES_BUCKET environment variable"))
-
-    # SNS Topic ARN
-    if config.sns_rekognition_video_analysis_topic_arn:
-        results.append(
-            create_validation_result(
-                '✅',
-                'sns_rekognition_video_analysis_topic_arn',
-                config.sns_rekognition_video_analysis_topic_arn))
-    else:
-        results.append(
-            create_validation_result(
-                '❌',
-                'sns_rekognition_video_analysis_topic_arn',
-                None,
-                "Set SNS_REKOGNITION_VIDEO_ANALYSIS_TOPIC_ARN environment variable"))
-
-    # Rekognition Service Role ARN
-    if config.rekognition_video_service_role_arn:
-        results.append(
-            create_validation_result(
-                '✅',
-                'rekognition_video_service_role_arn',
-                config.rekognition_video_service_role_arn))
-    else:
-        results.append(
-            create_validation_result(
-                '❌',
-                'rekognition_video_service_role_arn',
-                None,
-                "Set REKOGNITION_VIDEO_SERVICE_ROLE_ARN environment variable"))
+    results = [_check_required(setting) for setting in APP_SETTINGS]
 
     # Environment
-    results.append(create_validation_result(
-        'ℹ️', 'environment', config.environment))
+    results.append(_info('environment', config.environment))
 
     # Debug Mode
-    results.append(create_validation_result('ℹ️', 'debug', config.debug))
+    results.append(_info('debug', config.debug))
 
     return results
@@ -27,7 +27,7 @@ class ConnectionManagerBase(ABC):
         """Logout from the service."""
 
     @abstractmethod
-    async def is_healthy(self) -> bool:
+    def is_healthy(self) -> bool:
         """Check if the connection is healthy."""
 
     @abstractmethod
@@ -1,10 +1,10 @@
 """Factory for creating connection manager instances."""
 
-from typing import Dict, Type
+import importlib
+from typing import Dict, Tuple, Type
 
 from connection_managers.connection_manager_base import ConnectionManagerBase
 from connection_managers.plugin_type import PluginType
-from connection_managers.ring_connection_manager import RingConnectionManager
 from utils.logging_config import get_logger
 
 # Configure Logger for this file
@@ -16,7 +16,11 @@ class ConnectionManagerFactory:
     Factory for creating connection managers.
     Handles the creation of different types of connection managers based on the plugin type.
     """
-    _connection_managers: Dict[PluginType, Type[ConnectionManagerBase]] = {}
+    # (module, class name) per plugin type; a module is imported only when its type is created
+    _connection_managers: Dict[PluginType, Tuple[str, str]] = {
+        PluginType.RING: ('connection_managers.ring_connection_manager', 'RingConnectionManager'),
+    }
+    _resolved_classes: Dict[PluginType, Type[ConnectionManagerBase]] = {}
 
     @classmethod
     def create(cls, plugin_type: PluginType) -> ConnectionManagerBase:
@@ -32,9 +36,14 @@ class ConnectionManagerFactory:
         Raises:
             ValueError: If the plugin type is not supported.
         """
-
-        if plugin_type == PluginType.RING:
-            return RingConnectionManager()
-
-        LOGGER.error("Unsupported plugin type: %s", plugin_type)
-        raise ValueError(f"Unsupported plugin type: {plugin_type}")
+        manager_class = cls._resolved_classes.get(plugin_type)
+        if manager_class is None:
+            location = cls._connection_managers.get(plugin_type)
+            if location is None:
+                LOGGER.error("Unsupported plugin type: %s", plugin_type)
+                raise ValueError(f"Unsupported plugin type: {plugin_type}")
+            module_name, class_name = location
+            manager_class = getattr(importlib.import_module(module_name), class_name)
+            cls._resolved_classes[plugin_type] = manager_class
+
+        return manager_class()
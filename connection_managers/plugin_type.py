@@ -3,7 +3,10 @@
 from enum import Enum
 
 
-class PluginType(Enum):
-    """Enumeration of supported plugin types for connection managers."""
+class PluginType(str, Enum):
+    """Enumeration of supported plugin types for connection managers.
+
+    Mixes in str so members hash as their value when used as registry keys.
+    """
 
     RING = "RING"
@@ -1,8 +1,14 @@
 """Ring connection manager for handling authentication and session management."""
 
+import asyncio
+import functools
 import json
+import logging
+import threading
+import time
+import weakref
 from datetime import datetime
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence
 
 from ring_doorbell import Auth, Ring, Requires2FAError, RingDoorBell, AuthenticationError, RingError
 
@@ -24,6 +30,85 @@ from watch_tower.registry.connection_manager_registry import (
 # Configure logger for this module
 LOGGER = get_logger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# A Ring refresh younger than this (seconds) is reused by health checks and camera listings
+DATA_MAX_AGE = 10.0
+
+
+def _load_token(raw: Any) -> Dict[str, Any]:
+    """Parse a stored token from the bytes or memoryview of the token column."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    # json.loads takes bytes directly; bytes() also covers memoryview
+    return json.loads(bytes(raw))
+
+
+def _dump_token(token: Dict[str, Any]) -> bytes:
+    """Serialise a token for the token column."""
+    if orjson is not None:
+        return orjson.dumps(token)
+    return json.dumps(token).encode('utf-8')
+
+
+class RingDeviceIndex:
+    """Video devices of a Ring account, indexed by name and by ID.
+
+    Cameras refresh the index from executor threads, so refreshes are
+    serialised by a lock and each one swaps in fully built collections.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.devices: List[RingDoorBell] = []
+        self.by_name: Dict[str, RingDoorBell] = {}
+        self.by_id: Dict[str, RingDoorBell] = {}
+        self.last_refresh: Optional[float] = None
+
+    def is_fresh(self, max_age: float) -> bool:
+        """Check whether the index was refreshed less than max_age seconds ago."""
+        return self.last_refresh is not None and time.monotonic() - self.last_refresh < max_age
+
+    def refresh(self, ring: Ring) -> None:
+        """Refresh the Ring data and rebuild the index from its video devices."""
+        ring.update_data()
+        devices = list(ring.video_devices())
+        by_name = {device.name: device for device in devices}
+        by_id = {str(device.id): device for device in devices}
+        self.devices, self.by_name, self.by_id = devices, by_name, by_id
+        self.last_refresh = time.monotonic()
+
+
+# One index per Ring session; dropped along with the session
+_DEVICE_INDEXES: 'weakref.WeakKeyDictionary[Ring, RingDeviceIndex]' = weakref.WeakKeyDictionary()
+_DEVICE_INDEXES_LOCK = threading.Lock()
+
+
+def get_device_index(ring: Ring, max_age: float) -> RingDeviceIndex:
+    """
+    Get the device index of a Ring session, refreshing it if it is older than max_age.
+
+    Args:
+        ring: The Ring session
+        max_age: Seconds for which a refresh is reused; 0 always refreshes
+
+    Returns:
+        The device index of the session
+    """
+    with _DEVICE_INDEXES_LOCK:
+        index = _DEVICE_INDEXES.get(ring)
+        if index is None:
+            index = _DEVICE_INDEXES[ring] = RingDeviceIndex()
+    if not index.is_fresh(max_age):
+        with index.lock:
+            # Another thread may have refreshed while this one waited
+            if not index.is_fresh(max_age):
+                index.refresh(ring)
+    return index
+
 
 class RingConnectionManager(ConnectionManagerBase):
     """
@@ -32,7 +117,6 @@ class RingConnectionManager(ConnectionManagerBase):
     """
     _user_agent: str = "WatchTower API"
     _plugin_type: PluginType = PluginType.RING
-    _vendor_repository: VendorsRepository = VendorsRepository()
 
     def __init__(self) -> 'RingConnectionManager':
         """
@@ -45,6 +129,17 @@ class RingConnectionManager(ConnectionManagerBase):
         self._is_authenticated: bool = False
         LOGGER.info("Created new RingConnectionManager instance")
 
+    @functools.cached_property
+    def _vendor_repository(self) -> VendorsRepository:
+        """Vendors repository, created on first use rather than at import."""
+        return VendorsRepository()
+
+    @functools.cached_property
+    def _session_factory(self) -> Any:
+        """Database session factory, looked up once per manager."""
+        _, session_factory = get_database_connection()
+        return session_factory
+
     async def login(self) -> None:
         """
         Authenticates with the Ring API using token from database if available,
@@ -56,8 +151,7 @@ class RingConnectionManager(ConnectionManagerBase):
             return
 
         LOGGER.info("Attempting to login with database token")
-        _, session_factory = get_database_connection()
-        with session_factory() as session:
+        with self._session_factory() as session:
             vendor = self._vendor_repository.get_by_field(
                 session, 'plugin_type', self._plugin_type)
             success = False
@@ -65,7 +159,7 @@ class RingConnectionManager(ConnectionManagerBase):
             try:
                 # Try authentication with existing token first
                 try:
-                    if await self._authenticate_with_existing_token():
+                    if await self._authenticate_with_existing_token(vendor):
                         LOGGER.info("Successfully authenticated with existing token")
                         success = True
                 except (AuthenticationError, RingError) as exc:
@@ -128,15 +222,32 @@ class RingConnectionManager(ConnectionManagerBase):
         """
         Checks if the Ring connection is healthy by verifying the authentication state.
         Returns True if authenticated, False otherwise.
+
+        A Ring data refresh from the last DATA_MAX_AGE seconds, including
+        one made while polling cameras, counts as a successful check.
         """
         try:
             if self._ring is None:
                 return False
-            self._ring.update_data()
+            get_device_index(self._ring, DATA_MAX_AGE)
             return True
         except (RingError, AuthenticationError):
             return False
 
+    def update_data_cached(self, max_age: float) -> None:
+        """
+        Refresh the Ring data unless it was refreshed less than max_age seconds ago.
+
+        Cameras sharing this connection share the refresh, so polling several
+        cameras in one cycle reaches the Ring API once.
+
+        Args:
+            max_age: Seconds for which a refresh is reused
+        """
+        if self._ring is None:
+            return
+        get_device_index(self._ring, max_age)
+
     async def get_cameras(self) -> Optional[Sequence[RingDoorBell]]:
         """
         Retrieves a list of Ring cameras associated with the authenticated account.
@@ -147,54 +258,53 @@ class RingConnectionManager(ConnectionManagerBase):
             return None
         if self._ring is None:
             return None
-        self._ring.update_data()
-        cameras = self._ring.video_devices()
+        cameras = list(get_device_index(self._ring, DATA_MAX_AGE).devices)
         if cameras:
-            LOGGER.info(
-                "Successfully retrieved %d cameras: %r",
-                len(cameras), cameras)
+            LOGGER.info("Successfully retrieved %d cameras", len(cameras))
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Camera ids: %s", [camera.id for camera in cameras])
             return cameras
         LOGGER.info("No cameras found in response")
         return []
 
     def token_updated(self, token: Dict[str, Any],
                       vendor_id: Optional[int] = None) -> None:
-        """Callback for when token is updated."""
-        if vendor_id is None:
-            LOGGER.error(
-                "token_updated called without vendor_id - "
-                "token may not be saved correctly")
-            # Try to get vendor_id from database
-            _, session_factory = get_database_connection()
-            with session_factory() as session:
+        """Callback for when token is updated.
+
+        The in-memory registry is updated only once the token is committed, so
+        it never holds a token the database does not.
+        """
+        expire_dt = datetime.fromtimestamp(token['expires_at'])
+        with self._session_factory() as session:
+            if vendor_id is None:
+                LOGGER.error(
+                    "token_updated called without vendor_id - "
+                    "token may not be saved correctly")
+                # Try to get vendor_id from database
                 vendor = self._vendor_repository.get_by_field(
                     session, 'plugin_type', self._plugin_type)
-                if vendor:
-                    vendor_id = vendor.vendor_id
-                else:
+                if not vendor:
                     LOGGER.error("Could not find vendor to update token")
                     return
+                vendor_id = vendor.vendor_id
 
-        expire_dt = datetime.fromtimestamp(token['expires_at'])
-        # Update in-memory registry
-        registry_entry = connection_manager_registry.connection_managers[
-            self._plugin_type]
-        registry_entry['token'] = token
-        registry_entry['expires_at'] = expire_dt
-
-        # Update database
-        _, session_factory = get_database_connection()
-        with session_factory() as session:
+            # Update database
             self._vendor_repository.update_token(
                 session,
                 vendor_id,
-                json.dumps(token),
+                _dump_token(token),
                 expire_dt  # Pass datetime object, not string
             )
             inc_counter_metric(MetricDataPointName.RING_TOKEN_UPDATE_SUCCESS_COUNT)
             LOGGER.info(
                 "Token updated in database for vendor_id: %d", vendor_id)
 
+        # Update in-memory registry
+        registry_entry = connection_manager_registry.connection_managers[
+            self._plugin_type]
+        registry_entry['token'] = token
+        registry_entry['expires_at'] = expire_dt
+
     @staticmethod
     def otp_callback() -> str:
         """
@@ -208,56 +318,46 @@ class RingConnectionManager(ConnectionManagerBase):
             LOGGER.error("Failed to get 2FA code: %s", e)
             raise
 
-    async def _authenticate_with_existing_token(self) -> bool:
-        """Authenticate using an existing token from the database."""
-        _, session_factory = get_database_connection()
-        with session_factory() as session:
-            vendor = self._vendor_repository.get_by_field(
-                session, 'plugin_type', self._plugin_type)
-            LOGGER.info("Found vendor in database: %r", vendor)
-            if vendor and vendor.token:
-                LOGGER.info("Loading token from database")
-                # Convert memoryview or bytes to string before parsing JSON
-                if hasattr(vendor.token, 'tobytes'):
-                    token_str = vendor.token.tobytes().decode('utf-8')
-                else:
-                    # Already bytes, just decode
-                    token_str = vendor.token.decode('utf-8')
-                token = json.loads(token_str)
+    async def _authenticate_with_existing_token(self, vendor: Any) -> bool:
+        """Authenticate using the vendor's existing token from the database."""
+        LOGGER.info("Found vendor in database: %r", vendor)
+        if vendor and vendor.token:
+            LOGGER.info("Loading token from database")
+            token = _load_token(vendor.token)
+            LOGGER.info(
+                "Token expiration: %s, Current time: %s",
+                token['expires_at'], time.time())
+            if token:
+                # Create a lambda that captures vendor_id for the callback
+                def token_callback(token):
+                    return self.token_updated(token, vendor.vendor_id)
+
+                self._auth = Auth(
+                    self._user_agent,
+                    token,
+                    token_callback  # Use lambda with vendor_id
+                )
+                self._ring = Ring(self._auth)
+                LOGGER.debug("Created Ring object")
+                self._ring.create_session()
+                LOGGER.info("Created Ring session")
+                self._is_authenticated = True
+
+                # Update in-memory registry
+                registry_entry = (
+                    connection_manager_registry.connection_managers[
+                        self._plugin_type])
+                registry_entry['status'] = RegistryVendorStatus.ACTIVE
+                registry_entry['token'] = token
+                registry_entry['expires_at'] = datetime.fromtimestamp(
+                    token['expires_at'])
+
                 LOGGER.info(
-                    "Token expiration: %s, Current time: %s",
-                    token['expires_at'], datetime.now().timestamp())
-                if token:
-                    # Create a lambda that captures vendor_id for the callback
-                    def token_callback(token):
-                        return self.token_updated(token, vendor.vendor_id)
-
-                    self._auth = Auth(
-                        self._user_agent,
-                        token,
-                        token_callback  # Use lambda with vendor_id
-                    )
-                    self._ring = Ring(self._auth)
-                    LOGGER.info("Created Ring object: %r", self._ring)
-                    self._ring.create_session()
-                    LOGGER.info("Created Ring session")
-                    self._is_authenticated = True
-
-                    # Update in-memory registry
-                    registry_entry = (
-                        connection_manager_registry.connection_managers[
-                            self._plugin_type])
-                    registry_entry['status'] = RegistryVendorStatus.ACTIVE
-                    registry_entry['token'] = token
-                    registry_entry['expires_at'] = datetime.fromtimestamp(
-                        token['expires_at'])
-
-                    LOGGER.info(
-                        "Successfully connected to Ring using database token")
-                    return True
-                LOGGER.info("Existing token not found")
-            else:
-                LOGGER.info("No token found in database")
+                    "Successfully connected to Ring using database token")
+                return True
+            LOGGER.info("Existing token not found")
+        else:
+            LOGGER.info("No token found in database")
         return False
 
     async def _authenticate_with_credentials(self, vendor: Any) -> bool:
@@ -267,7 +367,9 @@ class RingConnectionManager(ConnectionManagerBase):
             "performing new authentication")
         username = vendor.username
         password = decrypt(vendor.password_enc)
-        self._auth = self.perform_auth(username, password, vendor.vendor_id)
+        # Token fetch and any 2FA prompt block, so keep them off the event loop
+        self._auth = await asyncio.get_running_loop().run_in_executor(
+            None, self.perform_auth, username, password, vendor.vendor_id)
         self._ring = Ring(self._auth)
         registry_entry = connection_manager_registry.connection_managers[
             self._plugin_type]
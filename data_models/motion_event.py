@@ -13,6 +13,9 @@ except ImportError:
     import pytz
     ZoneInfo = pytz.timezone
 
+# Parsed once rather than per event
+LA_TZ = ZoneInfo("America/Los_Angeles")
+
 
 @dataclass
 class MotionEvent:
@@ -52,7 +55,7 @@ class MotionEvent:
                 timestamp.replace("Z", "+00:00"))
 
         # Convert to Pacific time
-        timestamp = timestamp.astimezone(ZoneInfo("America/Los_Angeles"))
+        timestamp = timestamp.astimezone(LA_TZ)
 
         doorbot = event.get("doorbot")
         if doorbot is None:
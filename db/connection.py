@@ -59,9 +59,29 @@ def get_engine():
         raise DatabaseConnectionError(f"Failed to create database engine: {e}") from e
 
 
+@lru_cache(maxsize=1)
+def _create_session_factory(db_engine) -> sessionmaker:
+    """
+    Create the session factory bound to an engine.
+    Keyed on the engine so that the factory is rebuilt only if the engine is.
+
+    Args:
+        db_engine: SQLAlchemy engine to bind sessions to
+
+    Returns:
+        sessionmaker: SQLAlchemy session factory
+    """
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=db_engine
+    )
+
+
 def get_session_factory():
     """
     Get or create the session factory.
+    The factory is shared by all callers so sessions borrow from the single engine pool.
 
     Returns:
         sessionmaker: SQLAlchemy session factory
@@ -70,12 +90,7 @@ def get_session_factory():
         DatabaseConnectionError: If there are issues creating the session factory
     """
     try:
-        db_engine = get_engine()
-        return sessionmaker(
-            autocommit=False,
-            autoflush=False,
-            bind=db_engine
-        )
+        return _create_session_factory(get_engine())
     except DatabaseConnectionError:
         raise
     except Exception as e:
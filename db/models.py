@@ -74,6 +74,16 @@ class MotionEvent(BASE):
     )
 
 
+# Equality lookups of the Ring event ID stored in the event metadata; the
+# expression must match MotionEventRepository.get_by_ring_event_id for the
+# planner to use it
+Index(
+    'idx_motion_events_event_id',
+    MotionEvent.event_metadata['event_id'].as_string(),
+    postgresql_using='hash'
+)
+
+
 class VisitorLogs(BASE):
     """Database model for visitor log entries."""
     __tablename__ = 'visitor_logs'
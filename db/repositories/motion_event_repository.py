@@ -7,10 +7,13 @@ from sqlalchemy import and_, cast, String
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from db.exceptions import DatabaseTransactionError
+from db.exceptions import (
+    DatabaseEventNotFoundError,
+    DatabaseMultipleEventsFoundError,
+    DatabaseTransactionError,
+)
 from db.models import MotionEvent
 from db.repositories.base import BaseRepository
-from db.exceptions import DatabaseTransactionError
 from utils.logging_config import get_logger
 from utils.metric_helpers import inc_counter_metric
 from utils.metrics import MetricDataPointName
@@ -58,6 +61,58 @@ class MotionEventRepository(BaseRepository[MotionEvent]):
             )
         ).all()
 
+    def get_by_ring_event_id(self, db: Session, ring_event_id: str) -> MotionEvent:
+        """Get the motion event for a Ring event ID.
+
+        The lookup uses the idx_motion_events_event_id expression index and
+        fetches at most two rows, enough to detect duplicates.
+
+        Args:
+            db: Database session
+            ring_event_id: The Ring event ID stored in event_metadata
+
+        Returns:
+            The matching motion event
+
+        Raises:
+            DatabaseEventNotFoundError: If no event matches
+            DatabaseMultipleEventsFoundError: If more than one event matches
+            DatabaseTransactionError: If the query fails
+        """
+        success = False
+        try:
+            events = db.query(self.model).filter(
+                self.model.event_metadata['event_id'].as_string() == str(ring_event_id)
+            ).limit(2).all()
+            success = True
+        except SQLAlchemyError as e:
+            LOGGER.error("Failed to query for events by ring event ID: %s", e)
+            raise DatabaseTransactionError(
+                f"Failed to query for events by ring event ID: {str(e)}") from e
+        finally:
+            if success:
+                inc_counter_metric(
+                    MetricDataPointName.DATABASE_TRANSACTION_SUCCESS_COUNT,
+                    labels={"table": self.model.__table__.name},
+                    increment=1,
+                )
+            else:
+                inc_counter_metric(
+                    MetricDataPointName.DATABASE_TRANSACTION_FAILURE_COUNT,
+                    labels={"table": self.model.__table__.name},
+                    increment=1,
+                )
+
+        if not events:
+            LOGGER.error("No database event found for Ring event ID %s", ring_event_id)
+            raise DatabaseEventNotFoundError(
+                f"No database event found for Ring event ID {ring_event_id}")
+        if len(events) > 1:
+            LOGGER.error("Multiple database events found for Ring event ID %s", ring_event_id)
+            raise DatabaseMultipleEventsFoundError(
+                f"Multiple database events found for Ring event ID {ring_event_id}")
+        return events[0]
+
     def get_by_ring_event_id_and_camera(
             self,
             db: Session,
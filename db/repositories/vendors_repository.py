@@ -1,7 +1,7 @@
 """Repository for vendor database operations."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from sqlalchemy.orm import Session
 
@@ -29,10 +29,10 @@ class VendorsRepository(BaseRepository[Vendors]):
         """Get all vendors of a specific plugin type"""
         return self.get_all_by_field(db, "plugin_type", plugin_type)
 
-    def update_token(self, db: Session, vendor_id: int, token: str,
+    def update_token(self, db: Session, vendor_id: int, token: Union[str, bytes],
                      token_expires: datetime) -> Optional[Vendors]:
         """Update vendor's token and expiration"""
-        # Convert token string to bytes for LargeBinary field
+        # Convert a token string to bytes for the LargeBinary field
         token_bytes = token.encode('utf-8') if isinstance(token, str) else token
         return self.update(db, vendor_id, {
             "token": token_bytes,
@@ -1,7 +1,7 @@
 """Repository for visitor log database operations."""
 
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 from sqlalchemy import and_, func
 from sqlalchemy.orm import Session
@@ -9,6 +9,9 @@ from sqlalchemy.orm import Session
 from db.models import VisitorLogs
 from db.repositories.base import BaseRepository
 
+# Rows fetched from the cursor at a time when streaming query results
+STREAM_BATCH_SIZE = 256
+
 
 class VisitorLogRepository(BaseRepository[VisitorLogs]):
     """Repository for managing visitor log database operations."""
@@ -92,3 +95,14 @@ class VisitorLogRepository(BaseRepository[VisitorLogs]):
         return db.query(self.model).order_by(
             self.model.visited_at.desc()
         ).limit(limit).all()
+
+    def iter_recent_entries(self, db: Session, limit: int = 10) -> Iterator[VisitorLogs]:
+        """Stream the most recent visitor log entries, newest first.
+
+        Rows are fetched from the cursor in batches of STREAM_BATCH_SIZE, so
+        large limits are never held in memory at once. The session must stay
+        open while the iterator is consumed.
+        """
+        return iter(db.query(self.model).order_by(
+            self.model.visited_at.desc()
+        ).limit(limit).yield_per(STREAM_BATCH_SIZE))
@@ -64,6 +64,7 @@ CREATE TABLE IF NOT EXISTS public.visitor_logs (
 -- Create indexes for better query performance
 CREATE INDEX IF NOT EXISTS idx_visitor_logs_visited_at ON public.visitor_logs(visited_at);
 CREATE INDEX IF NOT EXISTS idx_motion_events_camera_time ON public.motion_events(camera_name, motion_detected);
+CREATE INDEX IF NOT EXISTS idx_motion_events_event_id ON public.motion_events USING hash ((CAST(event_metadata->>'event_id' AS VARCHAR)));
 
 -- Create function to update updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -1,13 +1,16 @@
 """Tests for the RekognitionService class."""
 # pylint: disable=redefined-outer-name
+import asyncio
+import json
 from typing import Generator
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
-from botocore.exceptions import ClientError
+from botocore.exceptions import ClientError, EndpointConnectionError
 
 from aws.exceptions import RekognitionError, RekognitionResourceNotFoundException
-from aws.rekognition.rekognition_service import RekognitionService, RUNNING_FACE_SEARCH_JOBS
+from aws.rekognition.rekognition_service import (
+    RekognitionService, RUNNING_FACE_SEARCH_JOBS, parse_s3_location)
 
 # Test data
 TEST_COLLECTION_ID = "test-collection"
@@ -39,6 +42,7 @@ def mock_config() -> Generator[Mock, None, None]:
         patched_config.rekognition_video_service_role_arn = 'test-role-arn'
         patched_config.event_recordings_bucket = 'test-event-recordings-bucket'
         patched_config.video.polling_interval = 10
+        patched_config.rekognition_sqs_queue_url = ''
         yield patched_config
 
 
@@ -133,6 +137,7 @@ def test_check_collection_exists_not_found(
     with pytest.raises(RekognitionResourceNotFoundException) as exc_info:
         rekognition_service.check_collection_exists(TEST_COLLECTION_ID)
     assert str(exc_info.value) == f"Collection {TEST_COLLECTION_ID} not found"
+    assert isinstance(exc_info.value.__cause__, ClientError)
 
 
 def test_index_faces_success(
@@ -148,14 +153,31 @@ def test_index_faces_success(
     # Mock Rekognition response
     mock_rekognition_client.index_faces.return_value = {'JobId': TEST_JOB_ID}
 
-    job_id = rekognition_service.index_faces(TEST_PERSON_ID)
+    job_ids = rekognition_service.index_faces(TEST_PERSON_ID)
 
-    assert job_id == TEST_JOB_ID
+    assert job_ids == [TEST_JOB_ID, TEST_JOB_ID]
     assert mock_rekognition_client.index_faces.call_count == 2
     mock_s3_service.get_files_with_prefix.assert_called_once_with(
         TEST_BUCKET_NAME, TEST_PERSON_ID)
 
 
+def test_index_faces_client_error(
+        rekognition_service: RekognitionService,
+        mock_rekognition_client: Mock,
+        mock_s3_service: Mock
+) -> None:
+    """Test that an IndexFaces failure on any image raises RekognitionError."""
+    mock_s3_service.get_files_with_prefix.return_value = [
+        'test/person1.jpg', 'test/person2.jpg']
+    mock_rekognition_client.index_faces.side_effect = [
+        {'JobId': TEST_JOB_ID},
+        ClientError({'Error': {'Code': 'InvalidImageFormatException'}}, 'IndexFaces')
+    ]
+
+    with pytest.raises(RekognitionError, match="Error indexing faces"):
+        rekognition_service.index_faces(TEST_PERSON_ID)
+
+
 def test_index_faces_no_files(
         rekognition_service: RekognitionService,
         mock_s3_service: Mock
@@ -273,6 +295,34 @@ async def test_get_face_search_results_polling(
     assert mock_rekognition_client.get_face_search.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_get_face_search_results_paginated(
+        rekognition_service: RekognitionService,
+        mock_rekognition_client: Mock
+) -> None:
+    """Test that every page of face search results is read."""
+    mock_rekognition_client.get_face_search.side_effect = [
+        {
+            'JobStatus': 'SUCCEEDED',
+            'NextToken': 'page-2',
+            'Persons': [{'Timestamp': 1000, 'FaceMatches': [
+                {'Face': {'FaceId': 'face1', 'ExternalImageId': 'person1'}, 'Similarity': 90.0}]}]
+        },
+        {
+            'JobStatus': 'SUCCEEDED',
+            'Persons': [{'Timestamp': 2000, 'FaceMatches': [
+                {'Face': {'FaceId': 'face2', 'ExternalImageId': 'person2'}, 'Similarity': 80.0}]}]
+        }
+    ]
+
+    matches = await rekognition_service.get_face_search_results(TEST_JOB_ID)
+
+    assert [match['face_id'] for match in matches] == ['face1', 'face2']
+    assert matches[1]['timestamp'] == 2000
+    mock_rekognition_client.get_face_search.assert_called_with(
+        JobId=TEST_JOB_ID, NextToken='page-2')
+
+
 @pytest.mark.asyncio
 async def test_start_face_search_job_already_running(
         rekognition_service: RekognitionService,
@@ -293,6 +343,27 @@ async def test_start_face_search_job_already_running(
         RUNNING_FACE_SEARCH_JOBS.discard(TEST_VIDEO_PATH)
 
 
+@pytest.mark.asyncio
+async def test_start_face_search_concurrent_calls_coalesced(
+        rekognition_service: RekognitionService,
+        mock_rekognition_client: Mock
+) -> None:
+    """Test concurrent face searches for one video start a single job and skip the duplicate."""
+    mock_rekognition_client.start_face_search.return_value = {'JobId': TEST_JOB_ID}
+    mock_rekognition_client.get_face_search.return_value = {
+        'JobStatus': 'SUCCEEDED',
+        'Persons': []
+    }
+
+    results = await asyncio.gather(
+        rekognition_service.start_face_search(TEST_VIDEO_PATH),
+        rekognition_service.start_face_search(TEST_VIDEO_PATH))
+
+    assert results == [([], False), ([], True)]
+    mock_rekognition_client.start_face_search.assert_called_once()
+    assert TEST_VIDEO_PATH not in RUNNING_FACE_SEARCH_JOBS
+
+
 @pytest.mark.asyncio
 async def test_start_face_search_s3_url_format(
         rekognition_service: RekognitionService,
@@ -418,6 +489,21 @@ async def test_start_face_search_invalid_http_url_format(
     mock_rekognition_client.start_face_search.assert_not_called()
 
 
+@pytest.mark.parametrize("location, expected", [
+    ("https://my.bucket.s3-accelerate.amazonaws.com/path/video.mp4?versionId=1",
+     ("my.bucket", "path/video.mp4")),
+    ("https://my-bucket.s3.dualstack.us-east-1.amazonaws.com/video.mp4", ("my-bucket", "video.mp4")),
+    ("path/to/video.mp4", ("test-event-recordings-bucket", "path/to/video.mp4")),
+])
+def test_parse_s3_location(
+        mock_config: Mock,  # pylint: disable=unused-argument
+        location: str,
+        expected: tuple
+) -> None:
+    """Test S3 location parsing for accelerated, dualstack and bare-key forms."""
+    assert parse_s3_location(location) == expected
+
+
 @pytest.mark.asyncio
 async def test_start_face_search_client_error_during_start(
         rekognition_service: RekognitionService,
@@ -590,3 +676,141 @@ async def test_get_face_search_results_multiple_persons(
     assert len(matches) == 2
     assert any(m['external_image_id'] == 'person1' and m['timestamp'] == 1000 for m in matches)
     assert any(m['external_image_id'] == 'person2' and m['timestamp'] == 2000 for m in matches)
+
+
+@pytest.mark.asyncio
+async def test_get_face_search_results_polling_backs_off(
+        rekognition_service: RekognitionService,
+        mock_rekognition_client: Mock
+) -> None:
+    """Test that the polling interval doubles up to the maximum."""
+    mock_rekognition_client.get_face_search.side_effect = [
+        {'JobStatus': 'IN_PROGRESS'},
+        {'JobStatus': 'IN_PROGRESS'},
+        {'JobStatus': 'IN_PROGRESS'},
+        {'JobStatus': 'IN_PROGRESS'},
+        {'JobStatus': 'SUCCEEDED', 'Persons': []}
+    ]
+
+    with patch('aws.rekognition.rekognition_service.asyncio.sleep',
+               new_callable=AsyncMock) as mock_sleep:
+        matches = await rekognition_service.get_face_search_results(TEST_JOB_ID)
+
+    assert matches == []
+    assert [call.args[0] for call in mock_sleep.await_args_list] == [10, 20, 40, 60]
+
+
+@pytest.mark.asyncio
+async def test_get_face_search_results_waits_for_notification(
+        rekognition_service: RekognitionService,
+        mock_rekognition_client: Mock
+) -> None:
+    """Test that a configured SQS queue is long-polled before reading the job status."""
+    def notification(job_id: str) -> str:
+        return json.dumps({'Message': json.dumps({'JobId': job_id, 'Status': 'SUCCEEDED'})})
+
+    sqs_client = Mock()
+    sqs_client.receive_message.side_effect = [
+        {'Messages': [{'Body': notification('other-job'), 'ReceiptHandle': 'other'}]},
+        {'Messages': [{'Body': notification(TEST_JOB_ID), 'ReceiptHandle': 'mine'}]}
+    ]
+    rekognition_service.sqs_client = sqs_client
+    rekognition_service.sqs_queue_url = 'test-queue-url'
+    mock_rekognition_client.get_face_search.return_value = {'JobStatus': 'SUCCEEDED', 'Persons': []}
+
+    with patch('aws.rekognition.rekognition_service.asyncio.sleep',
+               new_callable=AsyncMock) as mock_sleep:
+        matches = await rekognition_service.get_face_search_results(TEST_JOB_ID)
+
+    assert matches == []
+    assert sqs_client.receive_message.call_args.kwargs['WaitTimeSeconds'] == 20
+    # Only this job's notification is consumed; the other one is left for its consumer
+    assert [call.kwargs['ReceiptHandle'] for call in sqs_client.delete_message.call_args_list] == [
+        'mine']
+    sqs_client.change_message_visibility.assert_not_called()
+    mock_rekognition_client.get_face_search.assert_called_once_with(JobId=TEST_JOB_ID)
+    mock_sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_notification_waits_share_one_reader(
+        rekognition_service: RekognitionService
+) -> None:
+    """Test that concurrent jobs are resolved by one SQS reader."""
+    def notification(job_id: str) -> str:
+        return json.dumps({'JobId': job_id, 'Status': 'SUCCEEDED'})
+
+    sqs_client = Mock()
+    sqs_client.receive_message.side_effect = [
+        {'Messages': [
+            {'Body': notification('job-2'), 'ReceiptHandle': 'second'},
+            {'Body': notification('job-1'), 'ReceiptHandle': 'first'},
+        ]}
+    ]
+    rekognition_service.sqs_client = sqs_client
+    rekognition_service.sqs_queue_url = 'test-queue-url'
+
+    await asyncio.gather(
+        rekognition_service._wait_for_completion_notification('job-1'),
+        rekognition_service._wait_for_completion_notification('job-2'))
+
+    sqs_client.receive_message.assert_called_once()
+    assert sqs_client.delete_message.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_notification_wait_times_out(
+        rekognition_service: RekognitionService
+) -> None:
+    """Test that a lost notification ends the wait so the job status is polled."""
+    sqs_client = Mock()
+    sqs_client.receive_message.return_value = {}
+    rekognition_service.sqs_client = sqs_client
+    rekognition_service.sqs_queue_url = 'test-queue-url'
+
+    with patch('aws.rekognition.rekognition_service.NOTIFICATION_WAIT_TIMEOUT', 0.05):
+        await rekognition_service._wait_for_completion_notification(TEST_JOB_ID)
+        await rekognition_service._notification_dispatcher
+
+    assert not rekognition_service._notification_waiters
+    sqs_client.delete_message.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_notification_wait_ends_on_connection_error(
+        rekognition_service: RekognitionService
+) -> None:
+    """Test that a botocore connection error fails every waiter at once."""
+    sqs_client = Mock()
+    sqs_client.receive_message.side_effect = EndpointConnectionError(endpoint_url='test-queue-url')
+    rekognition_service.sqs_client = sqs_client
+    rekognition_service.sqs_queue_url = 'test-queue-url'
+
+    await asyncio.wait_for(asyncio.gather(
+        rekognition_service._wait_for_completion_notification('job-1'),
+        rekognition_service._wait_for_completion_notification('job-2')), 1)
+    await rekognition_service._notification_dispatcher
+
+    assert not rekognition_service._notification_waiters
+
+
+@pytest.mark.asyncio
+async def test_notification_delete_error_still_resolves_waiter(
+        rekognition_service: RekognitionService
+) -> None:
+    """Test that a failed message delete does not leave the job waiting."""
+    sqs_client = Mock()
+    sqs_client.receive_message.return_value = {'Messages': [
+        {'Body': json.dumps({'JobId': TEST_JOB_ID, 'Status': 'SUCCEEDED'}),
+         'ReceiptHandle': 'mine'}]}
+    sqs_client.delete_message.side_effect = ClientError(
+        {'Error': {'Code': 'InternalError', 'Message': 'Internal error'}}, 'DeleteMessage')
+    rekognition_service.sqs_client = sqs_client
+    rekognition_service.sqs_queue_url = 'test-queue-url'
+
+    await asyncio.wait_for(
+        rekognition_service._wait_for_completion_notification(TEST_JOB_ID), 1)
+    await rekognition_service._notification_dispatcher
+
+    sqs_client.receive_message.assert_called_once()
+    sqs_client.delete_message.assert_called_once()
@@ -1,4 +1,5 @@
 """Tests for S3 service functionality."""
+import io
 from typing import Generator
 from unittest.mock import Mock, patch
 
@@ -6,7 +7,8 @@ import pytest
 from botocore.exceptions import ClientError
 
 from aws.exceptions import S3Error, S3ResourceNotFoundException
-from aws.s3.s3_service import S3Service
+from aws.s3.s3_service import STREAM_TRANSFER_CONFIG, S3Service
+from utils.metrics import MetricDataPointName
 
 # Test data
 TEST_BUCKET_NAME = "test-bucket"
@@ -35,6 +37,8 @@ def _mock_config() -> Generator[Mock, None, None]:
 def _mock_s3_client() -> Generator[Mock, None, None]:
     """Create a mock S3 client."""
     with patch('boto3.client') as mock_client:
+        mock_client.return_value.head_object.return_value = {
+            'ContentLength': 4, 'ETag': '"test-etag"'}
         yield mock_client.return_value
 
 
@@ -102,54 +106,50 @@ def test_check_bucket_exists_not_found(
 def test_get_files_with_prefix_success(
         s3_service: S3Service,
         mock_s3_client: Mock) -> None:
-    """Test successful retrieval of files with a given prefix."""
-    mock_s3_client.list_objects_v2.return_value = {
-        'Contents': [
-            {
-                'Key': 'file1.jpg'
-            },
-            {
-                'Key': 'file2.jpg'
-            },
-            {
-                'Key': 'different_prefix_file.jpg'
-            },
-        ]
-    }
+    """Test successful retrieval of files with a given prefix across pages."""
+    mock_paginator = mock_s3_client.get_paginator.return_value
+    mock_paginator.paginate.return_value = [
+        {'Contents': [{'Key': 'file1.jpg'}, {'Key': 'file2.jpg'}]},
+        {'Contents': [{'Key': 'file3.jpg'}]},
+    ]
 
     files = s3_service.get_files_with_prefix(TEST_BUCKET_NAME, 'file')
-    assert len(files) == 2
-    assert 's3://test-bucket/file1.jpg' in files
-    assert 's3://test-bucket/file2.jpg' in files
-    assert 's3://test-bucket/different_prefix_file.jpg' not in files
+    assert files == [
+        's3://test-bucket/file1.jpg',
+        's3://test-bucket/file2.jpg',
+        's3://test-bucket/file3.jpg',
+    ]
+    mock_s3_client.get_paginator.assert_called_once_with('list_objects_v2')
+    mock_paginator.paginate.assert_called_once_with(Bucket=TEST_BUCKET_NAME, Prefix='file')
 
 
 def test_get_files_with_prefix_no_files(
         s3_service: S3Service,
         mock_s3_client: Mock) -> None:
     """Test retrieval of files with a given prefix when no files match."""
-    mock_s3_client.list_objects_v2.return_value = {
-        'Contents': []
-    }
+    mock_paginator = mock_s3_client.get_paginator.return_value
+    mock_paginator.paginate.return_value = [{'KeyCount': 0}]
 
     files = s3_service.get_files_with_prefix(TEST_BUCKET_NAME, 'non_existent_prefix')
     assert len(files) == 0
-    assert mock_s3_client.list_objects_v2.call_count == 1
+    assert mock_paginator.paginate.call_count == 1
 
 
 def test_get_files_with_prefix_error(
         s3_service: S3Service,
         mock_s3_client: Mock) -> None:
     """Test retrieval of files with a given prefix when an error occurs."""
-    mock_s3_client.list_objects_v2.side_effect = ClientError(
-        {'Error': {'Code': '404'}},
+    mock_paginator = mock_s3_client.get_paginator.return_value
+    mock_paginator.paginate.side_effect = ClientError(
+        {'Error': {'Code': 'NoSuchBucket'}},
         'ListObjectsV2'
     )
 
     with pytest.raises(S3ResourceNotFoundException) as exc_info:
         s3_service.get_files_with_prefix(TEST_BUCKET_NAME, 'file')
     assert str(exc_info.value) == f"Bucket {TEST_BUCKET_NAME} not found"
-    assert mock_s3_client.list_objects_v2.call_count == 1
+    assert mock_paginator.paginate.call_count == 1
+    mock_s3_client.head_bucket.assert_not_called()
 
 
 def test_download_file_success(
@@ -161,9 +161,6 @@ def test_download_file_success(
     test_object_key = "test/object.jpg"
     local_path = tmp_path / "downloaded" / "object.jpg"
 
-    # Mock the head_bucket call in check_bucket_exists
-    mock_s3_client.head_bucket.return_value = {}
-
     # Test
     s3_service.download_file(TEST_BUCKET_NAME, test_object_key, str(local_path))
 
@@ -176,6 +173,28 @@ def test_download_file_success(
     assert local_path.parent.exists()
 
 
+def test_download_file_skips_unchanged_object(
+        s3_service: S3Service,
+        mock_s3_client: Mock,
+        tmp_path: pytest.TempPathFactory) -> None:
+    """Test that a second download of an unchanged object is skipped."""
+    test_object_key = "test/object.jpg"
+    local_path = tmp_path / "downloaded" / "object.jpg"
+    mock_s3_client.download_file.side_effect = (
+        lambda bucket, key, path: open(path, 'wb').write(b"data"))
+
+    s3_service.download_file(TEST_BUCKET_NAME, test_object_key, str(local_path))
+    with patch('aws.s3.s3_service.inc_counter_metric') as inc_mock:
+        s3_service.download_file(TEST_BUCKET_NAME, test_object_key, str(local_path))
+    assert mock_s3_client.download_file.call_count == 1
+    inc_mock.assert_called_once_with(MetricDataPointName.AWS_S3_DOWNLOAD_FILE_SKIPPED_COUNT)
+
+    # A changed ETag triggers a fresh download
+    mock_s3_client.head_object.return_value = {'ContentLength': 4, 'ETag': '"new-etag"'}
+    s3_service.download_file(TEST_BUCKET_NAME, test_object_key, str(local_path))
+    assert mock_s3_client.download_file.call_count == 2
+
+
 def test_download_file_bucket_not_found(
         s3_service: S3Service,
         mock_s3_client: Mock,
@@ -185,10 +204,10 @@ def test_download_file_bucket_not_found(
     test_object_key = "test/object.jpg"
     local_path = tmp_path / "downloaded" / "object.jpg"
 
-    # Mock the head_bucket call to simulate bucket not found
-    mock_s3_client.head_bucket.side_effect = ClientError(
-        {'Error': {'Code': '404'}},
-        'HeadBucket'
+    # Mock the head_object call to simulate bucket not found
+    mock_s3_client.head_object.side_effect = ClientError(
+        {'Error': {'Code': 'NoSuchBucket'}},
+        'HeadObject'
     )
 
     # Test and verify
@@ -196,6 +215,7 @@ def test_download_file_bucket_not_found(
         s3_service.download_file(TEST_BUCKET_NAME, test_object_key, str(local_path))
     assert "error downloading file" in str(exc_info.value).lower()
     mock_s3_client.download_file.assert_not_called()
+    mock_s3_client.head_bucket.assert_not_called()
 
 
 def test_download_file_object_not_found(
@@ -207,9 +227,6 @@ def test_download_file_object_not_found(
     test_object_key = "test/object.jpg"
     local_path = tmp_path / "downloaded" / "object.jpg"
 
-    # Mock the head_bucket call in check_bucket_exists
-    mock_s3_client.head_bucket.return_value = {}
-
     # Mock the download_file call to simulate object not found
     mock_s3_client.download_file.side_effect = ClientError(
         {'Error': {'Code': '404'}},
@@ -232,12 +249,64 @@ def test_download_file_creates_directory(
     test_object_key = "test/object.jpg"
     local_path = tmp_path / "new" / "directory" / "object.jpg"
 
-    # Mock the head_bucket call in check_bucket_exists
-    mock_s3_client.head_bucket.return_value = {}
-
     # Test
     s3_service.download_file(TEST_BUCKET_NAME, test_object_key, str(local_path))
 
     # Verify
     assert local_path.parent.exists()
     mock_s3_client.download_file.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_download_many(
+        s3_service: S3Service,
+        mock_s3_client: Mock,
+        tmp_path: pytest.TempPathFactory) -> None:
+    """Test that download_many downloads every requested object."""
+    transfers = [
+        (TEST_BUCKET_NAME, f"test/object{i}.jpg", str(tmp_path / f"object{i}.jpg"))
+        for i in range(3)
+    ]
+
+    await s3_service.download_many(transfers)
+
+    assert mock_s3_client.download_file.call_count == 3
+    for bucket_name, object_key, local_path in transfers:
+        mock_s3_client.download_file.assert_any_call(bucket_name, object_key, local_path)
+
+
+@pytest.mark.asyncio
+async def test_download_many_error(
+        s3_service: S3Service,
+        mock_s3_client: Mock,
+        tmp_path: pytest.TempPathFactory) -> None:
+    """Test that download_many raises once all downloads have finished."""
+    mock_s3_client.download_file.side_effect = [
+        ClientError({'Error': {'Code': '404'}}, 'GetObject'), None]
+    transfers = [
+        (TEST_BUCKET_NAME, "test/missing.jpg", str(tmp_path / "missing.jpg")),
+        (TEST_BUCKET_NAME, "test/object.jpg", str(tmp_path / "object.jpg")),
+    ]
+
+    with pytest.raises(S3Error):
+        await s3_service.download_many(transfers)
+    assert mock_s3_client.download_file.call_count == 2
+
+
+def test_upload_stream_success(s3_service: S3Service, mock_s3_client: Mock) -> None:
+    """Test that upload_stream hands the stream to a multipart upload."""
+    stream = io.BytesIO(b"test video")
+
+    s3_service.upload_stream(stream, TEST_BUCKET_NAME, "test/video.mp4")
+
+    mock_s3_client.upload_fileobj.assert_called_once_with(
+        stream, TEST_BUCKET_NAME, "test/video.mp4", Config=STREAM_TRANSFER_CONFIG)
+
+
+def test_upload_stream_error(s3_service: S3Service, mock_s3_client: Mock) -> None:
+    """Test that upload_stream wraps AWS errors in S3Error."""
+    mock_s3_client.upload_fileobj.side_effect = ClientError(
+        {'Error': {'Code': 'NoSuchBucket'}}, 'PutObject')
+
+    with pytest.raises(S3Error):
+        s3_service.upload_stream(io.BytesIO(b"test video"), TEST_BUCKET_NAME, "test/video.mp4")
@@ -0,0 +1,103 @@
+"""Tests for the Secrets Manager service."""
+# pylint: disable=redefined-outer-name
+import json
+from typing import Generator
+from unittest.mock import Mock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from aws.exceptions import SecretsManagerError
+from aws.secrets_manager.secrets_manager_service import get_db_secret, get_db_secrets, invalidate_db_secret
+
+TEST_SECRET_NAME = "test-secret"
+TEST_SECRET = {"username": "test_user", "password": "test_pass"}
+
+
+@pytest.fixture
+def mock_config() -> Generator[Mock, None, None]:
+    """Mock the configuration to use test values."""
+    with patch('aws.secrets_manager.secrets_manager_service.config') as patched_config:
+        patched_config.secrets_cache_ttl = 300
+        yield patched_config
+
+
+@pytest.fixture
+def mock_client(mock_config: Mock) -> Generator[Mock, None, None]:  # pylint: disable=unused-argument
+    """Create a mock Secrets Manager client and start each test with an empty cache."""
+    invalidate_db_secret()
+    with patch('aws.secrets_manager.secrets_manager_service._get_client') as mock_get_client:
+        mock_get_client.return_value.get_secret_value.return_value = {
+            'SecretString': json.dumps(TEST_SECRET)
+        }
+        yield mock_get_client.return_value
+    invalidate_db_secret()
+
+
+def test_get_db_secret_success(mock_client: Mock) -> None:
+    """Test that a secret is fetched and parsed."""
+    assert get_db_secret(TEST_SECRET_NAME) == TEST_SECRET
+    mock_client.get_secret_value.assert_called_once_with(SecretId=TEST_SECRET_NAME)
+
+
+def test_get_db_secret_cached(mock_client: Mock) -> None:
+    """Test that repeated lookups within the TTL reuse the fetched secret."""
+    get_db_secret(TEST_SECRET_NAME)
+    get_db_secret(TEST_SECRET_NAME)
+    assert mock_client.get_secret_value.call_count == 1
+
+    invalidate_db_secret(TEST_SECRET_NAME)
+    get_db_secret(TEST_SECRET_NAME)
+    assert mock_client.get_secret_value.call_count == 2
+
+
+def test_get_db_secret_cache_disabled(mock_client: Mock, mock_config: Mock) -> None:
+    """Test that a TTL of 0 fetches the secret on every lookup."""
+    mock_config.secrets_cache_ttl = 0
+    get_db_secret(TEST_SECRET_NAME)
+    get_db_secret(TEST_SECRET_NAME)
+    assert mock_client.get_secret_value.call_count == 2
+
+
+def test_get_db_secret_client_error(mock_client: Mock) -> None:
+    """Test that AWS errors are raised as SecretsManagerError and not cached."""
+    mock_client.get_secret_value.side_effect = ClientError(
+        {'Error': {'Code': 'ResourceNotFoundException', 'Message': 'Not found'}},
+        'GetSecretValue'
+    )
+
+    with pytest.raises(SecretsManagerError, match="ResourceNotFoundException"):
+        get_db_secret(TEST_SECRET_NAME)
+    with pytest.raises(SecretsManagerError):
+        get_db_secret(TEST_SECRET_NAME)
+    assert mock_client.get_secret_value.call_count == 2
+
+
+def test_get_db_secrets_batched(mock_client: Mock) -> None:
+    """Test that uncached secrets are fetched in a single batch request."""
+    get_db_secret(TEST_SECRET_NAME)
+    mock_client.batch_get_secret_value.return_value = {
+        'SecretValues': [
+            {'Name': 'other-secret', 'ARN': 'arn:other', 'SecretString': json.dumps({'key': 'value'})}
+        ],
+        'Errors': []
+    }
+
+    secrets = get_db_secrets([TEST_SECRET_NAME, 'other-secret'])
+
+    assert secrets == {TEST_SECRET_NAME: TEST_SECRET, 'other-secret': {'key': 'value'}}
+    mock_client.batch_get_secret_value.assert_called_once_with(SecretIdList=['other-secret'])
+    # Batched results are cached for single lookups too
+    assert get_db_secret('other-secret') == {'key': 'value'}
+    assert mock_client.get_secret_value.call_count == 1
+
+
+def test_get_db_secrets_access_denied_fallback(mock_client: Mock) -> None:
+    """Test that secrets are fetched one by one when the batch API is not permitted."""
+    mock_client.batch_get_secret_value.side_effect = ClientError(
+        {'Error': {'Code': 'AccessDeniedException', 'Message': 'Denied'}},
+        'BatchGetSecretValue'
+    )
+
+    assert get_db_secrets([TEST_SECRET_NAME]) == {TEST_SECRET_NAME: TEST_SECRET}
+    mock_client.get_secret_value.assert_called_once_with(SecretId=TEST_SECRET_NAME)
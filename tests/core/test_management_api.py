@@ -0,0 +1,246 @@
+"""Tests for the management API health endpoint."""
+import asyncio
+import json
+from typing import Any, Callable, Dict, List, Tuple
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from fastapi import FastAPI, HTTPException
+
+from db.exceptions import DatabaseConnectionError
+from watch_tower.core import management_api
+from watch_tower.core.management_api import create_management_app
+from watch_tower.exceptions import BusinessLogicError
+from watch_tower.registry.camera_registry import CameraStatus
+
+
+def _get_endpoint(app: FastAPI, path: str) -> Callable[..., Any]:
+    """Return the endpoint function registered for a path."""
+    return next(route.endpoint for route in app.routes if getattr(route, 'path', None) == path)
+
+
+@pytest.fixture(name='health_endpoint')
+def _health_endpoint() -> Callable[..., Any]:
+    """Create a management app and return its health endpoint."""
+    return _get_endpoint(create_management_app(), '/health')
+
+
+def test_check_database_health_connection_error() -> None:
+    """Test that a database connection error is reported as unhealthy."""
+    with patch('db.connection.get_database_connection',
+               side_effect=DatabaseConnectionError("no database")):
+        result = management_api._check_database_health()  # pylint: disable=protected-access
+
+    assert result['healthy'] is False
+    assert result['error'] == "Database connection error: no database"
+
+
+def test_check_database_health_runs_ping() -> None:
+    """Test that a healthy database is probed with the shared ping statement."""
+    mock_session = MagicMock()
+    session_factory = Mock(return_value=mock_session)
+    with patch('db.connection.get_database_connection',
+               return_value=(Mock(), session_factory)):
+        result = management_api._check_database_health()  # pylint: disable=protected-access
+
+    assert result == {'healthy': True, 'error': None}
+    session = mock_session.__enter__.return_value
+    session.execute.assert_called_once_with(management_api._PING_STMT)  # pylint: disable=protected-access
+    session.execute.return_value.scalar.assert_called_once()
+
+
+def test_get_business_logic_status_error() -> None:
+    """Test that a business logic error is reported in the status."""
+    with patch.object(management_api.business_logic_manager, 'get_status',
+                      side_effect=BusinessLogicError("bad state")):
+        result = management_api._get_business_logic_status()  # pylint: disable=protected-access
+
+    assert result['running'] is False
+    assert result['error'] == "Business logic error: bad state"
+
+
+@pytest.mark.asyncio
+async def test_health_aggregates_probes(health_endpoint: Callable[..., Any]) -> None:
+    """Test that the health endpoint combines the result of every probe."""
+    business_logic_status = {'running': True, 'uptime': '0:01:00', 'start_time': 'now'}
+    with patch.object(management_api, '_check_database_health',
+                      return_value={'healthy': True, 'error': None}), \
+            patch.object(management_api, '_check_aws_health',
+                         return_value={'healthy': False, 'error': 'AWS down'}), \
+            patch.object(management_api, '_get_business_logic_status',
+                         return_value=business_logic_status), \
+            patch.object(management_api, 'camera_registry', Mock(cameras={})):
+        response = await health_endpoint()
+
+    body = json.loads(response.body)
+    assert body['database'] == {'healthy': True, 'error': None}
+    assert body['aws'] == {'healthy': False, 'error': 'AWS down'}
+    assert body['business_logic'] == business_logic_status
+    assert body['event_loop'] == business_logic_status
+    assert body['cameras'] == []
+    assert 'camera_error' not in body
+    assert response.headers['X-Cache'] == 'MISS'
+
+
+@pytest.mark.asyncio
+async def test_health_serves_cached_payload() -> None:
+    """Test that repeated health requests within the TTL reuse the cached payload."""
+    with patch.object(management_api.config.management, 'health_cache_ttl', 30):
+        health_endpoint = _get_endpoint(create_management_app(), '/health')
+
+    with patch.object(management_api, '_check_database_health',
+                      return_value={'healthy': True, 'error': None}) as mock_db_health, \
+            patch.object(management_api, '_check_aws_health',
+                         return_value={'healthy': True, 'error': None}), \
+            patch.object(management_api, '_get_business_logic_status',
+                         return_value={'running': False}), \
+            patch.object(management_api, 'camera_registry', Mock(cameras={})):
+        first = await health_endpoint()
+        second = await health_endpoint()
+
+    assert first.headers['X-Cache'] == 'MISS'
+    assert second.headers['X-Cache'] == 'HIT'
+    assert second.headers['Cache-Control'] == 'max-age=30, public'
+    assert json.loads(second.body) == json.loads(first.body)
+    mock_db_health.assert_called_once()
+
+
+def test_get_camera_health_builds_entries() -> None:
+    """Test that every registry entry is reported with its status."""
+    entry = Mock(status=CameraStatus.ACTIVE, last_polled_str='then', status_last_updated_str='now')
+    entry.camera.name = 'Front Door'
+    entry.camera.plugin_type = 'RING'
+    with patch.object(management_api, 'camera_registry', Mock(cameras={('RING', 'Front Door'): entry})):
+        cameras, camera_error = management_api._get_camera_health()  # pylint: disable=protected-access
+
+    assert camera_error is None
+    assert cameras == [{
+        'name': 'Front Door',
+        'vendor': 'RING',
+        'status': 'ACTIVE',
+        'healthy': True,
+        'last_polled': 'then',
+        'status_last_updated': 'now'
+    }]
+
+
+async def _scrape(metrics_app: Any, method: str, accept: str = '') -> Tuple[int, bytes]:
+    """Send a request to the raw metrics ASGI app and return its status and body."""
+    messages: List[Dict[str, Any]] = []
+
+    async def receive() -> Dict[str, Any]:
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        messages.append(message)
+
+    headers = [(b'accept', accept.encode())] if accept else []
+    scope = {'type': 'http', 'method': method, 'path': '/metrics',
+             'query_string': b'', 'headers': headers}
+    await metrics_app(scope, receive, send)
+    body = b''.join(message.get('body', b'') for message in messages
+                    if message['type'] == 'http.response.body')
+    return messages[0]['status'], body
+
+
+@pytest.mark.asyncio
+async def test_metrics_head_skips_rendering() -> None:
+    """Test that HEAD requests to /metrics do not render the registry."""
+    metrics_app = _get_endpoint(create_management_app(), '/metrics')
+    mock_encoder = Mock()
+    with patch('prometheus_client.exposition.choose_encoder',
+               return_value=(mock_encoder, 'text/plain')):
+        status, body = await _scrape(metrics_app, 'HEAD')
+
+    assert status == 200
+    assert body == b''
+    mock_encoder.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_metrics_reuses_recent_scrape_per_format() -> None:
+    """Test that back-to-back scrapes reuse the rendered metrics for their format."""
+    metrics_app = _get_endpoint(create_management_app(), '/metrics')
+    text_encoder = Mock(return_value=b'metric 1\n')
+    openmetrics_encoder = Mock(return_value=b'metric 1\n# EOF\n')
+
+    def choose_encoder(accept: str) -> Any:
+        if accept == 'application/openmetrics-text':
+            return openmetrics_encoder, 'application/openmetrics-text'
+        return text_encoder, 'text/plain'
+
+    with patch('prometheus_client.exposition.choose_encoder', side_effect=choose_encoder):
+        _, first = await _scrape(metrics_app, 'GET')
+        _, second = await _scrape(metrics_app, 'GET')
+        _, openmetrics = await _scrape(metrics_app, 'GET', 'application/openmetrics-text')
+
+    assert first == second == b'metric 1\n'
+    assert openmetrics == b'metric 1\n# EOF\n'
+    text_encoder.assert_called_once()
+    openmetrics_encoder.assert_called_once()
+
+
+def test_circuit_breaker_skips_failing_probe() -> None:
+    """Test that a repeatedly failing probe is skipped until the retry time."""
+    breaker = management_api._CircuitBreaker(2, 30.0)  # pylint: disable=protected-access
+    failure = {'healthy': False, 'error': 'AWS down'}
+    probe = Mock(return_value=failure)
+
+    assert breaker.call(probe) == failure
+    assert breaker.call(probe) == failure
+    assert breaker.call(probe) == failure
+    assert probe.call_count == 2
+
+    # Once the retry time has passed the probe runs again and a success resets it
+    breaker.open_until = 0.0
+    probe.return_value = {'healthy': True, 'error': None}
+    assert breaker.call(probe) == {'healthy': True, 'error': None}
+    assert breaker.failures == 0
+    assert probe.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_start_business_logic_error_maps_to_bad_request() -> None:
+    """Test that a business logic error while starting is reported as a 400."""
+    start_endpoint = _get_endpoint(create_management_app(), '/start')
+    with patch.object(management_api.business_logic_manager, 'start',
+                      side_effect=BusinessLogicError("already running")):
+        with pytest.raises(HTTPException) as exc_info:
+            await start_endpoint()
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == "Business logic error: already running"
+
+
+@pytest.mark.asyncio
+async def test_stop_business_logic_unexpected_error() -> None:
+    """Test that an unexpected error while stopping is reported as a 500."""
+    stop_endpoint = _get_endpoint(create_management_app(), '/stop')
+    with patch.object(management_api.business_logic_manager, 'stop',
+                      side_effect=RuntimeError("boom")):
+        with pytest.raises(HTTPException) as exc_info:
+            await stop_endpoint()
+
+    assert exc_info.value.status_code == 500
+    assert exc_info.value.detail == "Internal server error: RuntimeError"
+
+
+@pytest.mark.asyncio
+async def test_health_cache_warmed_on_startup() -> None:
+    """Test that the first /health request after startup is served from the cache."""
+    with patch.object(management_api.config.management, 'health_cache_ttl', 30):
+        app = create_management_app()
+    health_endpoint = _get_endpoint(app, '/health')
+
+    with patch.object(management_api, '_check_database_health',
+                      return_value={'healthy': True, 'error': None}), \
+            patch.object(management_api, '_check_aws_health',
+                         return_value={'healthy': True, 'error': None}), \
+            patch.object(management_api, '_get_business_logic_status',
+                         return_value={'running': False}), \
+            patch.object(management_api, 'camera_registry', Mock(cameras={})):
+        async with app.router.lifespan_context(app):
+            await asyncio.sleep(0.1)
+            response = await health_endpoint()
+
+    assert response.headers['X-Cache'] == 'HIT'
@@ -113,6 +113,18 @@ def test_engine_caching(mock_db_connection: Tuple[MagicMock, MagicMock]) -> None
     assert engine1 is engine2
 
 
+def test_session_factory_caching(mock_db_connection: Tuple[MagicMock, MagicMock]) -> None:
+    get_engine.cache_clear()
+    """Test that the session factory is reused while the engine is unchanged"""
+    with patch('db.connection.sessionmaker') as mock_sessionmaker:
+        factory1 = get_session_factory()
+        factory2 = get_session_factory()
+
+        # Verify the factory was built once and shared
+        assert factory1 is factory2
+        mock_sessionmaker.assert_called_once()
+
+
 def test_get_database_connection(
         mock_db_connection: Tuple[MagicMock, MagicMock]) -> None:
     get_engine.cache_clear()
@@ -2,6 +2,7 @@ import pytest
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any
 from sqlalchemy.orm import Session
+from db.exceptions import DatabaseEventNotFoundError, DatabaseMultipleEventsFoundError
 from db.repositories.motion_event_repository import MotionEventRepository
 from db.models import MotionEvent
 
@@ -110,6 +111,30 @@ def test_get_by_camera_and_time(
     assert events[0].event_metadata == sample_motion_event.event_metadata
 
 
+def test_get_by_ring_event_id(
+    db_session: Session,
+    motion_event_repository: MotionEventRepository
+) -> None:
+    """Test retrieving a motion event by the Ring event ID in its metadata"""
+    now = datetime.utcnow()
+    event_data: Dict[str, Any] = {
+        "camera_name": "Test Camera",
+        "motion_detected": now,
+        "uploaded_to_s3": now,
+        "facial_recognition_processed": now,
+        "event_metadata": {"event_id": "ring-123"}
+    }
+    event = motion_event_repository.create(db_session, event_data)
+
+    assert motion_event_repository.get_by_ring_event_id(db_session, "ring-123").id == event.id
+    with pytest.raises(DatabaseEventNotFoundError):
+        motion_event_repository.get_by_ring_event_id(db_session, "ring-missing")
+
+    motion_event_repository.create(db_session, dict(event_data))
+    with pytest.raises(DatabaseMultipleEventsFoundError):
+        motion_event_repository.get_by_ring_event_id(db_session, "ring-123")
+
+
 def test_get_unprocessed_events(
     db_session: Session,
     motion_event_repository: MotionEventRepository,
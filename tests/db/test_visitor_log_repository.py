@@ -185,3 +185,22 @@ def test_delete_visitor_log(
 
 def test_get_by_nonexistent_visitor_log_id(db_session, visitor_log_repository):
     assert visitor_log_repository.get(db_session, 999999) is None
+
+
+def test_iter_recent_entries(
+    db_session: Session,
+    visitor_log_repository: VisitorLogRepository
+) -> None:
+    """Test streaming the most recent visitor logs, newest first"""
+    now = datetime.datetime.utcnow()
+    for minutes_ago in (30, 10, 20):
+        visitor_log_repository.create(db_session, {
+            "camera_name": "Test Camera",
+            "persons_name": f"Person {minutes_ago}",
+            "confidence_score": 0.9,
+            "visited_at": now - datetime.timedelta(minutes=minutes_ago)
+        })
+
+    logs = list(visitor_log_repository.iter_recent_entries(db_session, limit=2))
+
+    assert [log.persons_name for log in logs] == ["Person 10", "Person 20"]
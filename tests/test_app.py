@@ -9,47 +9,41 @@ from app import main
 class TestApp:
     """Test the main application entry point."""
 
-    @patch('app.asyncio.get_event_loop')
-    @patch('app.bootstrap')
-    @patch('app._run_main_application_loop')
+    @patch('app.setup_signal_handlers')
+    @patch('app.bootstrap', new_callable=AsyncMock)
+    @patch('app._run_main_application_loop', new_callable=AsyncMock)
     def test_main_success(
             self,
             mock_run_main_loop: AsyncMock,
             mock_bootstrap: AsyncMock,
-            mock_get_event_loop
+            mock_setup_signal_handlers: Mock
     ) -> None:
         """Test successful application startup."""
-        # Setup
-        mock_loop = Mock()
-        mock_get_event_loop.return_value = mock_loop
-        mock_loop.run_until_complete.side_effect = lambda coro: coro
-
         # Execute
         main()
 
-        # Verify
-        mock_get_event_loop.assert_called_once()
-        # bootstrap and _run_main_application_loop
-        assert mock_loop.run_until_complete.call_count == 2
-        mock_bootstrap.assert_called_once()
-        mock_run_main_loop.assert_called_once()
+        # Verify bootstrap and the main loop ran on the same event loop
+        mock_setup_signal_handlers.assert_called_once()
+        mock_bootstrap.assert_awaited_once()
+        mock_run_main_loop.assert_awaited_once()
 
-    @patch('app.asyncio.get_event_loop')
-    @patch('app.bootstrap')
+    @patch('app.setup_signal_handlers')
+    @patch('app.bootstrap', new_callable=AsyncMock)
+    @patch('app._run_main_application_loop', new_callable=AsyncMock)
     def test_main_bootstrap_failure(
             self,
+            mock_run_main_loop: AsyncMock,
             mock_bootstrap: AsyncMock,
-            mock_get_event_loop
+            _mock_setup_signal_handlers: Mock
     ) -> None:
         """Test application startup with bootstrap failure."""
         # Setup
-        mock_loop = Mock()
-        mock_get_event_loop.return_value = mock_loop
-        mock_loop.run_until_complete.side_effect = Exception("Bootstrap failed")
+        mock_bootstrap.side_effect = Exception("Bootstrap failed")
 
         # Execute and Verify
         with pytest.raises(SystemExit):
             main()
 
-        # Verify bootstrap was called
-        mock_bootstrap.assert_called_once()
+        # Verify bootstrap was called and the application did not start
+        mock_bootstrap.assert_awaited_once()
+        mock_run_main_loop.assert_not_awaited()
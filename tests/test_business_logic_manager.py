@@ -320,3 +320,20 @@ class TestBusinessLogicManager:
             # Restore original methods
             camera_registry.get_all = original_get_all
             camera_registry.update_last_polled = original_update_last_polled
+
+    def test_get_status_reuses_recent_status(self) -> None:
+        """Test that get_status() reuses a recent status until the state is saved."""
+        BusinessLogicManager._status_cache = None
+        state = {'running': False, 'start_time': None}
+
+        with patch('watch_tower.core.business_logic_manager.STATE_FILE', '/tmp/test_state.json'), \
+                patch.object(BusinessLogicManager, '_load_state', return_value=state) as mock_load:
+            first = BusinessLogicManager.get_status()
+            second = BusinessLogicManager.get_status()
+            assert first == second
+            assert mock_load.call_count == 1
+
+            # Saving new state drops the cached status
+            BusinessLogicManager()._save_state()
+            BusinessLogicManager.get_status()
+            assert mock_load.call_count == 2
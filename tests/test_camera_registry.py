@@ -171,3 +171,19 @@ class TestCameraRegistry:
                 PluginType.RING,
                 "Test Camera",
                 CameraStatus.INACTIVE)
+
+    def test_entry_timestamp_strings_follow_updates(self, mock_camera: Mock) -> None:
+        """Test that the cached timestamp strings track assignments."""
+        polled_time = datetime(2024, 1, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        camera_entry = CameraEntry(
+            camera=mock_camera,
+            status=CameraStatus.ACTIVE,
+            last_polled=polled_time,
+            status_last_updated=polled_time
+        )
+        assert camera_entry.last_polled_str == "2024-01-01T12:30:15+00:00"
+        assert camera_entry.status_last_updated_str == "2024-01-01T12:30:15+00:00"
+
+        camera_entry.last_polled = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        assert camera_entry.last_polled_str == "2024-01-02T00:00:00+00:00"
+        assert camera_entry.status_last_updated_str == "2024-01-01T12:30:15+00:00"
@@ -0,0 +1,52 @@
+"""Tests for the camera helper functions."""
+from unittest.mock import Mock, patch
+
+from cameras.camera_helpers import find_device, get_camera_name
+
+
+def _mock_ring(*devices: Mock) -> Mock:
+    """Create a mock Ring session with the given video devices."""
+    ring = Mock()
+    ring.video_devices.return_value = list(devices)
+    return ring
+
+
+def _mock_device(device_id: int, name: str) -> Mock:
+    """Create a mock Ring video device."""
+    device = Mock()
+    device.id = device_id
+    device.name = name
+    return device
+
+
+def test_find_device_uses_cached_index() -> None:
+    """Test that repeated lookups within the poll interval refresh Ring data once."""
+    front_door = _mock_device(1, "Front Door")
+    connection_manager = Mock()
+    connection_manager._ring = _mock_ring(front_door, _mock_device(2, "Back Yard"))
+
+    assert find_device(connection_manager, "Front Door") is front_door
+    assert find_device(connection_manager, "Garage") is None
+    connection_manager._ring.update_data.assert_called_once()
+
+
+def test_find_device_refreshes_after_poll_interval() -> None:
+    """Test that Ring data is refreshed again when the index is stale."""
+    connection_manager = Mock()
+    connection_manager._ring = _mock_ring(_mock_device(1, "Front Door"))
+
+    with patch('cameras.camera_helpers.config') as mock_config:
+        mock_config.ring.motion_poll_interval = 0
+        find_device(connection_manager, "Front Door")
+        find_device(connection_manager, "Front Door")
+    assert connection_manager._ring.update_data.call_count == 2
+
+
+def test_get_camera_name_by_id() -> None:
+    """Test that camera names are looked up by ID."""
+    connection_manager = Mock()
+    connection_manager._is_authenticated = True
+    connection_manager._ring = _mock_ring(_mock_device(42, "Front Door"))
+
+    assert get_camera_name(connection_manager, "42") == "Front Door"
+    assert get_camera_name(connection_manager, "7") is None
@@ -1,14 +1,18 @@
 """Tests for RingCamera class."""
+import io
+import subprocess
 from datetime import datetime, timedelta, timezone
 from typing import Generator
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, call, Mock, patch, MagicMock
 
 import pytest
 from ring_doorbell import RingDoorBell
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
 
 from cameras.ring_camera import RingCamera
 from connection_managers.plugin_type import PluginType
 from data_models.motion_event import MotionEvent
+from watch_tower.exceptions import VideoConversionError
 try:
     from ring_doorbell import RingError
 except ImportError:
@@ -111,7 +115,33 @@ class TestRingCamera:
         assert result[0].timestamp == from_time + timedelta(minutes=30)
         assert result[1].timestamp == to_time - timedelta(minutes=30)
         mock_registry.get_connection_manager.assert_called_once_with(PluginType.RING)
-        mock_registry.get_connection_manager.return_value._ring.update_data.assert_called_once()
+        mock_registry.get_connection_manager.return_value.update_data_cached.assert_called_once_with(
+            ring_camera.motion_poll_interval)
+
+    @pytest.mark.asyncio
+    async def test_retrieve_motion_events_pages_history(
+            self, ring_camera: RingCamera, mock_device_object: Mock, mock_registry: Mock
+    ) -> None:
+        """Test that history is paged back until the time window is covered."""
+        # Setup - newest-first pages; the window holds six events
+        to_time = datetime.now(timezone.utc)
+        from_time = to_time - timedelta(hours=1)
+        in_window = [
+            {"id": str(i), "created_at": to_time - timedelta(minutes=i), "kind": "motion",
+             "doorbot": {"description": "Front Door"}}
+            for i in range(1, 7)
+        ]
+        too_old = {"id": "old", "created_at": from_time - timedelta(minutes=1), "kind": "motion",
+                   "doorbot": {"description": "Front Door"}}
+        mock_device_object.history.side_effect = [in_window[:5], [in_window[5], too_old]]
+
+        # Execute
+        result = await ring_camera.retrieve_motion_events(from_time, to_time)
+
+        # Verify
+        assert [event.timestamp for event in result] == [e["created_at"] for e in in_window]
+        assert mock_device_object.history.call_args_list == [
+            call(limit=5), call(limit=5, older_than="5")]
 
     @pytest.mark.asyncio
     async def test_retrieve_motion_events_error(
@@ -195,7 +225,8 @@ class TestRingCamera:
         }
         assert result == expected_properties
         mock_registry.get_connection_manager.assert_called_once_with(PluginType.RING)
-        mock_registry.get_connection_manager.return_value._ring.update_data.assert_called_once()
+        mock_registry.get_connection_manager.return_value.update_data_cached.assert_called_once_with(
+            ring_camera.motion_poll_interval)
 
     @pytest.mark.asyncio
     async def test_retrieve_video_from_event_and_upload_to_s3_no_event_id(
@@ -237,32 +268,31 @@ class TestRingCamera:
             mock_config.event_recordings_bucket = 'test-bucket'
             # Mock the S3 service - patch where it's imported, not where it's defined
             with patch('cameras.ring_camera.S3_SERVICE') as mock_s3_service:
-                # Mock requests.get to return a successful response
-                with patch('cameras.ring_camera.requests.get') as mock_get:
+                mock_s3_service.aupload_stream = AsyncMock()
+                mock_s3_service.aupload_file = AsyncMock()
+                # Mock the HTTP session to return a successful response
+                with patch('cameras.ring_camera._HTTP_SESSION.get') as mock_get:
                     mock_response = Mock()
                     mock_response.raise_for_status.return_value = None
-                    mock_response.iter_content.return_value = [b"fake video data"]
+                    mock_response.raw = io.BytesIO(b"fake video data")
                     mock_get.return_value.__enter__.return_value = mock_response
 
                     # Mock video converter
-                    with patch('cameras.ring_camera.VIDEO_CONVERTER') as mock_converter:
-                        mock_converter.get_video_info.return_value = {'codec': 'h264'}
+                    with patch('cameras.ring_camera.VIDEO_CONVERTER') as mock_converter, \
+                            patch('cameras.ring_camera.probe_codec_fast', return_value='h264'):
                         # Mock the database session and repository
                         with patch('cameras.ring_camera.get_database_connection') as mock_get_db_conn, \
-                                patch('cameras.ring_camera.MotionEventRepository') as mock_repo_class:
+                                patch('cameras.ring_camera.MOTION_EVENT_REPOSITORY') as mock_repo:
                             mock_engine = Mock()
                             mock_session_factory = MagicMock()
                             mock_session = Mock()
                             mock_get_db_conn.return_value = (
                                 mock_engine, mock_session_factory)
                             mock_session_factory.return_value.__enter__.return_value = mock_session
-                            mock_repo = Mock()
-                            mock_repo_class.return_value = mock_repo
-                            # Mock the query to return a matching event
+                            # Mock the lookup to return a matching event
                             mock_event_model = Mock()
                             mock_event_model.id = 123
-                            mock_session.query.return_value.filter.return_value.all.return_value = [
-                                mock_event_model]
+                            mock_repo.get_by_ring_event_id.return_value = mock_event_model
                             # Mock update_s3_url to do nothing
                             mock_repo.update_s3_url.return_value = None
                             # Execute
@@ -270,9 +300,56 @@ class TestRingCamera:
                             # Verify
                             mock_device_object.recording_url.assert_called_once_with(
                                 "ring-event-456")
-                            mock_s3_service.upload_file.assert_called_once()
+                            mock_s3_service.aupload_stream.assert_awaited_once_with(
+                                mock_response.raw, 'test-bucket', 'ring_ring-event-456.mp4')
+                            mock_s3_service.aupload_file.assert_not_awaited()
+                            mock_converter.convert_for_rekognition.assert_not_called()
+                            mock_converter.get_video_info.assert_not_called()
+                            mock_repo.get_by_ring_event_id.assert_called_once_with(
+                                mock_session, "ring-event-456")
                             mock_repo.update_s3_url.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_retrieve_video_from_event_and_upload_to_s3_converts_non_h264(
+            self, ring_camera: RingCamera, mock_device_object: Mock
+    ) -> None:
+        """Test that non-H.264 recordings are probed with ffprobe, then converted before upload."""
+        # Setup
+        event = MotionEvent(
+            event_id="test-event-123",
+            camera_vendor="ring",
+            camera_name="Test Camera",
+            timestamp=datetime.now(timezone.utc),
+            event_metadata={"event_id": "ring-event-456"}
+        )
+        mock_device_object.recording_url.return_value = "https://example.com/video.mp4"
+
+        with patch('cameras.ring_camera.config') as mock_config, \
+                patch('cameras.ring_camera.S3_SERVICE') as mock_s3_service, \
+                patch('cameras.ring_camera._HTTP_SESSION.get') as mock_get, \
+                patch('cameras.ring_camera.VIDEO_CONVERTER') as mock_converter, \
+                patch('cameras.ring_camera.probe_codec_fast', return_value=None), \
+                patch('cameras.ring_camera.get_database_connection') as mock_get_db_conn, \
+                patch('cameras.ring_camera.MOTION_EVENT_REPOSITORY'):
+            mock_config.event_recordings_bucket = 'test-bucket'
+            mock_s3_service.aupload_stream = AsyncMock()
+            mock_s3_service.aupload_file = AsyncMock()
+            mock_response = Mock()
+            mock_response.raw = io.BytesIO(b"fake video data")
+            mock_get.return_value.__enter__.return_value = mock_response
+            mock_converter.get_video_info.return_value = {'codec': 'hevc'}
+            mock_converter.convert_for_rekognition.side_effect = lambda path: (path, False)
+            mock_get_db_conn.return_value = (Mock(), MagicMock())
+
+            # Execute
+            await ring_camera.retrieve_video_from_event_and_upload_to_s3(event)
+
+            # Verify
+            mock_converter.get_video_info.assert_called_once_with("https://example.com/video.mp4")
+            mock_converter.convert_for_rekognition.assert_called_once()
+            mock_s3_service.aupload_file.assert_awaited_once()
+            mock_s3_service.aupload_stream.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_retrieve_video_from_event_and_upload_to_s3_no_video_url(
             self, ring_camera: RingCamera, mock_device_object: Mock
@@ -296,3 +373,57 @@ class TestRingCamera:
 
         # Verify
         mock_device_object.recording_url.assert_called_once_with("ring-event-456")
+
+    def test_recording_url_cached(
+            self, ring_camera: RingCamera, mock_device_object: Mock
+    ) -> None:
+        """Test that recording URLs are reused within the poll interval."""
+        mock_device_object.recording_url.return_value = "https://example.com/video.mp4"
+
+        assert ring_camera._recording_url("ring-event-456") == "https://example.com/video.mp4"
+        assert ring_camera._recording_url("ring-event-456") == "https://example.com/video.mp4"
+
+        mock_device_object.recording_url.assert_called_once_with("ring-event-456")
+
+    def test_recording_url_cache_bounded(
+            self, ring_camera: RingCamera, mock_device_object: Mock
+    ) -> None:
+        """Test that the least recently used recording URL is evicted first."""
+        mock_device_object.recording_url.side_effect = lambda event_id: f"https://example.com/{event_id}"
+
+        with patch('cameras.ring_camera.RECORDING_URL_CACHE_SIZE', 2):
+            ring_camera._recording_url("event-1")
+            ring_camera._recording_url("event-2")
+            ring_camera._recording_url("event-1")
+            ring_camera._recording_url("event-3")
+
+        assert list(ring_camera._recording_urls) == ["event-1", "event-3"]
+
+    @pytest.mark.parametrize("error", [
+        VideoConversionError("ffprobe not found"),
+        RuntimeError("ffprobe timed out after 30 seconds"),
+        subprocess.TimeoutExpired("ffprobe", 30),
+    ])
+    def test_probe_codec_falls_back_on_probe_error(self, error: Exception) -> None:
+        """Test that a failed ffprobe makes the upload download and convert locally."""
+        with patch('cameras.ring_camera._HTTP_SESSION.get') as mock_get, \
+                patch('cameras.ring_camera.probe_codec_fast', return_value=None), \
+                patch('cameras.ring_camera.VIDEO_CONVERTER') as mock_converter:
+            mock_get.return_value.__enter__.return_value = Mock(raw=io.BytesIO(b""))
+            mock_converter.get_video_info.side_effect = error
+
+            assert RingCamera._probe_codec("https://example.com/video.mp4") is None
+
+    @pytest.mark.parametrize("error", [
+        ReadTimeoutError(None, "https://example.com/video.mp4", "Read timed out."),
+        ProtocolError("Connection broken"),
+    ])
+    def test_probe_codec_range_read_error_falls_back_to_ffprobe(self, error: Exception) -> None:
+        """Test that a stalled or truncated range probe falls back to ffprobe."""
+        with patch('cameras.ring_camera._HTTP_SESSION.get') as mock_get, \
+                patch('cameras.ring_camera.probe_codec_fast', side_effect=error), \
+                patch('cameras.ring_camera.VIDEO_CONVERTER') as mock_converter:
+            mock_get.return_value.__enter__.return_value = Mock()
+            mock_converter.get_video_info.return_value = {'codec': 'hevc'}
+
+            assert RingCamera._probe_codec("https://example.com/video.mp4") == 'hevc'
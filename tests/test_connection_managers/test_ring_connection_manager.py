@@ -1,5 +1,7 @@
 """Tests for RingConnectionManager."""
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Generator, Dict, Optional, List, cast
 from unittest.mock import Mock, patch, MagicMock
@@ -258,6 +260,59 @@ class TestRingConnectionManager:
         assert result
         mock_ring.update_data.assert_called_once()
 
+    def test_is_healthy_reuses_recent_refresh(
+            self,
+            ring_connection_manager: RingConnectionManager,
+            mock_ring: Mock
+    ) -> None:
+        """Test that health checks within the max age reuse the last Ring refresh."""
+        # Setup
+        ring_connection_manager._ring = mock_ring
+        ring_connection_manager._is_authenticated = True
+
+        # Execute
+        first = ring_connection_manager.is_healthy()
+        second = ring_connection_manager.is_healthy()
+
+        # Verify
+        assert first and second
+        mock_ring.update_data.assert_called_once()
+
+    def test_update_data_cached(
+            self,
+            ring_connection_manager: RingConnectionManager,
+            mock_ring: Mock
+    ) -> None:
+        """Test that Ring data refreshes within max_age are reused."""
+        # Setup
+        ring_connection_manager._ring = mock_ring
+
+        # Execute
+        ring_connection_manager.update_data_cached(60)
+        ring_connection_manager.update_data_cached(60)
+        ring_connection_manager.update_data_cached(0)
+
+        # Verify
+        assert mock_ring.update_data.call_count == 2
+
+    def test_update_data_cached_concurrent_threads_refresh_once(
+            self,
+            ring_connection_manager: RingConnectionManager,
+            mock_ring: Mock
+    ) -> None:
+        """Test that concurrent refreshes from executor threads reach the Ring API once."""
+        # Setup
+        mock_ring.update_data.side_effect = lambda: time.sleep(0.05)
+        ring_connection_manager._ring = mock_ring
+
+        # Execute
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for _ in range(4):
+                executor.submit(ring_connection_manager.update_data_cached, 60)
+
+        # Verify
+        mock_ring.update_data.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_get_cameras_success(
             self,
@@ -280,6 +335,27 @@ class TestRingConnectionManager:
         mock_ring.video_devices.assert_called_once()
         return cast(Optional[List[RingDoorBell]], result)
 
+    @pytest.mark.asyncio
+    async def test_get_cameras_reuses_health_check_refresh(
+            self,
+            ring_connection_manager: RingConnectionManager,
+            mock_ring: Mock
+    ) -> None:
+        """Test that a camera listing right after a health check skips the Ring refresh."""
+        # Setup
+        mock_cameras = [Mock(spec=RingDoorBell)]
+        mock_ring.video_devices.return_value = mock_cameras
+        ring_connection_manager._ring = mock_ring
+        ring_connection_manager._is_authenticated = True
+
+        # Execute
+        assert ring_connection_manager.is_healthy()
+        result = await ring_connection_manager.get_cameras()
+
+        # Verify
+        assert result == mock_cameras
+        mock_ring.update_data.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_get_cameras_not_authenticated(
             self,
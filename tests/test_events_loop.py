@@ -1,4 +1,5 @@
 """Tests for the events loop."""
+import asyncio
 from datetime import datetime, timezone, timedelta
 from typing import Any, Generator, List
 from unittest.mock import AsyncMock, Mock, patch, MagicMock
@@ -11,7 +12,9 @@ from data_models.motion_event import MotionEvent
 from watch_tower.core.events_loop import (
     handle_camera_error,
     insert_events_into_db,
-    poll_for_events
+    poll_cameras,
+    poll_for_events,
+    process_video_retrieval,
 )
 from watch_tower.registry.camera_registry import CameraStatus
 from watch_tower.registry.connection_manager_registry import VendorStatus
@@ -77,6 +80,23 @@ async def test_poll_for_events_success(
         PluginType.RING, "Test Camera")].last_polled == current_time
 
 
+@pytest.mark.asyncio
+async def test_poll_cameras_collects_events_from_all_cameras() -> None:
+    """Test that every camera is polled and all events are collected."""
+    cameras = [Mock(name=f"camera{i}") for i in range(3)]
+    current_time = datetime.now(timezone.utc)
+    new_events: List[Any] = []
+
+    async def fake_poll(camera, _current_time, events):
+        events.append(camera)
+
+    with patch('watch_tower.core.events_loop.poll_for_events', side_effect=fake_poll) as mock_poll:
+        await poll_cameras(cameras, current_time, new_events)
+
+    assert mock_poll.call_count == 3
+    assert sorted(new_events, key=id) == sorted(cameras, key=id)
+
+
 @pytest.mark.asyncio
 async def test_poll_for_events_error(
         mock_camera: Mock,
@@ -368,3 +388,31 @@ class TestInsertEventsIntoDb:
         assert mock_db_session.query.call_count == 2
         # Verify: Both events were inserted (different cameras, so not duplicates)
         assert mock_db_session.add.call_count == 2
+
+
+def test_upload_semaphore_contention_under_asyncio_run(mock_camera: Mock) -> None:
+    """Test that queued uploads beyond the limit wait on a fresh event loop."""
+    active = 0
+    peak = 0
+
+    async def upload(*_args: Any) -> None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    mock_camera.retrieve_video_from_event_and_upload_to_s3 = AsyncMock(side_effect=upload)
+
+    async def run_uploads() -> None:
+        await asyncio.gather(*(
+            process_video_retrieval(Mock(spec=MotionEvent), mock_camera) for _ in range(5)))
+
+    with patch('watch_tower.core.events_loop.config') as mock_config:
+        mock_config.video.max_concurrent_uploads = 2
+        # Each asyncio.run gets a new loop; the semaphore must follow it
+        asyncio.run(run_uploads())
+        asyncio.run(run_uploads())
+
+    assert peak == 2
+    assert mock_camera.retrieve_video_from_event_and_upload_to_s3.await_count == 10
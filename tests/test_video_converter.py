@@ -1,12 +1,14 @@
 """Tests for video converter functionality."""
+import io
 import os
+import struct
 import subprocess
 import tempfile
 from unittest.mock import patch
 
 import pytest
 
-from utils.video_converter import VideoConverter
+from utils.video_converter import VideoConverter, probe_codec_fast
 from watch_tower.exceptions import VideoConversionError
 
 
@@ -97,6 +99,19 @@ def test_get_video_info_ffprobe_failure(video_converter):
                 video_converter.get_video_info(temp_file.name)
 
 
+def test_get_video_info_ffprobe_timeout(video_converter):
+    """Test video info retrieval when ffprobe hangs past its timeout."""
+    with patch('subprocess.run') as mock_run:
+        mock_run.side_effect = subprocess.TimeoutExpired("ffprobe", 30)
+
+        with pytest.raises(RuntimeError, match="timed out"):
+            video_converter.get_video_info("https://example.com/video.mp4")
+
+        args, kwargs = mock_run.call_args
+        assert '-rw_timeout' in args[0]
+        assert kwargs['timeout'] == 30
+
+
 def create_output_file(*args, **_kwargs):
     """Helper function to create output file for mocking subprocess.run."""
     output_path = args[0][-1]
@@ -239,3 +254,33 @@ def test_convert_to_h264_with_temp_file(video_converter):
                 # Clean up the temp file
                 if os.path.exists(result):
                     os.remove(result)
+
+
+def _box(box_type: bytes, payload: bytes = b"") -> bytes:
+    """Build an ISO-BMFF box."""
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+@pytest.mark.parametrize("sample_entry,expected", [
+    (b"avc1", "h264"),
+    (b"hvc1", "hevc"),
+    (b"mp4v", None),
+])
+def test_probe_codec_fast_faststart(sample_entry, expected):
+    """Test that the codec is read from a moov box at the front of the file."""
+    stsd = _box(b"stsd", b"\x00" * 8 + _box(sample_entry, b"\x00" * 16))
+    header = _box(b"ftyp", b"isom\x00\x00\x02\x00") + _box(b"moov", _box(b"trak", stsd))
+
+    assert probe_codec_fast(io.BytesIO(header + _box(b"mdat", b"\x00" * 32))) == expected
+
+
+def test_probe_codec_fast_moov_at_end():
+    """Test that None is returned when moov is not in the probed header."""
+    header = _box(b"ftyp", b"isom\x00\x00\x02\x00") + struct.pack(">I4s", 1 << 20, b"mdat")
+
+    assert probe_codec_fast(io.BytesIO(header)) is None
+
+
+def test_probe_codec_fast_not_mp4():
+    """Test that non-MP4 input is not identified."""
+    assert probe_codec_fast(io.BytesIO(b"\x1a\x45\xdf\xa3" + b"\x00" * 60)) is None
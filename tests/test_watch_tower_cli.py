@@ -13,7 +13,7 @@ import os
 import tempfile
 from datetime import datetime, timezone
 from typing import Generator, Tuple
-from unittest.mock import ANY, MagicMock, Mock, mock_open, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, Mock, patch
 
 import click
 import pytest
@@ -301,25 +301,23 @@ def test_get_status_general_exception(
     assert "Unexpected error" in result['error']
 
 
-@patch('cli.services.watch_tower_service.json.dump')
-@patch('builtins.open', new_callable=mock_open)
-def test_start_business_logic(
-        mock_file: Mock,
-        mock_json_dump: Mock,
+@pytest.mark.asyncio
+async def test_session_reused_until_closed(
         watch_tower_service: Tuple[WatchTowerService, str]) -> None:
-    """Test start_business_logic method."""
-    service, temp_state_file_path = watch_tower_service
-    service.start_business_logic()
+    """Test that API calls share one aiohttp session, closed with the service."""
+    service, _ = watch_tower_service
+    with patch('aiohttp.ClientSession') as mock_session_class, patch('aiohttp.TCPConnector'):
+        mock_session = mock_session_class.return_value
+        mock_session.closed = False
+        mock_session.close = AsyncMock()
 
-    mock_file.assert_called_once_with(temp_state_file_path, 'w')
-    mock_json_dump.assert_called_once()
+        async with service:
+            first = await service._get_session()
+            second = await service._get_session()
 
-    call_args = mock_json_dump.call_args[0]
-    state_data = call_args[0]
-    assert state_data['running'] is True
-    assert 'start_time' in state_data
-    assert state_data['business_logic_completed'] is False
-    assert state_data['business_logic_cancelled'] is False
+    assert first is second
+    mock_session_class.assert_called_once()
+    mock_session.close.assert_awaited_once()
 
 
 @patch('cli.services.watch_tower_service.config')
@@ -511,6 +509,16 @@ def test_cli_help(cli_runner: CliRunner) -> None:
     assert 'visitor-log' in result.output
 
 
+def test_cli_commands_loaded_lazily() -> None:
+    """Test that subcommands resolve through the lazy command table."""
+    from cli.commands.status import status_command
+
+    ctx = click.Context(cli)
+    assert cli.list_commands(ctx) == ['business-logic', 'status', 'visitor-log']
+    assert cli.get_command(ctx, 'status') is status_command
+    assert cli.get_command(ctx, 'no-such-command') is None
+
+
 def test_cli_version(cli_runner: CliRunner) -> None:
     """Test CLI version command."""
     result = cli_runner.invoke(cli, ['--version'])
@@ -532,11 +540,11 @@ def test_cli_verbose_flag(cli_runner: CliRunner) -> None:
 @patch('cli.commands.status.SERVICE')
 def test_status_command_text_format(mock_service: Mock, cli_runner: CliRunner) -> None:
     """Test status command with text format."""
-    mock_service.get_status.return_value = {
+    mock_service.aget_status = AsyncMock(return_value={
         'running': True,
         'start_time': '2023-01-01T12:00:00Z',
         'uptime': '1h 30m'
-    }
+    })
 
     with patch('cli.commands.status.validate_aws_config') as mock_aws, \
          patch('cli.commands.status.validate_database_config') as mock_db, \
@@ -559,11 +567,11 @@ def test_status_command_text_format(mock_service: Mock, cli_runner: CliRunner) -
 @patch('cli.commands.status.SERVICE')
 def test_status_command_json_format(mock_service: Mock, cli_runner: CliRunner) -> None:
     """Test status command with JSON format."""
-    mock_service.get_status.return_value = {
+    mock_service.aget_status = AsyncMock(return_value={
         'running': False,
         'start_time': '2023-01-01T12:00:00Z',
         'uptime': '0h 0m'
-    }
+    })
 
     with patch('cli.commands.status.validate_aws_config') as mock_aws, \
          patch('cli.commands.status.validate_database_config') as mock_db, \
@@ -587,11 +595,11 @@ def test_status_command_json_format(mock_service: Mock, cli_runner: CliRunner) -
 @patch('cli.commands.status.SERVICE')
 def test_status_command_detailed(mock_service: Mock, cli_runner: CliRunner) -> None:
     """Test status command with detailed output."""
-    mock_service.get_status.return_value = {
+    mock_service.aget_status = AsyncMock(return_value={
         'running': True,
         'start_time': '2023-01-01T12:00:00Z',
         'uptime': '1h 30m'
-    }
+    })
 
     with patch('cli.commands.status.validate_aws_config') as mock_aws, \
          patch('cli.commands.status.validate_database_config') as mock_db, \
@@ -617,10 +625,10 @@ def test_status_command_detailed(mock_service: Mock, cli_runner: CliRunner) -> N
 @patch('cli.commands.status.SERVICE')
 def test_status_command_error(mock_service: Mock, cli_runner: CliRunner) -> None:
     """Test status command with service error."""
-    mock_service.get_status.return_value = {
+    mock_service.aget_status = AsyncMock(return_value={
         'running': False,
         'error': 'Service unavailable'
-    }
+    })
 
     with patch('cli.commands.status.validate_aws_config') as mock_aws, \
          patch('cli.commands.status.validate_database_config') as mock_db, \
@@ -638,6 +646,29 @@ def test_status_command_error(mock_service: Mock, cli_runner: CliRunner) -> None
         assert 'Service unavailable' in result.output
 
 
+@patch('cli.commands.status.SERVICE')
+def test_status_command_validator_exception(mock_service: Mock, cli_runner: CliRunner) -> None:
+    """Test that a failing validator is reported as a configuration error."""
+    mock_service.aget_status = AsyncMock(return_value={'running': True})
+
+    with patch('cli.commands.status.validate_aws_config') as mock_aws, \
+         patch('cli.commands.status.validate_database_config') as mock_db, \
+         patch('cli.commands.status.validate_ring_config') as mock_ring, \
+         patch('cli.commands.status.validate_app_config') as mock_app:
+        mock_aws.return_value = [{'status': '✅', 'field': 'test', 'value': 'ok'}]
+        mock_db.side_effect = RuntimeError("boom")
+        mock_ring.return_value = []
+        mock_app.return_value = []
+
+        result = cli_runner.invoke(cli, ['status', '--format', 'json'])
+
+        assert result.exit_code == 0
+        output_data = json.loads(result.output)
+        assert output_data['configuration']['passed'] == 1
+        assert output_data['configuration']['failed'] == 1
+        assert output_data['configuration']['results'][1]['field'] == 'Database Configuration'
+
+
 # =============================================================================
 # Business Logic Command Tests
 # =============================================================================
@@ -744,7 +775,7 @@ def test_visitor_log_recent_text_format(
 
     mock_repo = Mock()
     mock_repo_class.return_value = mock_repo
-    mock_repo.get_recent_entries.return_value = [mock_visitor_entry]
+    mock_repo.iter_recent_entries.return_value = [mock_visitor_entry]
 
     result = cli_runner.invoke(cli, ['visitor-log', 'recent'])
 
@@ -772,7 +803,7 @@ def test_visitor_log_recent_json_format(
 
     mock_repo = Mock()
     mock_repo_class.return_value = mock_repo
-    mock_repo.get_recent_entries.return_value = [mock_visitor_entry]
+    mock_repo.iter_recent_entries.return_value = [mock_visitor_entry]
 
     result = cli_runner.invoke(cli, ['visitor-log', 'recent', '--format', 'json'])
 
@@ -800,7 +831,7 @@ def test_visitor_log_recent_no_entries(
 
     mock_repo = Mock()
     mock_repo_class.return_value = mock_repo
-    mock_repo.get_recent_entries.return_value = []
+    mock_repo.iter_recent_entries.return_value = []
 
     result = cli_runner.invoke(cli, ['visitor-log', 'recent'])
 
@@ -824,12 +855,12 @@ def test_visitor_log_recent_custom_limit(
 
     mock_repo = Mock()
     mock_repo_class.return_value = mock_repo
-    mock_repo.get_recent_entries.return_value = []
+    mock_repo.iter_recent_entries.return_value = []
 
     result = cli_runner.invoke(cli, ['visitor-log', 'recent', '--limit', '5'])
 
     assert result.exit_code == 0
-    mock_repo.get_recent_entries.assert_called_once_with(ANY, limit=5)
+    mock_repo.iter_recent_entries.assert_called_once_with(ANY, limit=5)
 
 
 def test_visitor_log_help(cli_runner: CliRunner) -> None:
@@ -8,6 +8,7 @@ reducing code duplication across S3 and Rekognition services.
 from typing import Any, Optional
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from watch_tower.config import config
@@ -28,6 +29,9 @@ class AWSClientFactory:
         """
         Create an AWS client with consistent configuration.
 
+        Clients use a keep-alive connection pool and bounded timeouts unless a
+        botocore Config is passed explicitly.
+
         Args:
             service_name: AWS service name (e.g., 's3', 'rekognition')
             region_name: AWS region (defaults to config)
@@ -46,12 +50,26 @@ class AWSClientFactory:
             'region_name': region,
             'aws_access_key_id': config.aws_access_key_id,
             'aws_secret_access_key': config.aws_secret_access_key,
+            'config': AWSClientFactory.default_client_config(),
             **kwargs
         }
 
         LOGGER.debug("Creating AWS %s client for region %s", service_name, region)
         return boto3.client(**client_config)
 
+    @staticmethod
+    def default_client_config() -> Config:
+        """Build the botocore Config applied to every client by default."""
+        client_settings = config.aws_client
+        return Config(
+            connect_timeout=client_settings.connect_timeout,
+            read_timeout=client_settings.read_timeout,
+            retries={'max_attempts': client_settings.max_attempts,
+                     'mode': client_settings.retry_mode},
+            max_pool_connections=client_settings.max_pool_connections,
+            tcp_keepalive=client_settings.tcp_keepalive
+        )
+
     @staticmethod
     def create_s3_client(**kwargs: Any) -> boto3.client:
         """Create an S3 client."""
@@ -62,6 +80,11 @@ class AWSClientFactory:
         """Create a Rekognition client."""
         return AWSClientFactory.create_client('rekognition', **kwargs)
 
+    @staticmethod
+    def create_sqs_client(**kwargs: Any) -> boto3.client:
+        """Create an SQS client."""
+        return AWSClientFactory.create_client('sqs', **kwargs)
+
     @staticmethod
     def create_secrets_manager_client(**kwargs: Any) -> boto3.client:
         """Create a Secrets Manager client."""
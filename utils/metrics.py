@@ -45,6 +45,10 @@ aws_s3_download_file_error_count = Counter(
     "aws_s3_download_file_error_count",
     "Number of failed S3 file download operations",
 )
+aws_s3_download_file_skipped_count = Counter(
+    "aws_s3_download_file_skipped_count",
+    "Number of S3 file downloads skipped because the local copy was current",
+)
 aws_s3_upload_file_success_count = Counter(
     "aws_s3_upload_file_success_count",
     "Number of successful S3 file upload operations",
@@ -231,6 +235,7 @@ class MetricDataPointName(enum.Enum):
     AWS_REKOGNITION_FACE_SEARCH_DURATION_SECONDS = aws_rekognition_face_search_duration_seconds
     AWS_S3_DOWNLOAD_FILE_SUCCESS_COUNT = aws_s3_download_file_success_count
     AWS_S3_DOWNLOAD_FILE_ERROR_COUNT = aws_s3_download_file_error_count
+    AWS_S3_DOWNLOAD_FILE_SKIPPED_COUNT = aws_s3_download_file_skipped_count
     AWS_S3_UPLOAD_FILE_SUCCESS_COUNT = aws_s3_upload_file_success_count
     AWS_S3_UPLOAD_FILE_ERROR_COUNT = aws_s3_upload_file_error_count
     AWS_S3_UPLOAD_SEMAPHORE_JOB_COUNT = aws_s3_upload_semaphore_job_count
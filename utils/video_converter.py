@@ -6,10 +6,11 @@ using ffmpeg, optimized for AWS Rekognition and general use cases.
 """
 import json
 import os
+import struct
 import subprocess
 import tempfile
 import uuid
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
 from utils.error_handler import handle_errors
 from utils.logging_config import get_logger
@@ -19,6 +20,63 @@ from watch_tower.exceptions import VideoConversionError
 
 LOGGER = get_logger(__name__)
 
+# Bytes read from the start of an MP4 by probe_codec_fast
+FAST_PROBE_BYTES = 64 * 1024
+
+# Bound on a get_video_info ffprobe run, and on each remote read it makes (microseconds)
+FFPROBE_TIMEOUT = 30
+FFPROBE_RW_TIMEOUT_US = 10 * 1000 * 1000
+
+# MP4 sample entry types (inside moov/.../stsd) and the codecs they carry
+SAMPLE_ENTRY_CODECS = {
+    b'avc1': 'h264',
+    b'avc3': 'h264',
+    b'hvc1': 'hevc',
+    b'hev1': 'hevc',
+}
+
+
+def probe_codec_fast(source: Union[str, BinaryIO]) -> Optional[str]:
+    """
+    Detect the video codec of an MP4 from its header, without running ffprobe.
+
+    Walks the top-level ISO-BMFF boxes in the first FAST_PROBE_BYTES and looks
+    up the video sample entry type inside moov. This only works when moov is
+    at the front of the file (a "faststart" MP4); otherwise None is returned
+    and the caller should fall back to get_video_info.
+
+    Args:
+        source: Path to an MP4 file, or a binary file object positioned at its start.
+
+    Returns:
+        The codec name (e.g. 'h264'), or None if it could not be determined.
+    """
+    if isinstance(source, str):
+        with open(source, 'rb') as video_file:
+            header = video_file.read(FAST_PROBE_BYTES)
+    else:
+        header = source.read(FAST_PROBE_BYTES)
+
+    if header[4:8] != b'ftyp':
+        return None
+
+    offset = 0
+    while offset + 8 <= len(header):
+        size, box_type = struct.unpack('>I4s', header[offset:offset + 8])
+        if size == 1 and offset + 16 <= len(header):
+            # 64-bit box size
+            size = struct.unpack('>Q', header[offset + 8:offset + 16])[0]
+        if box_type == b'moov':
+            moov = header[offset:offset + size] if size else header[offset:]
+            found = [(moov.find(entry), codec) for entry, codec in SAMPLE_ENTRY_CODECS.items()]
+            found = [(index, codec) for index, codec in found if index != -1]
+            return min(found)[1] if found else None
+        if size < 8:
+            # Box extends to end of file, or the header is malformed
+            return None
+        offset += size
+    return None
+
 
 class VideoConverter:
     """A library for converting video files to H.264 format using ffmpeg."""
@@ -64,15 +122,16 @@ class VideoConverter:
         Get information about a video file.
 
         Args:
-            input_path: Path to the input video file.
+            input_path: Path to the input video file, or an http(s) URL. ffprobe
+                only reads as much of a remote file as it needs.
 
         Returns:
             Dictionary containing video information.
 
         Raises:
-            RuntimeError: If ffprobe fails or video file is invalid.
+            RuntimeError: If ffprobe fails, times out, or video file is invalid.
         """
-        if not os.path.exists(input_path):
+        if not input_path.startswith(('http://', 'https://')) and not os.path.exists(input_path):
             raise FileNotFoundError(f"Input file not found: {input_path}")
 
         # Use ffprobe to get video information
@@ -82,11 +141,15 @@ class VideoConverter:
             '-print_format', 'json',
             '-show_format',
             '-show_streams',
-            input_path
         ]
+        if input_path.startswith(('http://', 'https://')):
+            # Fail a stalled remote read instead of waiting on it indefinitely
+            cmd += ['-rw_timeout', str(FFPROBE_RW_TIMEOUT_US)]
+        cmd.append(input_path)
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            result = subprocess.run(
+                cmd, capture_output=True, text=True, check=True, timeout=FFPROBE_TIMEOUT)
             info = json.loads(result.stdout)
 
             # Extract relevant information
@@ -119,6 +182,9 @@ class VideoConverter:
         except subprocess.CalledProcessError as e:
             LOGGER.error("ffprobe failed: %s", e.stderr)
             raise RuntimeError(f"Failed to get video info: {e.stderr}") from e
+        except subprocess.TimeoutExpired as e:
+            LOGGER.error("ffprobe timed out after %d seconds", FFPROBE_TIMEOUT)
+            raise RuntimeError(f"ffprobe timed out after {FFPROBE_TIMEOUT} seconds") from e
         except (json.JSONDecodeError, FileNotFoundError) as e:
             LOGGER.error("Failed to parse ffprobe output: %s", e)
             raise RuntimeError("Failed to parse video information") from e
@@ -67,6 +67,7 @@ class CryptographyConfig:
 class RingConfig:
     """Ring camera configuration."""
     motion_poll_interval: int = 60
+    max_concurrent_polls: int = 4  # cameras polled at once
     user_agent: str = "WatchTower API"
 
 
@@ -80,6 +81,17 @@ class LoggingConfig:
     max_files: int = 3
 
 
+@dataclass
+class AWSClientConfig:
+    """botocore settings shared by every AWS client."""
+    connect_timeout: int = 5
+    read_timeout: int = 60
+    retry_mode: str = 'adaptive'  # client-side rate limiting on throttling errors
+    max_attempts: int = 5
+    max_pool_connections: int = 50
+    tcp_keepalive: bool = True
+
+
 @dataclass
 class CLIConfig:
     """CLI-specific configuration."""
@@ -95,6 +107,7 @@ class ManagementConfig:
     port: int = int(os.getenv("MANAGEMENT_API_PORT", "8080"))
     log_level: str = os.getenv("MANAGEMENT_API_LOG_LEVEL", "info")
     access_log: bool = os.getenv("MANAGEMENT_API_ACCESS_LOG", "false").lower() == "true"
+    health_cache_ttl: int = int(os.getenv("MANAGEMENT_API_HEALTH_CACHE_TTL", "15"))  # 0 disables
 
 
 @dataclass
@@ -112,6 +125,7 @@ class AppConfig:
     # Database Configuration
     db_secret_name: str = os.getenv("DB_SECRET_NAME", "")
     encryption_key_secret_name: str = os.getenv("ENCRYPTION_KEY_SECRET_NAME", "")
+    secrets_cache_ttl: int = int(os.getenv("SECRETS_CACHE_TTL", "300"))  # 0 disables
 
     # S3 Configuration
     event_recordings_bucket: str = os.getenv("EVENT_RECORDINGS_BUCKET", "")
@@ -124,6 +138,8 @@ class AppConfig:
         "SNS_REKOGNITION_VIDEO_ANALYSIS_TOPIC_ARN", "")
     rekognition_video_service_role_arn: str = os.getenv(
         "REKOGNITION_VIDEO_SERVICE_ROLE_ARN", "")
+    # Optional SQS queue subscribed to the SNS topic for job completion notifications
+    rekognition_sqs_queue_url: str = os.getenv("REKOGNITION_SQS_QUEUE_URL", "")
 
     # Timezone Configuration
     timezone: str = os.getenv("TIMEZONE", "America/Los_Angeles")
@@ -135,6 +151,7 @@ class AppConfig:
     ring: RingConfig = RingConfig()
     logging: LoggingConfig = LoggingConfig()
     cli: CLIConfig = CLIConfig()
+    aws_client: AWSClientConfig = AWSClientConfig()
     management: ManagementConfig = ManagementConfig()
 
     def validate(self, required_fields: Optional[list] = None) -> None:
@@ -8,16 +8,17 @@ providing start/stop functionality and state management.
 import asyncio
 import json
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
 from data_models.motion_event import MotionEvent
 from utils.metrics import MetricDataPointName
 from utils.metric_helpers import inc_counter_metric
 from watch_tower.core.events_loop import (
     insert_events_into_db,
-    poll_for_events,
+    poll_cameras,
     start_facial_recognition_tasks,
     start_video_retrieval_tasks,
 )
@@ -30,6 +31,9 @@ LOGGER = logging.getLogger(__name__)
 # State file for cross-process access
 STATE_FILE = "/tmp/watch_tower_business_logic_state.json"
 
+# How long a status built from the state file is reused by get_status()
+STATUS_CACHE_TTL = 1.0
+
 
 @dataclass
 class BusinessLogicState:
@@ -43,6 +47,9 @@ class BusinessLogicState:
 class BusinessLogicManager:
     """Manages the business logic loop lifecycle with file-based state persistence."""
 
+    # Monotonic time and value of the last status built by get_status()
+    _status_cache: ClassVar[Optional[Tuple[float, Dict[str, Any]]]] = None
+
     def __init__(self):
         self.task: Optional[asyncio.Task] = None
         self.running = False
@@ -66,6 +73,7 @@ class BusinessLogicManager:
         try:
             with open(STATE_FILE, 'w') as state_file:
                 json.dump(state, state_file)
+            BusinessLogicManager._status_cache = None
         except (OSError, IOError, PermissionError) as e:
             LOGGER.error("Failed to save state file: %s", e, exc_info=True)
             raise BusinessLogicError(f"Failed to save state file: {str(e)}") from e
@@ -331,8 +339,7 @@ class BusinessLogicManager:
                     current_time = datetime.now(timezone)
                     new_events: List[MotionEvent] = []
 
-                    for camera in active_cameras:
-                        await poll_for_events(camera, current_time, new_events)
+                    await poll_cameras(active_cameras, current_time, new_events)
 
                     if new_events:
                         insert_events_into_db(new_events)
@@ -385,6 +392,12 @@ class BusinessLogicManager:
         Raises:
             BusinessLogicError: If state file exists but cannot be read or parsed.
         """
+        # Health and metrics pollers call this back to back; reuse a status built
+        # within the last STATUS_CACHE_TTL seconds instead of re-reading the file
+        cached = BusinessLogicManager._status_cache
+        if cached is not None and time.monotonic() - cached[0] < STATUS_CACHE_TTL:
+            return dict(cached[1])
+
         # Load state from file for cross-process access
         state = BusinessLogicManager._load_state()
 
@@ -418,13 +431,15 @@ class BusinessLogicManager:
                 "Failed to calculate total runtime: %s", e, exc_info=True)
             uptime = "Unknown"
 
-        return {
+        status = {
             "running": state.get('running', False),
             "start_time": state.get('start_time'),
             "uptime": uptime,
             "business_logic_completed": state.get('business_logic_completed'),
             "business_logic_cancelled": state.get('business_logic_cancelled')
         }
+        BusinessLogicManager._status_cache = (time.monotonic(), status)
+        return dict(status)
 
 
 # Create a singleton instance
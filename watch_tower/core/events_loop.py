@@ -8,7 +8,7 @@ processes them, and manages the business logic flow.
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import Any, Dict, List, Tuple
 
 from sqlalchemy.exc import SQLAlchemyError
 from tenacity import (
@@ -39,10 +39,40 @@ LOGGER = logging.getLogger(__name__)
 enqueued_upload_tasks: Dict[int, asyncio.Task] = {}
 enqueued_facial_recognition_tasks: Dict[str, asyncio.Task] = {}
 
-# Semaphores to limit concurrent operations using config
-UPLOAD_SEMAPHORE = asyncio.Semaphore(config.video.max_concurrent_uploads)
-FACE_RECOGNITION_SEMAPHORE = asyncio.Semaphore(
-    config.video.max_concurrent_face_recognition)
+# Semaphores to limit concurrent operations, keyed by name with the loop they belong to
+_semaphores: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+
+
+def _loop_semaphore(name: str, limit: int) -> asyncio.Semaphore:
+    """Get a named semaphore bound to the running event loop.
+
+    On Python < 3.10 a semaphore is tied to the loop it was created under, so
+    semaphores are created lazily inside the running loop rather than at
+    import time.
+
+    Args:
+        name: The semaphore name
+        limit: The number of concurrent holders allowed
+
+    Returns:
+        The semaphore for the running loop
+    """
+    loop = asyncio.get_running_loop()
+    entry = _semaphores.get(name)
+    if entry is None or entry[0] is not loop:
+        entry = (loop, asyncio.Semaphore(limit))
+        _semaphores[name] = entry
+    return entry[1]
+
+
+def get_upload_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore limiting concurrent video uploads."""
+    return _loop_semaphore('upload', config.video.max_concurrent_uploads)
+
+
+def get_face_recognition_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore limiting concurrent face searches."""
+    return _loop_semaphore('face_recognition', config.video.max_concurrent_face_recognition)
 
 
 @handle_async_errors(log_error=True, reraise=False)
@@ -143,6 +173,25 @@ async def poll_for_events(
         await handle_camera_error(camera)
 
 
+async def poll_cameras(
+        cameras: List[CameraBase],
+        current_time: datetime,
+        new_events: List[MotionEvent]
+) -> None:
+    """Poll several cameras for new motion events concurrently.
+
+    At most config.ring.max_concurrent_polls cameras are polled at once so the
+    vendor APIs are not flooded.
+    """
+    semaphore = asyncio.Semaphore(config.ring.max_concurrent_polls)
+
+    async def _poll(camera: CameraBase) -> None:
+        async with semaphore:
+            await poll_for_events(camera, current_time, new_events)
+
+    await asyncio.gather(*(_poll(camera) for camera in cameras))
+
+
 def insert_events_into_db(events: List[MotionEvent]) -> None:
     """Insert motion events into the database, skipping duplicates."""
     if not events:
@@ -193,7 +242,7 @@ def insert_events_into_db(events: List[MotionEvent]) -> None:
 
 async def process_video_retrieval(event: MotionEvent, camera: CameraBase) -> None:
     """Process a single video retrieval task"""
-    async with UPLOAD_SEMAPHORE:
+    async with get_upload_semaphore():
         await camera.retrieve_video_from_event_and_upload_to_s3(event)
 
 def _handle_video_retrieval_task_completion(
@@ -287,7 +336,7 @@ async def process_face_search_with_visitor_logs_with_semaphore(
         session_factory: Any
 ) -> None:
     """Process face search with visitor logs using semaphore for concurrency control"""
-    async with FACE_RECOGNITION_SEMAPHORE:
+    async with get_face_recognition_semaphore():
         await process_face_search_with_visitor_logs(
             rekognition_service, motion_event, db_event, session_factory
         )
@@ -5,24 +5,332 @@ This module provides a FastAPI-based management API for monitoring and controlli
 the Watch Tower application.
 """
 
-from fastapi import FastAPI, HTTPException, Response
+import asyncio
+import json
+import logging
+import operator
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from sqlalchemy import text
 from watch_tower.registry.camera_registry import REGISTRY as camera_registry
 from watch_tower.config import config
-import logging
 from watch_tower.core.business_logic_manager import BUSINESS_LOGIC_MANAGER as business_logic_manager
 from watch_tower.exceptions import BusinessLogicError, ConfigurationError
 from db.exceptions import DatabaseConnectionError
 from aws.exceptions import ConfigError, ClientError
 
+LOGGER = logging.getLogger(__name__)
+
+# orjson encodes the health payload several times faster when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# How long a successful bucket existence check is trusted by the AWS probe
+BUCKET_CHECK_TTL = 60.0
+
+# Bucket name -> monotonic time of the last successful existence check
+_bucket_checked_at: Dict[str, float] = {}
+
+# Consecutive failures after which a remote probe is skipped, and for how long
+PROBE_FAILURE_THRESHOLD = 3
+PROBE_RETRY_AFTER = 30.0
+
+# How long a rendered /metrics scrape is reused; well under any scrape interval
+METRICS_CACHE_TTL = 1.0
+
+# Reads the fields of a CameraEntry used by the camera health report
+_CAMERA_ENTRY_FIELDS = operator.attrgetter(
+    'camera', 'status', 'last_polled_str', 'status_last_updated_str')
+
+# Result shared by every passing probe; it is only ever read and encoded
+_HEALTHY: Dict[str, Any] = {'healthy': True, 'error': None}
+
+# Liveness query for the database probe, built once rather than per request
+_PING_STMT = text("SELECT 1")
+
+
+class _CircuitBreaker:
+    """Stops calling a remote health probe while it keeps failing.
+
+    After PROBE_FAILURE_THRESHOLD consecutive failures the last failure is
+    reported without calling the probe until PROBE_RETRY_AFTER seconds have
+    passed, so an outage does not cost a full AWS or database timeout on every
+    /health refresh.
+    """
+
+    def __init__(self, failure_threshold: int, retry_after: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.retry_after = retry_after
+        self.failures = 0
+        self.open_until = 0.0
+        self.last_failure: Optional[Dict[str, Any]] = None
+
+    def call(self, probe: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Run the probe unless the breaker is open.
+
+        Args:
+            probe: Health probe returning a dict with a 'healthy' flag
+
+        Returns:
+            The probe result, or the last failure while the breaker is open
+        """
+        if self.last_failure is not None and time.monotonic() < self.open_until:
+            return self.last_failure
+
+        result = probe()
+        if result['healthy']:
+            self.failures = 0
+            self.last_failure = None
+        else:
+            self.failures += 1
+            self.last_failure = result
+            if self.failures >= self.failure_threshold:
+                self.open_until = time.monotonic() + self.retry_after
+                LOGGER.warning("Health probe failed %d times in a row, skipping it for %.0fs",
+                               self.failures, self.retry_after)
+        return result
+
+
+_database_breaker = _CircuitBreaker(PROBE_FAILURE_THRESHOLD, PROBE_RETRY_AFTER)
+_aws_breaker = _CircuitBreaker(PROBE_FAILURE_THRESHOLD, PROBE_RETRY_AFTER)
+
+
+class _ResponseCache:
+    """Per-process TTL cache for an encoded response body.
+
+    Monitoring systems poll /health and /metrics every few seconds; serving the
+    last body while it is fresh avoids rebuilding and re-encoding it on every
+    probe. The lock makes concurrent refreshes single-flight.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._body: Optional[bytes] = None
+        self._timestamp = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        """Get the refresh lock, creating it on the running event loop."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def get(self) -> Optional[bytes]:
+        """Get the cached body, or None if it is missing or expired."""
+        if self._body is not None and time.monotonic() - self._timestamp < self.ttl:
+            return self._body
+        return None
+
+    def set(self, body: bytes) -> None:
+        """Store a freshly encoded body."""
+        self._body = body
+        self._timestamp = time.monotonic()
+
+    def invalidate(self) -> None:
+        """Drop the cached body so the next request rebuilds it."""
+        self._body = None
+
+
+class _MetricsApp:
+    """ASGI app serving Prometheus metrics.
+
+    Keeps one cache per exposition format so text and OpenMetrics scrapers
+    each render the registry at most once per TTL.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._caches: Dict[str, _ResponseCache] = {}
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        from prometheus_client import REGISTRY as metrics_registry
+        from prometheus_client.exposition import choose_encoder
+        from utils import metrics as metrics_module 
+
+        request = Request(scope)
+        encoder, content_type = choose_encoder(request.headers.get("accept"))
+
+        # HEAD probes discard the body, so skip rendering the registry
+        if request.method == "HEAD":
+            response = Response(status_code=200, media_type=content_type)
+        else:
+            # Rendering is synchronous, so the get/set below cannot interleave
+            metrics_cache = self._caches.setdefault(content_type, _ResponseCache(self.ttl))
+            metrics_data = metrics_cache.get()
+            if metrics_data is None:
+                metrics_data = encoder(metrics_registry)
+                metrics_cache.set(metrics_data)
+            response = Response(content=metrics_data, media_type=content_type)
+        await response(scope, receive, send)
+
+
+def _check_database_health() -> Dict[str, Any]:
+    """Check database connectivity by running a trivial query."""
+    try:
+        from db.connection import get_database_connection  # pylint: disable=import-outside-toplevel
+        _, session_factory = get_database_connection()
+        with session_factory() as session:
+            session.execute(_PING_STMT).scalar()
+        return _HEALTHY
+    except DatabaseConnectionError as e:
+        db_error = f"Database connection error: {str(e)}"
+    except Exception as e:
+        db_error = f"Database health check failed: {str(e)}"
+    LOGGER.error(db_error)
+    return {'healthy': False, 'error': db_error}
+
+
+def _check_aws_health() -> Dict[str, Any]:
+    """Check AWS connectivity by looking up the event recordings bucket.
+
+    Successful HeadBucket lookups are trusted for BUCKET_CHECK_TTL seconds;
+    failures are not remembered so a recovered bucket is noticed immediately.
+    """
+    try:
+        from aws.s3.s3_service import S3_SERVICE  # pylint: disable=import-outside-toplevel
+        bucket_name = config.event_recordings_bucket
+        checked_at = _bucket_checked_at.get(bucket_name)
+        if checked_at is None or time.monotonic() - checked_at >= BUCKET_CHECK_TTL:
+            S3_SERVICE.check_bucket_exists(bucket_name)
+            _bucket_checked_at[bucket_name] = time.monotonic()
+        return _HEALTHY
+    except ConfigError as e:
+        aws_error = f"AWS configuration error: {str(e)}"
+    except ClientError as e:
+        aws_error = f"AWS client error: {str(e)}"
+    except Exception as e:
+        aws_error = f"AWS health check failed: {str(e)}"
+    LOGGER.error(aws_error)
+    return {'healthy': False, 'error': aws_error}
+
+
+def _get_business_logic_status() -> Dict[str, Any]:
+    """Get the business logic loop status from the cross-process state file."""
+    try:
+        status = business_logic_manager.get_status()
+        return {
+            'running': status['running'],
+            'uptime': status['uptime'],
+            'start_time': status['start_time']
+        }
+    except BusinessLogicError as e:
+        bl_error = f"Business logic error: {str(e)}"
+    except Exception as e:
+        bl_error = f"Business logic loop status check failed: {str(e)}"
+    LOGGER.error(bl_error)
+    return {
+        'running': False,
+        'uptime': 'Unknown',
+        'start_time': 'Unknown',
+        'error': bl_error
+    }
+
+
+def _encode_health_payload(payload: Dict[str, Any]) -> bytes:
+    """Encode the health payload the same way JSONResponse renders content."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, allow_nan=False,
+                      indent=None, separators=(',', ':')).encode('utf-8')
+
+
+def _camera_health_entry(camera: Any, status: Any, last_polled: str,
+                         status_last_updated: str) -> Dict[str, Any]:
+    """Build the health entry for a single camera registry entry."""
+    status_name = status.name
+    name = getattr(camera, 'name', None)
+    return {
+        'name': name if name is not None else str(camera),
+        'vendor': str(getattr(camera, 'plugin_type', 'UNKNOWN')),
+        'status': status_name,
+        'healthy': status_name == 'ACTIVE',
+        'last_polled': last_polled,
+        'status_last_updated': status_last_updated
+    }
+
+
+def _get_camera_health() -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Get the health of every camera in the registry.
+
+    The registry values are copied before they are walked so that cameras
+    added or removed by the business logic loop cannot change the dict
+    mid-iteration.
+
+    Returns:
+        Tuple of the per-camera health entries and an error message, if any
+    """
+    try:
+        entries = list(camera_registry.cameras.values())
+        return [_camera_health_entry(*fields) for fields in map(_CAMERA_ENTRY_FIELDS, entries)], None
+    except Exception as e:
+        camera_error = f"Camera registry health check failed: {str(e)}"
+        LOGGER.error(camera_error)
+        return [], camera_error
+
 
 def create_management_app():
     """Create and return the FastAPI management application."""
+    health_cache = _ResponseCache(config.management.health_cache_ttl)
+
+    def health_response(body: bytes, cache_status: str) -> Response:
+        return Response(content=body, media_type='application/json', headers={
+            'Cache-Control': f"max-age={health_cache.ttl}, public",
+            'X-Cache': cache_status
+        })
+
+    async def build_health_payload() -> Dict[str, Any]:
+        # The blocking probes run concurrently on the default thread pool so the
+        # endpoint latency is bounded by the slowest probe rather than their sum
+        loop = asyncio.get_running_loop()
+        database, aws, business_logic_status = await asyncio.gather(
+            loop.run_in_executor(None, _database_breaker.call, _check_database_health),
+            loop.run_in_executor(None, _aws_breaker.call, _check_aws_health),
+            loop.run_in_executor(None, _get_business_logic_status))
+
+        # Real-time camera registry health (in-memory, read on the event loop)
+        cameras, camera_error = _get_camera_health()
+
+        # Build response with detailed error information
+        payload = {
+            'database': database,
+            'aws': aws,
+            'business_logic': business_logic_status,
+            'event_loop': business_logic_status,
+            'cameras': cameras
+        }
+
+        if camera_error:
+            payload['camera_error'] = camera_error
+
+        return payload
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+        # Build the first /health body while the server starts, so the first
+        # probe does not pay for lazy imports, AWS client and pool set-up
+        warm_up = None
+        if health_cache.ttl > 0:
+            warm_up = asyncio.ensure_future(refresh_health_cache())
+        yield
+        if warm_up is not None:
+            warm_up.cancel()
+
+    async def refresh_health_cache() -> None:
+        async with health_cache.lock:
+            health_cache.set(_encode_health_payload(await build_health_payload()))
+
     app = FastAPI(
         title="Watch Tower Management API",
-        description="API for managing and monitoring the Watch Tower application")
-    logger = logging.getLogger(__name__)
+        description="API for managing and monitoring the Watch Tower application",
+        lifespan=lifespan)
 
     app.add_middleware(
         CORSMiddleware,
@@ -34,180 +342,65 @@ def create_management_app():
 
     @app.get("/health")
     async def health():
-        # Database health
-        db_healthy = False
-        db_error = None
-        try:
-            from db.connection import get_database_connection
-            from sqlalchemy import text
-            engine, session_factory = get_database_connection()
-            with session_factory() as session:
-                session.execute(text("SELECT 1"))
-            db_healthy = True
-        except DatabaseConnectionError as e:
-            db_error = f"Database connection error: {str(e)}"
-            logger.error(db_error)
-        except Exception as e:
-            db_error = f"Database health check failed: {str(e)}"
-            logger.error(db_error)
+        body = health_cache.get()
+        if body is not None:
+            return health_response(body, 'HIT')
 
-        # AWS health
-        aws_healthy = False
-        aws_error = None
-        try:
-            from aws.s3.s3_service import S3_SERVICE
-            S3_SERVICE.check_bucket_exists(config.event_recordings_bucket)
-            aws_healthy = True
-        except ConfigError as e:
-            aws_error = f"AWS configuration error: {str(e)}"
-            logger.error(aws_error)
-        except ClientError as e:
-            aws_error = f"AWS client error: {str(e)}"
-            logger.error(aws_error)
-        except Exception as e:
-            aws_error = f"AWS health check failed: {str(e)}"
-            logger.error(aws_error)
+        # Concurrent pollers wait for a single refresh instead of each probing
+        async with health_cache.lock:
+            body = health_cache.get()
+            if body is not None:
+                return health_response(body, 'HIT')
+            # Encoded once per refresh; cache hits serve the bytes as they are
+            body = _encode_health_payload(await build_health_payload())
+            health_cache.set(body)
+        return health_response(body, 'MISS')
 
-        # Business logic loop status
-        business_logic_status = {}
-        bl_error = None
+    async def control_business_logic(
+            operation: Callable[[], Awaitable[None]], action: str, done: str) -> JSONResponse:
+        # Ordered except clauses map each error type to its status code directly
         try:
-            status = business_logic_manager.get_status()
-            business_logic_status = {
-                'running': status['running'],
-                'uptime': status['uptime'],
-                'start_time': status['start_time']
-            }
-        except BusinessLogicError as e:
-            bl_error = f"Business logic error: {str(e)}"
-            logger.error(bl_error)
-            business_logic_status = {
-                'running': False,
-                'uptime': 'Unknown',
-                'start_time': 'Unknown',
-                'error': bl_error
-            }
-        except Exception as e:
-            bl_error = f"Business logic loop status check failed: {str(e)}"
-            logger.error(bl_error)
-            business_logic_status = {
-                'running': False,
-                'uptime': 'Unknown',
-                'start_time': 'Unknown',
-                'error': bl_error
-            }
-
-        # Real-time camera registry health
-        cameras = []
-        camera_error = None
-        try:
-            for entry in camera_registry.cameras.values():
-                camera = entry.camera
-                name = getattr(camera, 'name', str(camera))
-                vendor = getattr(camera, 'plugin_type', 'UNKNOWN')
-                status = entry.status.name
-                healthy = status == 'ACTIVE'
-                cameras.append({
-                    'name': name,
-                    'vendor': str(vendor),
-                    'status': status,
-                    'healthy': healthy,
-                    'last_polled': str(entry.last_polled),
-                    'status_last_updated': str(entry.status_last_updated)
-                })
-        except Exception as e:
-            camera_error = f"Camera registry health check failed: {str(e)}"
-            logger.error(camera_error)
-
-        # Build response with detailed error information
-        response = {
-            'database': {
-                'healthy': db_healthy,
-                'error': db_error
-            },
-            'aws': {
-                'healthy': aws_healthy,
-                'error': aws_error
-            },
-            'business_logic': business_logic_status,
-            'event_loop': business_logic_status,
-            'cameras': cameras
-        }
-
-        if camera_error:
-            response['camera_error'] = camera_error
-
-        return JSONResponse(response)
-
-    @app.post("/stop")
-    async def stop_business_logic():
-        """Stop the business logic loop via HTTP API."""
-        try:
-            logger.info("Received HTTP request to stop business logic loop")
-            await business_logic_manager.stop()
+            LOGGER.info("Received HTTP request to %s business logic loop", action)
+            await operation()
+            health_cache.invalidate()
             return JSONResponse({
                 "status": "success",
-                "message": "Business logic loop stopped successfully"
+                "message": f"Business logic loop {done} successfully"
             })
         except BusinessLogicError as e:
-            logger.error(f"Business logic error while stopping: {e}")
+            LOGGER.error("Business logic error while trying to %s: %s", action, e)
             raise HTTPException(
                 status_code=400,
                 detail=f"Business logic error: {str(e)}"
-            )
+            ) from e
         except ConfigurationError as e:
-            logger.error(f"Configuration error while stopping: {e}")
+            LOGGER.error("Configuration error while trying to %s: %s", action, e)
             raise HTTPException(
                 status_code=500,
                 detail=f"Configuration error: {str(e)}"
-            )
+            ) from e
         except Exception as e:
-            logger.error(f"Unexpected error while stopping business logic loop: {e}")
+            LOGGER.exception("Unexpected error while trying to %s business logic loop: %s",
+                             action, e)
             raise HTTPException(
                 status_code=500,
-                detail=f"Internal server error: {str(e)}"
-            )
+                detail=f"Internal server error: {type(e).__name__}"
+            ) from e
+
+    @app.post("/stop")
+    async def stop_business_logic():
+        """Stop the business logic loop via HTTP API."""
+        return await control_business_logic(business_logic_manager.stop, "stop", "stopped")
 
     @app.post("/start")
     async def start_business_logic():
         """Start the business logic loop via HTTP API."""
-        try:
-            logger.info("Received HTTP request to start business logic loop")
-            await business_logic_manager.start()
-            return JSONResponse({
-                "status": "success",
-                "message": "Business logic loop started successfully"
-            })
-        except BusinessLogicError as e:
-            logger.error(f"Business logic error while starting: {e}")
-            raise HTTPException(
-                status_code=400,
-                detail=f"Business logic error: {str(e)}"
-            )
-        except ConfigurationError as e:
-            logger.error(f"Configuration error while starting: {e}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Configuration error: {str(e)}"
-            )
-        except Exception as e:
-            logger.error(f"Unexpected error while starting business logic loop: {e}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Internal server error: {str(e)}"
-            )
-    
-    @app.api_route("/metrics", methods=["GET", "HEAD"])
-    async def metrics_scrapper():
-        """Endpoint for Prometheus to scrape metrics."""
-        from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
-        from utils import metrics as metrics_module 
+        return await control_business_logic(business_logic_manager.start, "start", "started")
 
-        metrics_data = generate_latest()
-        return Response(
-            content=metrics_data,
-            media_type=CONTENT_TYPE_LATEST
-        )
+    # Registered as a plain Starlette route: scrapes skip FastAPI's request
+    # parsing and dependency resolution, and the exact path avoids the
+    # trailing-slash redirect a mount would add
+    app.add_route("/metrics", _MetricsApp(METRICS_CACHE_TTL), methods=["GET", "HEAD"])
 
     return app
 
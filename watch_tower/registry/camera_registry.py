@@ -3,7 +3,7 @@
 import datetime
 from enum import Enum
 from typing import List, Dict, Tuple, Optional, ClassVar
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from cameras.camera_base import CameraBase
 from connection_managers.plugin_type import PluginType
 from utils.logging_config import get_logger
@@ -20,11 +20,49 @@ class CameraStatus(Enum):
 
 @dataclass
 class CameraEntry:
-    """Data class representing a camera entry in the registry."""
+    """Data class representing a camera entry in the registry.
+
+    The string forms of the timestamps used by health reporting are formatted
+    on first read and kept until the timestamp is next assigned, so neither
+    polling updates nor repeated health requests format a datetime needlessly.
+    """
     camera: CameraBase
     status: CameraStatus
     last_polled: datetime.datetime
     status_last_updated: datetime.datetime
+    _last_polled_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _status_last_updated_str: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        if name in _TIMESTAMP_FIELDS:
+            super().__setattr__(f"_{name}_str", None)
+
+    @property
+    def last_polled_str(self) -> str:
+        """Get the last polled time formatted for display."""
+        if self._last_polled_str is None:
+            self._last_polled_str = _format_timestamp(self.last_polled)
+        return self._last_polled_str
+
+    @property
+    def status_last_updated_str(self) -> str:
+        """Get the status update time formatted for display."""
+        if self._status_last_updated_str is None:
+            self._status_last_updated_str = _format_timestamp(self.status_last_updated)
+        return self._status_last_updated_str
+
+
+# Timestamp fields of CameraEntry that keep a cached string form
+_TIMESTAMP_FIELDS = frozenset(('last_polled', 'status_last_updated'))
+
+
+def _format_timestamp(value: object) -> str:
+    """Format a registry timestamp to second precision."""
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(timespec='seconds')
+    return str(value)
 
 
 class CameraRegistry: